@@ -1,5 +1,8 @@
 # your_package/core/base.py
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from typing import Any, TypedDict
 
 # In newer langgraph, compiled graphs are returned by StateGraph.compile()
@@ -16,7 +19,14 @@ class BaseSubgraph(ABC):
     @abstractmethod
     def build_graph(self) -> Any: ...
 
-    def run(self, state: dict[str, Any], config: dict | None = None) -> dict[str, Any]:
+    @cached_property
+    def graph(self) -> Any:
+        """Compiled graph, built on first use and reused by later runs."""
+        return self.build_graph()
+
+    def _prepare_input(
+        self, state: dict[str, Any], config: dict | None
+    ) -> tuple[dict[str, Any], dict]:
         if hasattr(self, 'InputState'):
             input_state_keys = self.InputState.__annotations__.keys()
             input_state = {k: state[k] for k in input_state_keys if k in state}
@@ -25,9 +35,11 @@ class BaseSubgraph(ABC):
             
         if config is None:
             config = {"recursion_limit": 200}
-            
-        result = self.build_graph().invoke(input_state, config=config)
-        
+        return input_state, config
+
+    def _merge_output(
+        self, state: dict[str, Any], result: dict[str, Any]
+    ) -> dict[str, Any]:
         if hasattr(self, 'OutputState'):
             output_state_keys = self.OutputState.__annotations__.keys()
             output_state = {k: result[k] for k in output_state_keys if k in result}
@@ -40,3 +52,35 @@ class BaseSubgraph(ABC):
             **cleaned_state,
             **output_state,
         }
+
+    def run(self, state: dict[str, Any], config: dict | None = None) -> dict[str, Any]:
+        input_state, config = self._prepare_input(state, config)
+        result = self.graph.invoke(input_state, config=config)
+        return self._merge_output(state, result)
+
+    async def arun(
+        self, state: dict[str, Any], config: dict | None = None
+    ) -> dict[str, Any]:
+        """Async counterpart of `run`, required for graphs with `async def` nodes."""
+        input_state, config = self._prepare_input(state, config)
+        result = await self.graph.ainvoke(input_state, config=config)
+        return self._merge_output(state, result)
+
+    def _run_async(
+        self, state: dict[str, Any], config: dict | None = None
+    ) -> dict[str, Any]:
+        """Run `arun` to completion from synchronous code.
+
+        Subgraphs with `async def` nodes implement `run` with this helper. When
+        the caller already runs an event loop (an async parent graph, Jupyter),
+        `asyncio.run` cannot nest, so the graph gets its own loop in a worker
+        thread while the caller blocks.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.arun(state, config))
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(
+                asyncio.run, self.arun(state, config)
+            ).result()
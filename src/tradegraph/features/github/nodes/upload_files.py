@@ -6,35 +6,14 @@ from tradegraph.services.api_client.github_client import GithubClient
 logger = logging.getLogger(__name__)
 
 
-def _upload_single_file(
-    github_owner: str,
-    repository_name: str,
-    branch_name: str,
-    upload_dir: str,
-    local_path: str,
-    commit_message: str,
-    client: GithubClient,
-) -> bool:
-    try:
-        with open(local_path, "rb") as f:
-            content = f.read()
+def _read_upload_entry(upload_dir: str, local_path: str) -> tuple[str, bytes]:
+    with open(local_path, "rb") as f:
+        content = f.read()
 
-        target_path = os.path.join(upload_dir, os.path.basename(local_path)).replace(
-            "\\", "/"
-        )
-
-        ok = client.commit_file_bytes(
-            github_owner=github_owner,
-            repository_name=repository_name,
-            branch_name=branch_name,
-            file_path=target_path,
-            file_content=content,
-            commit_message=commit_message,
-        )
-        return ok
-    except Exception as e:
-        logger.warning(f"Asset upload failed: {local_path} ({e})")
-        return False
+    target_path = os.path.join(upload_dir, os.path.basename(local_path)).replace(
+        "\\", "/"
+    )
+    return target_path, content
 
 
 def upload_files(
@@ -52,17 +31,16 @@ def upload_files(
     client = client or GithubClient()
     upload_dir = upload_dir.replace("\\", "/")
 
-    results = [
-        _upload_single_file(
+    try:
+        files = [_read_upload_entry(upload_dir, path) for path in local_file_paths]
+        # One Git tree commit for all files instead of one commit per file.
+        return client.commit_files_bytes(
             github_owner=github_owner,
             repository_name=repository_name,
             branch_name=branch_name,
-            upload_dir=upload_dir,
-            local_path=path,
+            files=files,
             commit_message=commit_message,
-            client=client,
         )
-        for path in local_file_paths
-    ]
-
-    return all(results)
+    except Exception as e:
+        logger.warning(f"Asset upload failed: {local_file_paths} ({e})")
+        return False
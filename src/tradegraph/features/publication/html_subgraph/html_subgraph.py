@@ -186,7 +186,7 @@ class HtmlSubgraph(BaseSubgraph):
         os.makedirs(self.tmp_dir, exist_ok=True)
 
         try:
-            result = self.build_graph().invoke(input_state, config=config or {})
+            result = self.graph.invoke(input_state, config=config or {})
             output_state = {k: result[k] for k in output_state_keys if k in result}
 
             cleaned_state = {k: v for k, v in state.items() if k != "subgraph_name"}
@@ -1,9 +1,10 @@
 import argparse
+import asyncio
+import json
 import logging
 import os
 import shutil
 import sys
-import time
 from typing import Any, cast
 
 from langgraph.graph import END, START, StateGraph
@@ -20,16 +21,26 @@ from tradegraph.features.publication.latex_subgraph.input_data import (
 )
 from tradegraph.features.publication.latex_subgraph.nodes.assemble_latex import LatexNode
 from tradegraph.features.publication.latex_subgraph.nodes.convert_to_latex import (
+    build_convert_to_latex_prompt,
     convert_to_latex,
+    parse_convert_to_latex_output,
+)
+from tradegraph.features.publication.latex_subgraph.nodes.generate_bib import (
+    build_bib_request,
+    generate_bib,
+    parse_bib_output,
 )
-from tradegraph.features.publication.latex_subgraph.nodes.generate_bib import generate_bib
 from tradegraph.features.publication.latex_subgraph.prompt.convert_to_latex_prompt import (
     convert_to_latex_prompt,
 )
 from tradegraph.features.publication.latex_subgraph.prompt.generate_bib_prompt import (
     generate_bib_prompt,
 )
-from tradegraph.services.api_client.llm_client.llm_facade_client import LLM_MODEL
+from tradegraph.services.api_client.llm_client.llm_facade_client import (
+    LLM_MODEL,
+    LLMFacadeClient,
+)
+from tradegraph.types.paper import PaperContent
 from tradegraph.utils.check_api_key import check_api_key
 from tradegraph.utils.execution_timers import ExecutionTimeState, time_node
 from tradegraph.utils.logging_utils import setup_logging
@@ -52,6 +63,7 @@ class LatexSubgraphHiddenState(TypedDict):
     repository_name: str
     paper_tex_content: dict[str, str]
     references_bib: dict[str, str]
+    batch_prepared: bool
     paper_upload: bool
     dispatch_paper_workflow: bool
 
@@ -106,9 +118,16 @@ class LatexSubgraph(BaseSubgraph):
             )
             raise
 
+    def _route_after_init(self, state: LatexSubgraphState) -> str:
+        # Papers prepared via prepare_batch() already carry the LLM outputs.
+        if state.get("batch_prepared"):
+            return "assemble_latex"
+        return "generate_bib"
+
     @latex_timed
-    def _generate_bib(self, state: LatexSubgraphState) -> dict:
-        references_bib = generate_bib(
+    async def _generate_bib(self, state: LatexSubgraphState) -> dict:
+        references_bib = await asyncio.to_thread(
+            generate_bib,
             llm_name=cast(LLM_MODEL, self.llm_name),
             prompt_template=generate_bib_prompt,
             references=state["references"],
@@ -116,8 +135,9 @@ class LatexSubgraph(BaseSubgraph):
         return {"references_bib": references_bib}
 
     @latex_timed
-    def _convert_to_latex(self, state: LatexSubgraphState) -> dict:
-        paper_tex_content = convert_to_latex(
+    async def _convert_to_latex(self, state: LatexSubgraphState) -> dict:
+        paper_tex_content = await asyncio.to_thread(
+            convert_to_latex,
             llm_name=cast(LLM_MODEL, self.llm_name),
             prompt_template=convert_to_latex_prompt,
             paper_content_with_placeholders=state["paper_content_with_placeholders"],
@@ -126,12 +146,14 @@ class LatexSubgraph(BaseSubgraph):
         return {"paper_tex_content": paper_tex_content}
 
     @latex_timed
-    def _assemble_latex(self, state: LatexSubgraphState) -> dict:
-        tex_text = LatexNode(
+    async def _assemble_latex(self, state: LatexSubgraphState) -> dict:
+        latex_node = LatexNode(
             llm_name=cast(LLM_MODEL, self.llm_name),
             save_dir=self.tmp_dir,
             pdf_file_name=self.paper_name,
-        ).assemble_latex(
+        )
+        tex_text = await asyncio.to_thread(
+            latex_node.assemble_latex,
             paper_tex_content=state["paper_tex_content"],
             references_bib=state["references_bib"],
             figures_name=state["image_file_name_list"],
@@ -139,12 +161,12 @@ class LatexSubgraph(BaseSubgraph):
         return {"tex_text": tex_text}
 
     @latex_timed
-    def _upload_latex(self, state: LatexSubgraphState) -> dict[str, bool]:
-        local_file_paths = [
-            os.path.join(self.tmp_dir, f) for f in os.listdir(self.tmp_dir)
-        ]
+    async def _upload_latex(self, state: LatexSubgraphState) -> dict[str, bool]:
+        with os.scandir(self.tmp_dir) as entries:
+            local_file_paths = [entry.path for entry in entries if entry.is_file()]
         upload_latex_dir = os.path.join(self.upload_dir, "latex")
-        ok_pdf = upload_files(
+        ok_pdf = await asyncio.to_thread(
+            upload_files,
             github_owner=state["github_owner"],
             repository_name=state["repository_name"],
             branch_name=state["branch_name"],
@@ -155,9 +177,10 @@ class LatexSubgraph(BaseSubgraph):
         return {"paper_upload": ok_pdf}
 
     @latex_timed
-    def _dispatch_workflow(self, state: LatexSubgraphState) -> dict[str, bool]:
-        time.sleep(3)
-        ok = dispatch_workflow(
+    async def _dispatch_workflow(self, state: LatexSubgraphState) -> dict[str, bool]:
+        await asyncio.sleep(3)
+        ok = await asyncio.to_thread(
+            dispatch_workflow,
             github_owner=state["github_owner"],
             repository_name=state["repository_name"],
             branch_name=state["branch_name"],
@@ -186,7 +209,14 @@ class LatexSubgraph(BaseSubgraph):
         graph_builder.add_node("dispatch_workflow", self._dispatch_workflow)
 
         graph_builder.add_edge(START, "init_state")
-        graph_builder.add_edge("init_state", "generate_bib")
+        graph_builder.add_conditional_edges(
+            "init_state",
+            self._route_after_init,
+            {
+                "generate_bib": "generate_bib",
+                "assemble_latex": "assemble_latex",
+            },
+        )
         graph_builder.add_edge("generate_bib", "convert_to_latex")
         graph_builder.add_edge("convert_to_latex", "assemble_latex")
         graph_builder.add_edge("assemble_latex", "upload_latex")
@@ -195,30 +225,79 @@ class LatexSubgraph(BaseSubgraph):
 
         return graph_builder.compile()
 
-    def run(self, state: dict[str, Any], config: dict | None = None) -> dict[str, Any]:
-        input_state_keys = self.InputState.__annotations__.keys()
-        output_state_keys = self.OutputState.__annotations__.keys()
-        input_state = {k: state[k] for k in input_state_keys if k in state}
-
+    def _prepare_input(
+        self, state: dict[str, Any], config: dict | None
+    ) -> tuple[dict[str, Any], dict]:
+        input_state, config = super()._prepare_input(state, config)
+        if state.get("batch_prepared"):
+            for k in ("batch_prepared", "references_bib", "paper_tex_content"):
+                input_state[k] = state[k]
+        return input_state, config
+
+    async def arun(
+        self, state: dict[str, Any], config: dict | None = None
+    ) -> dict[str, Any]:
         if os.path.exists(self.tmp_dir):
             shutil.rmtree(self.tmp_dir)
         os.makedirs(self.tmp_dir, exist_ok=True)
-
         try:
-            result = self.build_graph().invoke(input_state, config=config or {})
-            output_state = {k: result[k] for k in output_state_keys if k in result}
-
-            cleaned_state = {k: v for k, v in state.items() if k != "subgraph_name"}
-
-            return {
-                "subgraph_name": self.__class__.__name__,
-                **cleaned_state,
-                **output_state,
-            }
+            return await super().arun(state, config)
         finally:
             if os.path.exists(self.tmp_dir):
                 shutil.rmtree(self.tmp_dir)
 
+    def run(self, state: dict[str, Any], config: dict | None = None) -> dict[str, Any]:
+        return self._run_async(state, config)
+
+    def prepare_batch(
+        self, states: list[dict[str, Any]], poll_interval: float = 30.0
+    ) -> list[dict[str, Any]]:
+        """Generate BibTeX and LaTeX sections for many papers via the Batch API.
+
+        The convert prompt only needs the citation placeholders, so both
+        requests of every paper go into a single batch. The returned states
+        carry `references_bib` and `paper_tex_content` and are flagged with
+        `batch_prepared`, so `run` skips straight to the (iterative, online)
+        assembly step.
+        """
+        requests: dict[str, tuple[str, type]] = {}
+        for i, state in enumerate(states):
+            requests[f"bib-{i}"] = build_bib_request(
+                generate_bib_prompt, state["references"]
+            )
+            requests[f"convert-{i}"] = (
+                build_convert_to_latex_prompt(
+                    prompt_template=convert_to_latex_prompt,
+                    paper_content_with_placeholders=state[
+                        "paper_content_with_placeholders"
+                    ],
+                    citation_placeholders=list(state["references"].keys()),
+                ),
+                PaperContent,
+            )
+
+        client = LLMFacadeClient(cast(LLM_MODEL, self.llm_name))
+        outputs, cost = client.batch_structured_outputs(
+            requests=requests, poll_interval=poll_interval
+        )
+        logger.info(f"Batch generation finished. Cost: ${cost:.4f}")
+
+        prepared = []
+        for i, state in enumerate(states):
+            references_bib = parse_bib_output(outputs[f"bib-{i}"], state["references"])
+            paper_tex_content = parse_convert_to_latex_output(
+                outputs[f"convert-{i}"], references_bib
+            )
+            prepared.append(
+                {
+                    **state,
+                    "references_bib": references_bib,
+                    "paper_tex_content": paper_tex_content,
+                    "batch_prepared": True,
+                }
+            )
+        return prepared
+
 
 def main():
     parser = argparse.ArgumentParser(description="LatexSubgraph")
@@ -226,18 +305,41 @@ def main():
     parser.add_argument(
         "branch_name", help="Your branch name in your GitHub repository"
     )
+    parser.add_argument(
+        "--input",
+        action="append",
+        default=[],
+        help="JSON file with a LatexSubgraph input state (repeatable)",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Generate BibTeX and LaTeX for all inputs via the OpenAI Batch API",
+    )
     args = parser.parse_args()
 
     llm_name = "o3-mini-2025-01-31"
-    input = {
-        **latex_subgraph_input_data,
-        "github_repository": args.github_repository,
-        "branch_name": args.branch_name,
-    }
+    inputs = []
+    for path in args.input or [None]:
+        data = latex_subgraph_input_data
+        if path is not None:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        inputs.append(
+            {
+                **data,
+                "github_repository": args.github_repository,
+                "branch_name": args.branch_name,
+            }
+        )
 
-    _ = LatexSubgraph(
+    subgraph = LatexSubgraph(
         llm_name=llm_name,
-    ).run(input)
+    )
+    if args.batch:
+        inputs = subgraph.prepare_batch(inputs)
+    for input in inputs:
+        _ = subgraph.run(input)
 
 
 if __name__ == "__main__":
@@ -15,6 +15,13 @@ logger = getLogger(__name__)
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Prompts are laid out as [SYSTEM_PROMPT][LaTeX text][dynamic instructions] so
+# that the long, slowly changing prefix is byte-identical across the check
+# iterations and can be served from the provider's prompt cache.
+SYSTEM_PROMPT = """
+You are a helpful LaTeX rewriting assistant.
+The value of \"latex_full_text\" must contain the complete LaTeX text."""
+
 
 class LLMOutput(BaseModel):
     latex_full_text: str
@@ -38,6 +45,11 @@ class LatexNode:
         self.timeout = timeout
         self.client = client or LLMFacadeClient(self.llm_name)
 
+        # Inputs of the last successful LLM fix; an unchanged set means the
+        # previous rewrite already covered it, so the call can be skipped.
+        self._last_missing_cites: frozenset[str] | None = None
+        self._last_fig_set: frozenset[str] | None = None
+
         self.latex_template_dir = os.path.abspath(
             os.path.join(SCRIPT_DIR, "..", "latex")
         )
@@ -49,11 +61,20 @@ class LatexNode:
             self.save_dir, os.path.splitext(pdf_file_name)[0] + ".tex"
         )
 
+    @staticmethod
+    def _canonicalize(tex_text: str) -> str:
+        return tex_text.replace("\r\n", "\n").rstrip()
+
+    def _build_prompt(self, tex_text: str, instructions: str) -> str:
+        return f"""\n
+# LaTeX text
+--------
+{self._canonicalize(tex_text)}
+--------
+{instructions}"""
+
     def _call_llm(self, prompt: str) -> str | None:
-        system_prompt = """
-You are a helpful LaTeX rewriting assistant.
-The value of \"latex_full_text\" must contain the complete LaTeX text."""
-        messages = system_prompt + prompt
+        messages = SYSTEM_PROMPT + prompt
         try:
             output, cost = self.client.structured_outputs(
                 message=messages,
@@ -74,9 +95,12 @@ The value of \"latex_full_text\" must contain the complete LaTeX text."""
         with open(self.latex_instance_file, "r") as f:
             tex_text = f.read()
 
-        for section, value in content.items():
-            placeholder = f"{section.upper()} HERE"
-            tex_text = tex_text.replace(placeholder, value)
+        content_map = {
+            f"{section.upper()} HERE": value for section, value in content.items()
+        }
+        if content_map:
+            pattern = re.compile("|".join(re.escape(p) for p in content_map))
+            tex_text = pattern.sub(lambda m: content_map[m.group(0)], tex_text)
         with open(self.latex_instance_file, "w") as f:
             f.write(tex_text)
         return tex_text
@@ -107,13 +131,14 @@ The value of \"latex_full_text\" must contain the complete LaTeX text."""
             logger.info("Reference check passed.")
             return tex_text
 
+        if frozenset(missing_cites) == self._last_missing_cites:
+            logger.info("Missing references unchanged since last fix; skipping.")
+            return tex_text
+
         logger.info(f"Missing references found: {missing_cites}")
-        prompt = f""""\n
-# LaTeX text
---------
-{tex_text}
---------
-# References.bib content
+        prompt = self._build_prompt(
+            tex_text,
+            f"""# References.bib content
 --------
 {bib_text}
 --------
@@ -122,12 +147,14 @@ Only modify the BibTeX content or add missing \\cite{{...}} commands if needed.
 
 Do not remove, replace, or summarize any section of the LaTeX text such as Introduction, Method, or Results.
 Do not comment out or rewrite any parts. Just fix the missing references.
-Return the complete LaTeX document, including any bibtex changes."""
+Return the complete LaTeX document, including any bibtex changes.""",
+        )
         llm_response = self._call_llm(prompt)
         if llm_response is None:
             raise RuntimeError(
                 f"LLM failed to respond for missing references: {missing_cites}"
             )
+        self._last_missing_cites = frozenset(missing_cites)
         return llm_response
 
     def _check_figures(
@@ -145,23 +172,28 @@ Return the complete LaTeX document, including any bibtex changes."""
             logger.info("No figures referenced in the LaTeX document.")
             return tex_text
 
-        prompt = f"""\n
-# LaTeX Text
---------
-{tex_text}
---------
+        if frozenset(fig_to_use) == self._last_fig_set:
+            logger.info("Referenced figures unchanged since last check; skipping.")
+            return tex_text
+
+        prompt = self._build_prompt(
+            tex_text,
+            f"""Please modify and output the above Latex text based on the following instructions.
+- Only “Available Images” are available.
+- If a figure is mentioned on Latex Text, please rewrite the content of Latex Text to cite it.
+- Do not use diagrams that do not exist in “Available Images”.
+- Return the complete LaTeX text.
 # Available Images
 --------
 {fig_to_use}
---------
-Please modify and output the above Latex text based on the following instructions.
-- Only “Available Images” are available. 
-- If a figure is mentioned on Latex Text, please rewrite the content of Latex Text to cite it.
-- Do not use diagrams that do not exist in “Available Images”.
-- Return the complete LaTeX text."""
+--------""",
+        )
 
-        tex_text = self._call_llm(prompt) or tex_text
-        return tex_text
+        llm_response = self._call_llm(prompt)
+        if llm_response is None:
+            return tex_text
+        self._last_fig_set = frozenset(fig_to_use)
+        return llm_response
 
     def _check_duplicates(self, tex_text: str, patterns: dict[str, str]) -> str:
         for element_type, pattern in patterns.items():
@@ -169,14 +201,12 @@ Please modify and output the above Latex text based on the following instruction
             duplicates = {x for x in items if items.count(x) > 1}
             if duplicates:
                 logger.info(f"Duplicate {element_type} found: {duplicates}.")
-                prompt = f"""\n
-# LaTeX text
---------
-{tex_text}
---------
-Duplicate {element_type} found: {", ".join(duplicates)}. Ensure any {element_type} is only included once. 
+                prompt = self._build_prompt(
+                    tex_text,
+                    f"""Duplicate {element_type} found: {", ".join(duplicates)}. Ensure any {element_type} is only included once. 
 If duplicated, identify the best location for the {element_type} and remove any other.
-Return the complete corrected LaTeX text with the duplicates fixed."""
+Return the complete corrected LaTeX text with the duplicates fixed.""",
+                )
                 tex_text = self._call_llm(prompt) or tex_text
         return tex_text
 
@@ -201,16 +231,14 @@ Return the complete corrected LaTeX text with the duplicates fixed."""
                 )
                 logger.info(f"LaTeX error detected: {formatted_errors}")
 
-                prompt = f"""\n
-# LaTeX text
---------
-{tex_text}
---------
-Please fix the following LaTeX errors: {formatted_errors}.      
+                prompt = self._build_prompt(
+                    tex_text,
+                    f"""Please fix the following LaTeX errors: {formatted_errors}.      
 Make the minimal fix required and do not remove or change any packages unnecessarily.
 Pay attention to any accidental uses of HTML syntax, e.g. </end instead of \\end.
 
-Return the complete corrected LaTeX text."""
+Return the complete corrected LaTeX text.""",
+                )
 
                 tex_text = self._call_llm(prompt) or tex_text
             return tex_text
@@ -33,33 +33,29 @@ def _replace_placeholders(
     return latex_text
 
 
-def convert_to_latex(
-    llm_name: LLM_MODEL,
+def build_convert_to_latex_prompt(
     prompt_template: str,
     paper_content_with_placeholders: dict[str, str],
-    references_bib: dict[str, str],
+    citation_placeholders: list[str],
     figures_dir: str = "images",
-    client: LLMFacadeClient | None = None,
-) -> dict[str, str]:
-    client = client or LLMFacadeClient(llm_name)
-
+) -> str:
     data = {
         "figures_dir": figures_dir,
         "sections": [
             {"name": section, "content": paper_content_with_placeholders[section]}
             for section in paper_content_with_placeholders.keys()
         ],
-        "citation_placeholders": list(references_bib.keys()),
+        "citation_placeholders": citation_placeholders,
     }
 
     env = Environment()
     template = env.from_string(prompt_template)
-    messages = template.render(data)
+    return template.render(data)
 
-    output, cost = client.structured_outputs(
-        message=messages,
-        data_model=PaperContent,
-    )
+
+def parse_convert_to_latex_output(
+    output: dict | None, references_bib: dict[str, str]
+) -> dict[str, str]:
     if output is None:
         raise ValueError("Error: No response from the model in convert_to_latex.")
 
@@ -80,6 +76,30 @@ def convert_to_latex(
     return output
 
 
+def convert_to_latex(
+    llm_name: LLM_MODEL,
+    prompt_template: str,
+    paper_content_with_placeholders: dict[str, str],
+    references_bib: dict[str, str],
+    figures_dir: str = "images",
+    client: LLMFacadeClient | None = None,
+) -> dict[str, str]:
+    client = client or LLMFacadeClient(llm_name)
+
+    messages = build_convert_to_latex_prompt(
+        prompt_template=prompt_template,
+        paper_content_with_placeholders=paper_content_with_placeholders,
+        citation_placeholders=list(references_bib.keys()),
+        figures_dir=figures_dir,
+    )
+
+    output, cost = client.structured_outputs(
+        message=messages,
+        data_model=PaperContent,
+    )
+    return parse_convert_to_latex_output(output, references_bib)
+
+
 if __name__ == "__main__":
     from tradegraph.publication.latex_subgraph.prompt.convert_to_latex_prompt import (
         convert_to_latex_prompt,
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from logging import getLogger
 from typing import Any
 
@@ -12,34 +13,44 @@ from tradegraph.services.api_client.llm_client.llm_facade_client import (
 logger = getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
 def _build_bib_entry_model(n: int) -> type[BaseModel]:
     fields = {f"bib_entry_{i + 1}": (str, ...) for i in range(n)}
     return create_model("LLMOutput", **fields)
 
 
-def generate_bib(
-    llm_name: LLM_MODEL,
+def build_bib_request(
     prompt_template: str,
     references: dict[str, dict[str, Any]],
-    client: LLMFacadeClient | None = None,
-) -> dict[str, str]:
-    client = client or LLMFacadeClient(llm_name)
-
+) -> tuple[str, type[BaseModel]]:
     data = {"refs": [{"placeholder": k, "reference": v} for k, v in references.items()]}
 
     env = Environment()
     template = env.from_string(prompt_template)
     messages = template.render(data)
+    return messages, _build_bib_entry_model(len(references))
+
+
+def parse_bib_output(
+    output: dict | None, references: dict[str, dict[str, Any]]
+) -> dict[str, str]:
+    if output is None:
+        raise ValueError("Error: No response from the model in generate_bib.")
+
+    return {key: output[f"bib_entry_{i + 1}"] for i, key in enumerate(references)}
 
-    DynamicLLMOutput = _build_bib_entry_model(len(references))
+
+def generate_bib(
+    llm_name: LLM_MODEL,
+    prompt_template: str,
+    references: dict[str, dict[str, Any]],
+    client: LLMFacadeClient | None = None,
+) -> dict[str, str]:
+    client = client or LLMFacadeClient(llm_name)
+
+    messages, DynamicLLMOutput = build_bib_request(prompt_template, references)
     output, cost = client.structured_outputs(
         message=messages,
         data_model=DynamicLLMOutput,
     )
-    if output is None:
-        raise ValueError("Error: No response from the model in convert_to_latex.")
-
-    references_bib = {
-        key: output[f"bib_entry_{i + 1}"] for i, key in enumerate(references)
-    }
-    return references_bib
+    return parse_bib_output(output, references)
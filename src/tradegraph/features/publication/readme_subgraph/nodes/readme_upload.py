@@ -5,29 +5,43 @@ from tradegraph.services.api_client.github_client import GithubClient
 logger = getLogger(__name__)
 
 
+_README_PREFIX = b"# "
+_ABSTRACT_HDR = (
+    "\n> ⚠️ **NOTE:** This research is an automatic research using AIRAS.\n"
+    "## Abstract\n"
+).encode("utf-8")
+_HISTORY_HDR = b"\n\n- [Research history]("
+_DEVIN_HDR = b")\n- [Devin execution log]("
+_README_SUFFIX = b")"
+README_PATH = "README.md"
+
+
 def _build_markdown(
     title: str, abstract: str, research_history_url: str, devin_url: str
-) -> str:
-    return f"""# {title}
-> ⚠️ **NOTE:** This research is an automatic research using AIRAS.
-## Abstract
-{abstract}
-
-- [Research history]({research_history_url})
-- [Devin execution log]({devin_url})"""
+) -> bytes:
+    return b"".join(
+        [
+            _README_PREFIX,
+            title.encode("utf-8"),
+            _ABSTRACT_HDR,
+            abstract.encode("utf-8"),
+            _HISTORY_HDR,
+            research_history_url.encode("utf-8"),
+            _DEVIN_HDR,
+            devin_url.encode("utf-8"),
+            _README_SUFFIX,
+        ]
+    )
 
 
-def readme_upload(
+def prepare_readme(
     github_owner: str,
     repository_name: str,
     branch_name: str,
     title: str,
     abstract: str,
     devin_url: str,
-    client: GithubClient | None = None,
-) -> bool:
-    if client is None:
-        client = GithubClient()
+) -> bytes:
     logger.info("Preparing README content for upload")
 
     research_history_url = (
@@ -35,20 +49,36 @@ def readme_upload(
         f"/blob/{branch_name}/.research/research_history.json"
     )
 
-    markdown = _build_markdown(
+    return _build_markdown(
         title,
         abstract,
         research_history_url,
         devin_url,
     )
-    markdown_bytes = markdown.encode("utf-8")
 
-    logger.info("Uploading README.md via GithubClient.commit_file_bytes")
-    return client.commit_file_bytes(
+
+def readme_file(markdown: bytes) -> tuple[str, bytes]:
+    # (path, content) entry for callers that commit README.md together with
+    # other publication files via GithubClient.commit_files_bytes.
+    return README_PATH, markdown
+
+
+def readme_upload(
+    github_owner: str,
+    repository_name: str,
+    branch_name: str,
+    markdown: bytes,
+    client: GithubClient | None = None,
+    extra_files: list[tuple[str, bytes]] | None = None,
+) -> bool:
+    if client is None:
+        client = GithubClient()
+
+    logger.info("Uploading README.md via GithubClient.commit_files_bytes")
+    return client.commit_files_bytes(
         github_owner=github_owner,
         repository_name=repository_name,
         branch_name=branch_name,
-        file_path="README.md",
-        file_content=markdown_bytes,
+        files=[readme_file(markdown), *(extra_files or [])],
         commit_message="Research paper uploaded.",
     )
@@ -10,7 +10,10 @@ from tradegraph.core.base import BaseSubgraph
 from tradegraph.features.publication.readme_subgraph.input_data import (
     readme_subgraph_input_data,
 )
-from tradegraph.features.publication.readme_subgraph.nodes.readme_upload import readme_upload
+from tradegraph.features.publication.readme_subgraph.nodes.readme_upload import (
+    prepare_readme,
+    readme_upload,
+)
 from tradegraph.utils.execution_timers import ExecutionTimeState, time_node
 from tradegraph.utils.logging_utils import setup_logging
 
@@ -30,6 +33,7 @@ class ReadmeSubgraphInputState(TypedDict):
 class ReadmeSubgraphHiddenState(TypedDict):
     github_owner: str
     repository_name: str
+    readme_markdown: bytes
 
 
 class ReadmeSubgraphOutputState(TypedDict):
@@ -67,25 +71,40 @@ class ReadmeSubgraph(BaseSubgraph):
             )
             raise
 
+    @readme_timed
+    def _prepare_markdown(self, state: ReadmeSubgraphState) -> dict[str, bytes]:
+        # Runs in parallel with init_state, so derive owner/name locally.
+        github_owner, repository_name = state["github_repository"].split("/", 1)
+        readme_markdown = prepare_readme(
+            github_owner=github_owner,
+            repository_name=repository_name,
+            branch_name=state["branch_name"],
+            title=state["paper_content"]["Title"],
+            abstract=state["paper_content"]["Abstract"],
+            devin_url=state["experiment_devin_url"],
+        )
+        return {"readme_markdown": readme_markdown}
+
     @readme_timed
     def _readme_upload_node(self, state: ReadmeSubgraphState) -> dict:
         readme_upload_result = readme_upload(
             github_owner=state["github_owner"],
             repository_name=state["repository_name"],
             branch_name=state["branch_name"],
-            title=state["paper_content"]["Title"],
-            abstract=state["paper_content"]["Abstract"],
-            devin_url=state["experiment_devin_url"],
+            markdown=state["readme_markdown"],
         )
         return {"readme_upload_result": readme_upload_result}
 
     def build_graph(self) -> Any:
         graph_builder = StateGraph(ReadmeSubgraphState)
         graph_builder.add_node("init_state", self._init_state)
+        graph_builder.add_node("prepare_markdown", self._prepare_markdown)
         graph_builder.add_node("readme_upload_node", self._readme_upload_node)
 
+        # Fan out from START and join before the upload.
         graph_builder.add_edge(START, "init_state")
-        graph_builder.add_edge("init_state", "readme_upload_node")
+        graph_builder.add_edge(START, "prepare_markdown")
+        graph_builder.add_edge(["init_state", "prepare_markdown"], "readme_upload_node")
         graph_builder.add_edge("readme_upload_node", END)
 
         return graph_builder.compile()
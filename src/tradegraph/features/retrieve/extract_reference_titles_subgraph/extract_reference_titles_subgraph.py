@@ -1,7 +1,10 @@
+import asyncio
 import logging
-from typing import Any
+import operator
+from typing import Annotated, Any
 
 from langgraph.graph import END, START, StateGraph
+from langgraph.types import Send
 # In newer langgraph, compiled graphs are returned by StateGraph.compile()
 from typing_extensions import TypedDict
 
@@ -10,7 +13,10 @@ from tradegraph.features.retrieve.extract_reference_titles_subgraph.input_data i
     extract_reference_titles_subgraph_input_data,
 )
 from tradegraph.features.retrieve.extract_reference_titles_subgraph.nodes.extract_reference_titles import (
-    extract_reference_titles,
+    NearDuplicateTitleIndex,
+    aextract_reference_titles_batch,
+    extract_reference_titles_via_batch_api,
+    select_unique_references,
 )
 from tradegraph.services.api_client.llm_client.llm_facade_client import (
     LLM_MODEL,
@@ -29,11 +35,20 @@ class ExtractReferenceTitlesInputState(TypedDict):
     research_study_list: list[dict]
 
 
-class ExtractReferenceTitlesHiddenState(TypedDict): ...
+class ExtractReferenceTitlesHiddenState(TypedDict):
+    # One index per run, shared by every chunk task.
+    reference_title_index: NearDuplicateTitleIndex
 
 
 class ExtractReferenceTitlesOutputState(TypedDict):
-    reference_research_study_list: list[dict]
+    # Each chunk task appends its own titles as soon as it finishes; titles
+    # already cited by another paper (or near-identical ones) are dropped.
+    reference_research_study_list: Annotated[list[dict], operator.add]
+
+
+class ExtractReferenceTitlesChunkState(TypedDict):
+    full_texts: list[str]
+    reference_title_index: NearDuplicateTitleIndex
 
 
 class ExtractReferenceTitlesState(
@@ -51,43 +66,110 @@ class ExtractReferenceTitlesSubgraph(BaseSubgraph):
     def __init__(
         self,
         llm_name: LLM_MODEL,
+        max_concurrency: int = 10,
+        batch_size: int = 1,
+        use_batch_api: bool = False,
+        poll_interval: float = 30.0,
     ):
         self.llm_name = llm_name
+        self.max_concurrency = max_concurrency
+        # Number of papers marshaled into one LLM call. Only papers whose
+        # reference text fits one chunk are combined; longer ones are split
+        # into per-chunk calls. Keep this small: the combined prompt grows by
+        # up to one chunk per paper.
+        self.batch_size = batch_size
+        # Submit every paper as one OpenAI Batch API job (half price, minutes
+        # of latency) instead of issuing online calls.
+        self.use_batch_api = use_batch_api
+        self.poll_interval = poll_interval
+
+    def _init_references(self, state: ExtractReferenceTitlesState) -> dict:
+        return {
+            "reference_research_study_list": [],
+            "reference_title_index": NearDuplicateTitleIndex(),
+        }
+
+    def _dispatch_chunks(self, state: ExtractReferenceTitlesState) -> list[Send] | str:
+        full_texts = [
+            full_text
+            for research_study in state["research_study_list"]
+            if (full_text := research_study.get("full_text", ""))
+        ]
+        if not full_texts:
+            return END
+        index = state["reference_title_index"]
+        if self.use_batch_api:
+            return [
+                Send(
+                    "extract_reference_titles",
+                    {"full_texts": full_texts, "reference_title_index": index},
+                )
+            ]
+        return [
+            Send(
+                "extract_reference_titles",
+                {
+                    "full_texts": full_texts[i : i + self.batch_size],
+                    "reference_title_index": index,
+                },
+            )
+            for i in range(0, len(full_texts), self.batch_size)
+        ]
 
     @extract_reference_titles_timed
-    def _extract_reference_titles(
-        self, state: ExtractReferenceTitlesState
+    async def _extract_reference_titles(
+        self, state: ExtractReferenceTitlesChunkState
     ) -> dict[str, list[dict]]:
-        research_study_list = state["research_study_list"]
-        reference_research_study_list: list[dict] = []
-
-        for research_study in research_study_list:
-            if full_text := research_study.get("full_text", ""):
-                reference_titles = extract_reference_titles(
-                    full_text=full_text,
-                    llm_name=self.llm_name,
-                )
-
-                for title in reference_titles:
-                    reference_research_study_list.append(
-                        {
-                            "title": title,
-                        }
-                    )
-
-        return {"reference_research_study_list": reference_research_study_list}
+        if self.use_batch_api:
+            chunk_titles = await asyncio.to_thread(
+                extract_reference_titles_via_batch_api,
+                full_texts=state["full_texts"],
+                llm_name=self.llm_name,
+                poll_interval=self.poll_interval,
+            )
+        else:
+            chunk_titles = await aextract_reference_titles_batch(
+                full_texts=state["full_texts"],
+                llm_name=self.llm_name,
+            )
+        # No await below, so concurrent chunk tasks cannot interleave the dedup.
+        return {
+            "reference_research_study_list": select_unique_references(
+                state["reference_title_index"],
+                [
+                    {"title": title}
+                    for reference_titles in chunk_titles
+                    for title in reference_titles
+                ],
+            )
+        }
 
     def build_graph(self) -> Any:
         graph_builder = StateGraph(ExtractReferenceTitlesState)
+        graph_builder.add_node("init_references", self._init_references)
         graph_builder.add_node(
             "extract_reference_titles", self._extract_reference_titles
         )
 
-        graph_builder.add_edge(START, "extract_reference_titles")
+        graph_builder.add_edge(START, "init_references")
+        graph_builder.add_conditional_edges(
+            "init_references",
+            self._dispatch_chunks,
+            ["extract_reference_titles", END],
+        )
         graph_builder.add_edge("extract_reference_titles", END)
 
         return graph_builder.compile()
 
+    def run(self, state: dict[str, Any], config: dict | None = None) -> dict[str, Any]:
+        # LangGraph caps the number of chunk tasks running at once.
+        config = {
+            "recursion_limit": 200,
+            **(config or {}),
+            "max_concurrency": self.max_concurrency,
+        }
+        return self._run_async(state, config)
+
 
 def main():
     input_data = extract_reference_titles_subgraph_input_data
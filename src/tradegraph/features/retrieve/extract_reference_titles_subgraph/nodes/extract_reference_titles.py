@@ -1,34 +1,145 @@
+import asyncio
+import hashlib
+import re
 import string
+from functools import lru_cache
 from logging import getLogger
 
-from jinja2 import Environment
-from pydantic import BaseModel
+from pydantic import BaseModel, create_model
 
 from tradegraph.features.retrieve.extract_reference_titles_subgraph.prompts.extract_reference_titles_prompt import (
+    extract_reference_titles_batch_prompt,
     extract_reference_titles_prompt,
 )
 from tradegraph.services.api_client.llm_client.llm_facade_client import (
     LLM_MODEL,
     LLMFacadeClient,
 )
+from tradegraph.utils.llm_cache import llm_cache
+from tradegraph.utils.rate_limiter import estimate_tokens, get_token_bucket
+from tradegraph.utils.template_cache import compile_template
 
 logger = getLogger(__name__)
 
+_EXTRACT_TEMPLATE = compile_template(extract_reference_titles_prompt)
+_EXTRACT_BATCH_TEMPLATE = compile_template(extract_reference_titles_batch_prompt)
+
 
 class LLMOutput(BaseModel):
     reference_titles: list[str]
 
 
+# Removes punctuation and whitespace in the same C-level pass as translate().
+_PUNCT_WS_TABLE = str.maketrans("", "", string.punctuation + string.whitespace)
+
+
 # Possible to extract from different parts of the paper
 def _normalize_title(title: str) -> str:
-    normalized = title.lower()
-    translator = str.maketrans("", "", string.punctuation)
-    normalized = normalized.translate(translator)
-    normalized = "".join(normalized.split())
+    return title.lower().translate(_PUNCT_WS_TABLE)
+
+
+def _deduplicate_titles(reference_titles: list[str]) -> list[str]:
+    seen: set[str] = set()
+    return [
+        title
+        for title in reference_titles
+        if (key := _normalize_title(title)) not in seen and not seen.add(key)
+    ]
+
+
+_SIMHASH_BITS = 64
+_SIMHASH_BANDS = 8  # 8-bit bands: any pair within 5 bits shares one exactly
+_SIMHASH_MAX_DISTANCE = 5
+
+
+def _simhash(normalized_title: str) -> int:
+    # 64-bit SimHash over character trigrams of the normalized title.
+    weights = [0] * _SIMHASH_BITS
+    grams = {
+        normalized_title[i : i + 3] for i in range(max(1, len(normalized_title) - 2))
+    }
+    for gram in grams:
+        h = int.from_bytes(
+            hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        for bit in range(_SIMHASH_BITS):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+class NearDuplicateTitleIndex:
+    """Exact normalized-title set plus banded SimHash lookup for near matches."""
+
+    def __init__(self):
+        self._seen: set[str] = set()
+        self._bands: dict[tuple[int, int], list[int]] = {}
+
+    def add(self, title: str) -> bool:
+        """Register `title`; return False if it duplicates a known title."""
+        key = _normalize_title(title)
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+
+        fingerprint = _simhash(key)
+        band_width = _SIMHASH_BITS // _SIMHASH_BANDS
+        mask = (1 << band_width) - 1
+        band_keys = [
+            (band, (fingerprint >> (band * band_width)) & mask)
+            for band in range(_SIMHASH_BANDS)
+        ]
+        for band_key in band_keys:
+            for other in self._bands.get(band_key, ()):
+                if (fingerprint ^ other).bit_count() <= _SIMHASH_MAX_DISTANCE:
+                    return False
+        for band_key in band_keys:
+            self._bands.setdefault(band_key, []).append(fingerprint)
+        return True
+
+
+def select_unique_references(
+    index: NearDuplicateTitleIndex, references: list[dict]
+) -> list[dict]:
+    """Keep the references whose titles `index` has not seen, registering them.
+
+    Share one index across all the batches of a run: every title is hashed
+    once, so merging stays linear in the number of references.
+    """
+    return [
+        reference for reference in references if index.add(reference.get("title", ""))
+    ]
+
+
+# ~4 characters per token: 4k-token windows with a 200-token overlap.
+_CHUNK_CHARS = 16_000
+_CHUNK_OVERLAP_CHARS = 800
+_REFERENCE_HEADING = re.compile(r"\n\s*(?:References|Bibliography)\b", re.IGNORECASE)
+
+
+def _split_reference_chunks(
+    full_text: str,
+    chunk_chars: int = _CHUNK_CHARS,
+    overlap_chars: int = _CHUNK_OVERLAP_CHARS,
+) -> list[str]:
+    # Prefer the reference section (after the last heading) when the paper
+    # has one, then cut whatever remains into overlapping windows.
+    headings = list(_REFERENCE_HEADING.finditer(full_text))
+    text = full_text[headings[-1].start() :] if headings else full_text
+    if len(text) <= chunk_chars:
+        return [text]
+    step = chunk_chars - overlap_chars
+    return [
+        text[i : i + chunk_chars] for i in range(0, len(text) - overlap_chars, step)
+    ]
 
-    return normalized
 
+@lru_cache(maxsize=16)
+def _build_batch_reference_model(n_papers: int) -> type[BaseModel]:
+    fields = {f"paper_{i + 1}": (list[str], ...) for i in range(n_papers)}
+    return create_model("LLMBatchOutput", **fields)
 
+
+@llm_cache(extract_reference_titles_prompt, LLMOutput)
 def extract_reference_titles(
     full_text: str,
     llm_name: LLM_MODEL,
@@ -37,10 +148,7 @@ def extract_reference_titles(
     if client is None:
         client = LLMFacadeClient(llm_name=llm_name)
 
-    env = Environment()
-    template = env.from_string(extract_reference_titles_prompt)
-    data = {"full_text": full_text}
-    messages = template.render(data)
+    messages = _EXTRACT_TEMPLATE.render(full_text=full_text)
 
     try:
         output, cost = client.structured_outputs(message=messages, data_model=LLMOutput)
@@ -53,15 +161,170 @@ def extract_reference_titles(
         return []
 
     reference_titles = output.get("reference_titles", [])
-
-    unique_titles = []
-    seen_normalized = set()
-
-    for title in reference_titles:
-        normalized_title = _normalize_title(title)
-        if normalized_title not in seen_normalized:
-            unique_titles.append(title)
-            seen_normalized.add(normalized_title)
+    unique_titles = _deduplicate_titles(reference_titles)
 
     logger.info(f"Found {len(unique_titles)} unique titles after normalization.")
     return unique_titles
+
+
+def extract_reference_titles_batch(
+    full_texts: list[str],
+    llm_name: LLM_MODEL,
+    client: LLMFacadeClient | None = None,
+) -> list[list[str]]:
+    """Extract the references of several papers with a single LLM call.
+
+    Each text should fit in one chunk of `_split_reference_chunks`;
+    `aextract_reference_titles_batch` routes longer papers to the per-chunk
+    path. Returns one deduplicated title list per input text, in input order.
+    """
+    if len(full_texts) == 1:
+        return [extract_reference_titles(full_texts[0], llm_name, client)]
+
+    if client is None:
+        client = LLMFacadeClient(llm_name=llm_name)
+
+    messages = _EXTRACT_BATCH_TEMPLATE.render(full_texts=full_texts)
+
+    try:
+        output, cost = client.structured_outputs(
+            message=messages,
+            data_model=_build_batch_reference_model(len(full_texts)),
+        )
+    except Exception as e:
+        logger.error(f"Error extracting references: {e}")
+        return [[] for _ in full_texts]
+
+    if output is None or not isinstance(output, dict):
+        logger.warning("Warning: No valid response from LLM for reference extraction.")
+        return [[] for _ in full_texts]
+
+    return [
+        _deduplicate_titles(output.get(f"paper_{i + 1}", []))
+        for i in range(len(full_texts))
+    ]
+
+
+def extract_reference_titles_via_batch_api(
+    full_texts: list[str],
+    llm_name: LLM_MODEL,
+    client: LLMFacadeClient | None = None,
+    poll_interval: float = 30.0,
+) -> list[list[str]]:
+    """Extract references for many papers through the OpenAI Batch API.
+
+    One request per chunk of each paper is submitted in a single batch job,
+    which is billed at half price but may take minutes to complete. Blocks
+    until it finishes.
+    """
+    if client is None:
+        client = LLMFacadeClient(llm_name=llm_name)
+
+    chunked = [_split_reference_chunks(full_text) for full_text in full_texts]
+    requests = {
+        f"paper-{i}-chunk-{j}": (_EXTRACT_TEMPLATE.render(full_text=chunk), LLMOutput)
+        for i, chunks in enumerate(chunked)
+        for j, chunk in enumerate(chunks)
+    }
+    outputs, cost = client.batch_structured_outputs(
+        requests=requests, poll_interval=poll_interval
+    )
+    logger.info(f"Batch reference extraction finished. Cost: ${cost:.4f}")
+
+    reference_titles = []
+    for i, chunks in enumerate(chunked):
+        titles = []
+        for j in range(len(chunks)):
+            output = outputs.get(f"paper-{i}-chunk-{j}") or {}
+            titles.extend(output.get("reference_titles", []))
+        reference_titles.append(_deduplicate_titles(titles))
+    return reference_titles
+
+
+async def _aextract_chunk_titles(
+    chunk: str,
+    llm_name: LLM_MODEL,
+    client: LLMFacadeClient | None = None,
+) -> list[str]:
+    await get_token_bucket(llm_name).acquire(
+        estimate_tokens(extract_reference_titles_prompt, chunk)
+    )
+    # The LLM clients are synchronous; run the blocking call in a worker thread
+    # so several chunks and papers can be processed concurrently.
+    return await asyncio.to_thread(
+        extract_reference_titles,
+        full_text=chunk,
+        llm_name=llm_name,
+        client=client,
+    )
+
+
+async def _amap_reduce_titles(
+    chunks: list[str],
+    llm_name: LLM_MODEL,
+    client: LLMFacadeClient | None = None,
+) -> list[str]:
+    chunk_titles = await asyncio.gather(
+        *(_aextract_chunk_titles(chunk, llm_name, client) for chunk in chunks)
+    )
+    return _deduplicate_titles(
+        [title for titles in chunk_titles for title in titles]
+    )
+
+
+async def aextract_reference_titles(
+    full_text: str,
+    llm_name: LLM_MODEL,
+    client: LLMFacadeClient | None = None,
+) -> list[str]:
+    """Map-reduce extraction: one LLM call per chunk, merged and deduplicated."""
+    return await _amap_reduce_titles(
+        _split_reference_chunks(full_text), llm_name, client
+    )
+
+
+async def _aextract_single_chunk_batch(
+    texts: list[str],
+    llm_name: LLM_MODEL,
+    client: LLMFacadeClient | None = None,
+) -> list[list[str]]:
+    if len(texts) <= 1:
+        return [await _aextract_chunk_titles(text, llm_name, client) for text in texts]
+
+    await get_token_bucket(llm_name).acquire(
+        estimate_tokens(extract_reference_titles_batch_prompt, *texts)
+    )
+    return await asyncio.to_thread(
+        extract_reference_titles_batch,
+        full_texts=texts,
+        llm_name=llm_name,
+        client=client,
+    )
+
+
+async def aextract_reference_titles_batch(
+    full_texts: list[str],
+    llm_name: LLM_MODEL,
+    client: LLMFacadeClient | None = None,
+) -> list[list[str]]:
+    """Extract the references of several papers, one title list per paper.
+
+    Papers whose reference text fits in one chunk share a single LLM call;
+    longer ones go through the per-chunk map-reduce so no prompt overflows.
+    """
+    chunked = [_split_reference_chunks(full_text) for full_text in full_texts]
+    short = [i for i, chunks in enumerate(chunked) if len(chunks) == 1]
+    long = [i for i, chunks in enumerate(chunked) if len(chunks) > 1]
+
+    batched, *mapped = await asyncio.gather(
+        _aextract_single_chunk_batch(
+            [chunked[i][0] for i in short], llm_name, client
+        ),
+        *(_amap_reduce_titles(chunked[i], llm_name, client) for i in long),
+    )
+    reference_titles: list[list[str]] = [[] for _ in full_texts]
+    for i, titles in zip(short, batched):
+        reference_titles[i] = titles
+    for i, titles in zip(long, mapped):
+        reference_titles[i] = titles
+    return reference_titles
@@ -17,3 +17,22 @@ Full Text:
 
 Please extract all reference paper titles and return them as a list of strings.
 """
+
+extract_reference_titles_batch_prompt = """\
+You are an expert in academic paper analysis. 
+Your task is to extract reference paper titles from the full text of several research papers.
+
+Instructions:
+- The full texts of {{ full_texts|length }} papers are provided, each starting with a ===PAPER i=== marker
+- For each paper, extract all reference paper titles mentioned in that paper's text
+- Focus on titles that appear in reference sections, citations, or are explicitly mentioned as related work
+- Return only the exact titles as they appear in the text
+- Exclude general topics or field names that are not specific paper titles
+- If no clear reference titles are found for a paper, return an empty list for it
+- Put the titles of ===PAPER i=== under the key "paper_i" and never mix titles between papers
+{% for full_text in full_texts %}
+===PAPER {{ loop.index }}===
+{{ full_text }}
+{% endfor %}
+Please return a JSON object with the keys "paper_1" … "paper_{{ full_texts|length }}", each holding a list of strings.
+"""
@@ -51,8 +51,10 @@ class GenerateQueriesSubgraph(BaseSubgraph):
     InputState = GenerateQueriesInputState
     OutputState = GenerateQueriesOutputState
 
-    def __init__(self, llm_name: LLM_MODEL):
+    def __init__(self, llm_name: LLM_MODEL, use_cache: bool = False):
         self.llm_name = llm_name
+        # Replay cached queries for an identical topic instead of asking again.
+        self.use_cache = use_cache
         check_api_key(llm_api_key_check=True)
 
     @generate_queries_timed
@@ -61,6 +63,7 @@ class GenerateQueriesSubgraph(BaseSubgraph):
             llm_name=self.llm_name,
             prompt_template=generate_queries_prompt,
             research_topic=state["research_topic"],
+            use_cache=self.use_cache,
         )
         return {"queries": generated_queries}
 
@@ -1,25 +1,35 @@
+from logging import getLogger
 from typing import Annotated
 
-from jinja2 import Environment
-from pydantic import BaseModel, Field, create_model
+from pydantic import BaseModel, Field
 
 from tradegraph.services.api_client.llm_client.llm_facade_client import (
     LLM_MODEL,
     LLMFacadeClient,
 )
+from tradegraph.utils.llm_cache import llm_cache
+from tradegraph.utils.template_cache import compile_template
 
+logger = getLogger(__name__)
 
-def _build_generated_query_model(n_queries: int) -> type[BaseModel]:
-    fields = {f"generated_query_{i + 1}": (str, ...) for i in range(n_queries)}
-    return create_model("LLMOutput", **fields)
+_MAX_ATTEMPTS = 3
 
 
+class LLMOutput(BaseModel):
+    # The count is checked after decoding so one static schema serves every
+    # n_queries instead of a model class per count.
+    queries: list[str]
+
+
+@llm_cache(LLMOutput)
 def generate_queries(
     llm_name: LLM_MODEL,
     prompt_template: str,
     research_topic: str,
     n_queries: Annotated[int, Field(gt=0)] = 5,
     client: LLMFacadeClient | None = None,
+    # Opt-in: the same topic yields fresh queries unless a replay is requested.
+    use_cache: bool = False,
 ) -> list[str]:
     client = client or LLMFacadeClient(llm_name=llm_name)
 
@@ -28,15 +38,21 @@ def generate_queries(
         "n_queries": n_queries,
     }
 
-    env = Environment()
-    template = env.from_string(prompt_template)
-    messages = template.render(data)
-
-    DynamicLLMOutput = _build_generated_query_model(n_queries)
-    output, cost = client.structured_outputs(
-        message=messages, data_model=DynamicLLMOutput
+    messages = compile_template(prompt_template).render(data)
+
+    for attempt in range(1, _MAX_ATTEMPTS + 1):
+        output, cost = client.structured_outputs(message=messages, data_model=LLMOutput)
+        if output is None:
+            raise ValueError("Error: No response from LLM in generate_queries_node.")
+
+        queries = output["queries"]
+        if len(queries) >= n_queries:
+            return queries[:n_queries]
+        logger.warning(
+            f"Expected {n_queries} queries, got {len(queries)} "
+            f"(attempt {attempt}/{_MAX_ATTEMPTS})."
+        )
+    raise ValueError(
+        f"Error: LLM returned {len(queries)} of {n_queries} queries in generate_queries_node."
     )
-    if output is None:
-        raise ValueError("Error: No response from LLM in generate_queries_node.")
 
-    return [output[f"generated_query_{i + 1}"] for i in range(n_queries)]
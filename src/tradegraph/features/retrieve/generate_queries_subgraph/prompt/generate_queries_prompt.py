@@ -15,10 +15,7 @@ Your goal is to create a set of well-structured search queries based on a user's
 
 **Format**
 1. **Output must be a valid Python dictionary literal that can be parsed by `ast.literal_eval`.**
-   - The dictionary must have exactly **{{ n_queries }} keys**:
-{%- for i in range(1, n_queries + 1) %}
-     - `"generated_query_{{ i }}"`: string  
-{%- endfor %}
+   - The dictionary must have exactly one key, `"queries"`, whose value is a list of exactly **{{ n_queries }} strings**.
 2. **No extra text, no triple backticks, no markdown.** Output ONLY the dictionary.
 3. If you are unsure, only output valid Python dictionary syntax with double quotes for strings.
 
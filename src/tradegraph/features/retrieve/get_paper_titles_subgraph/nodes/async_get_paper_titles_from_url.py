@@ -1,22 +1,75 @@
 import asyncio
+import logging
 import time
 from logging import getLogger
 from typing import Any
 
 import httpx
+from tenacity import (
+    before_sleep_log,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from tradegraph.features.retrieve.get_paper_titles_subgraph.nodes.conference_papers import (
+    filter_papers_by_queries,
+)
+from tradegraph.utils.fast_json import json_loads
+from tradegraph.utils.http2 import HTTP2_AVAILABLE
 
 logger = getLogger(__name__)
 
 
+def _make_client() -> httpx.AsyncClient:
+    # One client per run: an AsyncClient's connection pool is bound to the
+    # event loop it is used on, and every asyncio.run starts a new loop.
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        headers={"Accept-Encoding": "gzip, deflate"},
+    )
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        code = exc.response.status_code
+        return code in (408, 429) or 500 <= code < 600
+    return isinstance(exc, httpx.TransportError)
+
+
+FETCH_RETRY = retry(
+    stop=stop_after_attempt(4),
+    wait=wait_random_exponential(multiplier=1.0, max=30.0),
+    retry=retry_if_exception(_is_retryable),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True,
+)
+
+
+@FETCH_RETRY
+async def _get_with_retry(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    response = await client.get(url)
+    response.raise_for_status()
+    return response
+
+
 async def fetch_one_url(
     client: httpx.AsyncClient, url: str
 ) -> list[dict[str, Any]] | None:
     logger.info(f"Fetching data from '{url}'...")
     try:
-        response = await client.get(url, timeout=30.0)
-        response.raise_for_status()
-        data_dict = response.json()  # keys: (['count', 'next', 'previous', 'results'])
-        return data_dict.get("results", [])
+        response = await _get_with_retry(client, url)
+        # keys: (['count', 'next', 'previous', 'results'])
+        data_dict = json_loads(response.content)
+        # Drop non-poster entries right away so only posters outlive the body.
+        return [
+            paper
+            for paper in data_dict.get("results", [])
+            if paper.get("eventtype") == "Poster"
+        ]
     except httpx.RequestError as e:
         logger.error(
             f"  -> An HTTP error occurred while fetching '{url}': {e}. Skipping this URL."
@@ -33,7 +86,7 @@ async def _load_papers_from_urls(json_urls: list[str]) -> list[dict[str, Any]]:
     combined_papers = []
     logger.info("Starting to load paper data asynchronously...")
 
-    async with httpx.AsyncClient() as client:
+    async with _make_client() as client:
         tasks = [fetch_one_url(client, url) for url in json_urls]
         results_from_all_urls = await asyncio.gather(*tasks)
 
@@ -44,44 +97,14 @@ async def _load_papers_from_urls(json_urls: list[str]) -> list[dict[str, Any]]:
     return combined_papers
 
 
-def _apply_filters_by_queries(
-    papers: list[dict[str, Any]], queries: list[str]
-) -> list[dict[str, Any]]:
-    active_queries = [q.lower() for q in queries if q and not q.isspace()]
-    if not active_queries:
-        return papers
-
-    filtered_list = []
-    for paper in papers:
-        # authors_fullnames = [author.get('fullname', '') for author in paper.get('authors', [])]
-
-        searchable_text = " ".join(
-            [
-                paper.get("name", ""),
-                # paper.get('abstract', ''),
-                # " ".join(authors_fullnames),
-                # " ".join(paper.get('keywords', []))
-            ]
-        ).lower()
-
-        if all(query in searchable_text for query in active_queries):
-            filtered_list.append(paper)
-
-    return filtered_list
-
-
 async def get_paper_titles_from_url(
     json_urls: list[str], queries: list[str]
 ) -> list[str]:
-    all_papers = await _load_papers_from_urls(json_urls)
-    if not all_papers:
+    poster_papers = await _load_papers_from_urls(json_urls)
+    if not poster_papers:
         return []
 
-    poster_papers = [
-        paper for paper in all_papers if paper.get("eventtype") == "Poster"
-    ]
-
-    filtered_papers = _apply_filters_by_queries(poster_papers, queries)
+    filtered_papers = filter_papers_by_queries(poster_papers, queries)
     filtered_titles = [paper.get("name", "No Title Found") for paper in filtered_papers]
 
     return filtered_titles
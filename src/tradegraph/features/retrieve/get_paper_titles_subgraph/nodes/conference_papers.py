@@ -0,0 +1,91 @@
+import re
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; fall back to substring checks
+    ahocorasick = None
+
+MAX_FETCH_WORKERS = 8
+
+EXCLUDE_KEYWORDS = ("survey", "review", "overview", "systematic review")
+# One case-insensitive C-level scan instead of a lowercase copy plus one
+# substring search per keyword; substring (not whole-word) semantics are kept.
+_EXCLUDE_RE = re.compile("|".join(map(re.escape, EXCLUDE_KEYWORDS)), re.IGNORECASE)
+
+
+def is_excluded_title(title: str) -> bool:
+    """Check if title contains excluded keywords."""
+    return _EXCLUDE_RE.search(title) is not None
+
+
+def make_session() -> requests.Session:
+    """Session with a connection pool sized for MAX_FETCH_WORKERS threads."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def filter_papers_by_queries(
+    papers: list[dict[str, Any]],
+    queries: list[str],
+    eventtype: str | None = None,
+) -> list[dict[str, Any]]:
+    """Keep the papers whose name contains every query (case-insensitive).
+
+    The optional eventtype check runs in the same pass as the query match.
+    """
+    active_queries = list(
+        dict.fromkeys(q.lower() for q in queries if q and not q.isspace())
+    )
+
+    automaton = None
+    if ahocorasick is not None and len(active_queries) > 1:
+        # One pass over each title finds every query instead of Q scans.
+        automaton = ahocorasick.Automaton()
+        for idx, query in enumerate(active_queries):
+            automaton.add_word(query, idx)
+        automaton.make_automaton()
+
+    # bytes.lower()/`in` take an ASCII-only C fast path; titles or queries with
+    # other characters keep the Unicode str path.
+    ascii_queries = (
+        [q.encode("ascii") for q in active_queries]
+        if all(q.isascii() for q in active_queries)
+        else None
+    )
+
+    filtered_list = []
+    for paper in papers:
+        if eventtype is not None and paper.get("eventtype") != eventtype:
+            continue
+
+        name = paper.get("name")
+        if not active_queries:
+            filtered_list.append(paper)
+            continue
+        if not name:
+            continue
+
+        if automaton is not None:
+            found = {idx for _, idx in automaton.iter(name.lower())}
+            matched = len(found) == len(active_queries)
+        elif ascii_queries is not None and name.isascii():
+            searchable_bytes = name.encode("ascii").lower()
+            matched = all(query in searchable_bytes for query in ascii_queries)
+        else:
+            searchable_text = name.lower()
+            matched = all(query in searchable_text for query in active_queries)
+
+        if matched:
+            filtered_list.append(paper)
+
+    return filtered_list
+
+
+__all__ = ["MAX_FETCH_WORKERS", "filter_papers_by_queries", "make_session"]
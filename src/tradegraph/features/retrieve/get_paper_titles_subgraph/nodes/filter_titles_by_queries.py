@@ -1,6 +1,13 @@
+from heapq import nlargest
 from logging import getLogger
+from operator import itemgetter
 from typing import Any
 
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; fall back to str.count per query
+    ahocorasick = None
+
 logger = getLogger(__name__)
 
 
@@ -9,8 +16,17 @@ def _match_score(text: str, query: str) -> int:
     return text.count(query)
 
 
+def _top_k(items, k: int | None, key) -> list:
+    # nlargest is O(M log k) and, like the stable sort it replaces, keeps
+    # equally scored papers in their original order.
+    if k is None:
+        return sorted(items, key=key, reverse=True)
+    return nlargest(k, items, key=key)
+
+
 def _filter_papers_for_single_query(
-    papers: list[dict[str, Any]],
+    lower_texts: list[str],
+    titles: list[str],
     query: str,
     max_results: int | None = None,
 ) -> list[str]:
@@ -19,23 +35,38 @@ def _filter_papers_for_single_query(
         return []
 
     scored_papers = []
-    for paper in papers:
-        searchable_text = " ".join(
-            [
-                paper.get("title", ""),
-                # paper.get("abstract", ""),
-                # " ".join(paper.get("authors", [])),
-                # paper.get("topic", "")
-            ]
-        ).lower()
-
+    for searchable_text, title in zip(lower_texts, titles):
         score = _match_score(searchable_text, query)
         if score > 0:
-            scored_papers.append((score, paper.get("title", "No Title Found")))
+            scored_papers.append((score, title))
+
+    top_papers = _top_k(scored_papers, max_results, key=itemgetter(0))
+    return [title for _, title in top_papers]
+
+
+def _filter_papers_for_all_queries(
+    lower_texts: list[str],
+    titles: list[str],
+    queries: list[str],
+    max_results: int | None = None,
+) -> list[list[str]]:
+    """Score every query with a single Aho-Corasick pass over each title."""
+    automaton = ahocorasick.Automaton()
+    for qid, query in enumerate(queries):
+        automaton.add_word(query, qid)
+    automaton.make_automaton()
 
-    scored_papers.sort(key=lambda x: x[0], reverse=True)
+    # scores[qid] maps paper index -> hit count, in paper order.
+    scores: list[dict[int, int]] = [{} for _ in queries]
+    for idx, searchable_text in enumerate(lower_texts):
+        for _, qid in automaton.iter(searchable_text):
+            scores[qid][idx] = scores[qid].get(idx, 0) + 1
 
-    return [title for _, title in scored_papers[:max_results]]
+    results = []
+    for query_scores in scores:
+        ranked = _top_k(query_scores.items(), max_results, key=itemgetter(1))
+        results.append([titles[idx] for idx, _ in ranked])
+    return results
 
 
 def filter_titles_by_queries(
@@ -44,17 +75,33 @@ def filter_titles_by_queries(
     max_results_per_query: int | None = None,
 ) -> list[str]:
     """各クエリごとの上位マッチ結果を統合し、重複を排除したリストを返す"""
-    seen = set()
-    unique_titles: list[str] = []
+    active_queries = list(
+        dict.fromkeys(q.lower().strip() for q in queries if q and not q.isspace())
+    )
 
-    for query in queries:
-        if query and not query.isspace():
-            matched_titles = _filter_papers_for_single_query(
-                papers, query, max_results=max_results_per_query
+    # Untitled papers can never match a query, so drop them up front and
+    # lowercase each remaining title once instead of once per query.
+    titles = [title for paper in papers if (title := paper.get("title"))]
+    lower_texts = [title.lower() for title in titles]
+
+    if ahocorasick is not None and active_queries:
+        matched_per_query = _filter_papers_for_all_queries(
+            lower_texts, titles, active_queries, max_results=max_results_per_query
+        )
+    else:
+        matched_per_query = [
+            _filter_papers_for_single_query(
+                lower_texts, titles, query, max_results=max_results_per_query
             )
-            for title in matched_titles:
-                if title not in seen:
-                    seen.add(title)
-                    unique_titles.append(title)
+            for query in active_queries
+        ]
+
+    seen = set()
+    unique_titles: list[str] = []
+    for matched_titles in matched_per_query:
+        for title in matched_titles:
+            if title not in seen:
+                seen.add(title)
+                unique_titles.append(title)
 
     return unique_titles
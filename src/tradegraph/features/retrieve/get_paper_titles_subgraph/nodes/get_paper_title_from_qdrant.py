@@ -8,15 +8,20 @@ def get_paper_titles_from_qdrant(
     llm_client = LLMFacadeClient(llm_name="gemini-embedding-001")
     qdrant_client = QdrantClient()
     COLLECTION_NAME = "airas_database"
-    results = []
-    for query in queries:
-        query_vector = llm_client.text_embedding(message=query)
-        if query_vector:
-            result = qdrant_client.query_points(
-                collection_name=COLLECTION_NAME,
-                query_vector=query_vector,
-                limit=num_retrieve_paper,
-            )
-            for i in result["result"]["points"]:
-                results.append(i["payload"]["title"])
-    return results
+    # One embedding request and one Qdrant batch query for all queries.
+    query_vectors = [
+        vector for vector in llm_client.text_embedding_batch(messages=queries) if vector
+    ]
+    if not query_vectors:
+        return []
+
+    response = qdrant_client.query_points_batch(
+        collection_name=COLLECTION_NAME,
+        query_vectors=query_vectors,
+        limit=num_retrieve_paper,
+    )
+    return [
+        point["payload"]["title"]
+        for result in response["result"]
+        for point in result["points"]
+    ]
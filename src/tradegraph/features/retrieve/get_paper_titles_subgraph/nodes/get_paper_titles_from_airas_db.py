@@ -1,8 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 from typing import Any
 
 import requests
 
+from tradegraph.features.retrieve.get_paper_titles_subgraph.nodes.conference_papers import (
+    MAX_FETCH_WORKERS,
+    make_session,
+)
+from tradegraph.utils.fast_json import json_loads
+
 logger = getLogger(__name__)
 
 DB_BASE_URL = "https://raw.githubusercontent.com/airas-org/airas-papers-db/main/data"
@@ -16,23 +23,34 @@ CONFERENCES_AND_YEARS = {
 }
 
 
+def _fetch_papers(session: requests.Session, url: str) -> list[dict[str, Any]]:
+    logger.info(f"Fetching paper data from {url}...")
+    try:
+        response = session.get(url, timeout=60)
+        response.raise_for_status()
+        # orjson.JSONDecodeError subclasses ValueError, handled below.
+        return json_loads(response.content)
+    except requests.exceptions.RequestException as e:
+        logger.error(f"  -> An error occurred while fetching data from {url}: {e}")
+    except ValueError as e:
+        logger.error(f"  -> Failed to parse JSON from {url}: {e}")
+    return []
+
+
 def _fetch_all_papers() -> list[dict[str, Any]]:
+    urls = [
+        f"{DB_BASE_URL}/{conference}/{year}.json"
+        for conference, years in CONFERENCES_AND_YEARS.items()
+        for year in years
+    ]
     all_papers = []
-    for conference, years in CONFERENCES_AND_YEARS.items():
-        for year in years:
-            url = f"{DB_BASE_URL}/{conference}/{year}.json"
-            logger.info(f"Fetching paper data from {url}...")
-            try:
-                response = requests.get(url, timeout=60)
-                response.raise_for_status()
-                papers = response.json()
-                all_papers.extend(papers)
-            except requests.exceptions.RequestException as e:
-                logger.error(
-                    f"  -> An error occurred while fetching data from {url}: {e}"
-                )
-            except ValueError as e:
-                logger.error(f"  -> Failed to parse JSON from {url}: {e}")
+    # Fetch every conference/year file concurrently over one pooled session;
+    # map() keeps the combined list in the same order as before.
+    with make_session() as session, ThreadPoolExecutor(
+        max_workers=MAX_FETCH_WORKERS
+    ) as executor:
+        for papers in executor.map(lambda url: _fetch_papers(session, url), urls):
+            all_papers.extend(papers)
     return all_papers
 
 
@@ -1,79 +1,60 @@
 import time
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 from typing import Any
 
 import requests
 
+from tradegraph.features.retrieve.get_paper_titles_subgraph.nodes.conference_papers import (
+    MAX_FETCH_WORKERS,
+    filter_papers_by_queries,
+    make_session,
+)
+from tradegraph.utils.fast_json import json_loads
+
 logger = getLogger(__name__)
 
 
+def _fetch_one_url(session: requests.Session, url: str) -> list[dict[str, Any]]:
+    logger.info(f"Fetching data from '{url}'...")
+    try:
+        response = session.get(url, timeout=60)
+        response.raise_for_status()
+        # keys: (['count', 'next', 'previous', 'results'])
+        data_dict = json_loads(response.content)
+        return data_dict.get("results", [])
+    except requests.exceptions.RequestException as e:
+        logger.error(
+            f"  -> An error occurred while fetching '{url}': {e}. Skipping this URL."
+        )
+    except Exception as e:
+        logger.error(
+            f"  -> An unexpected error occurred while processing '{url}': {e}. Skipping this URL."
+        )
+    return []
+
+
 def _load_papers_from_urls(json_urls: list[str]) -> list[dict[str, Any]]:
     combined_papers = []
     logger.info("Starting to load paper data...")
 
-    for url in json_urls:
-        logger.info(f"Fetching data from '{url}'...")
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-            data_dict = (
-                response.json()
-            )  # keys: (['count', 'next', 'previous', 'results'])
-
-            papers_from_this_url = data_dict.get("results", [])
-            combined_papers.extend(papers_from_this_url)
-
-        except requests.exceptions.RequestException as e:
-            logger.error(
-                f"  -> An error occurred while fetching '{url}': {e}. Skipping this URL."
-            )
-            continue
-        except Exception as e:
-            logger.error(
-                f"  -> An unexpected error occurred while processing '{url}': {e}. Skipping this URL."
-            )
-            continue
+    with make_session() as session, ThreadPoolExecutor(
+        max_workers=MAX_FETCH_WORKERS
+    ) as executor:
+        for papers in executor.map(
+            lambda url: _fetch_one_url(session, url), json_urls
+        ):
+            combined_papers.extend(papers)
 
     return combined_papers
 
 
-def _apply_filters_by_queries(
-    papers: list[dict[str, Any]], queries: list[str]
-) -> list[dict[str, Any]]:
-    active_queries = [q.lower() for q in queries if q and not q.isspace()]
-
-    if not active_queries:
-        return papers
-
-    filtered_list = []
-    for paper in papers:
-        # authors_fullnames = [author.get('fullname', '') for author in paper.get('authors', [])]
-
-        searchable_text = " ".join(
-            [
-                paper.get("name", ""),
-                # paper.get('abstract', ''),
-                # " ".join(authors_fullnames),
-                # " ".join(paper.get('keywords', []))
-            ]
-        ).lower()
-
-        if all(query in searchable_text for query in active_queries):
-            filtered_list.append(paper)
-
-    return filtered_list
-
-
 def get_paper_titles_from_url(json_urls: list[str], queries: list[str]) -> list[str]:
     all_papers = _load_papers_from_urls(json_urls)
     if not all_papers:
         return []
 
-    poster_papers = [
-        paper for paper in all_papers if paper.get("eventtype") == "Poster"
-    ]
-
-    filtered_papers = _apply_filters_by_queries(poster_papers, queries)
+    filtered_papers = filter_papers_by_queries(all_papers, queries, eventtype="Poster")
     filtered_titles = [paper.get("name", "No Title Found") for paper in filtered_papers]
 
     return filtered_titles
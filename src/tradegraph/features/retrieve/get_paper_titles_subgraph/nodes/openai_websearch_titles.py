@@ -1,25 +1,24 @@
 import logging
 from typing import Annotated
 
-from jinja2 import Environment
 from pydantic import Field
 
+from tradegraph.features.retrieve.get_paper_titles_subgraph.nodes.conference_papers import (
+    is_excluded_title,
+)
 from tradegraph.services.api_client.llm_client.llm_facade_client import (
     LLM_MODEL,
     LLMFacadeClient,
 )
+from tradegraph.utils.llm_cache import (
+    get_default_cache,
+    llm_cache_enabled,
+    make_cache_key,
+)
+from tradegraph.utils.template_cache import compile_template
 
 logger = logging.getLogger(__name__)
 
-_EXCLUDE_KEYWORDS = ("survey", "review", "overview", "systematic review")
-
-
-def _is_excluded_title(title: str) -> bool:
-    """Check if title contains excluded keywords."""
-    lowered = title.lower()
-    return any(word in lowered for word in _EXCLUDE_KEYWORDS)
-
-
 def openai_websearch_titles(
     prompt_template: str,
     queries: list[str],
@@ -28,12 +27,27 @@ def openai_websearch_titles(
     # sleep_sec: float = 60.0,
     conference_preference: str | None = None,
     client: LLMFacadeClient | None = None,
+    cache_ttl_seconds: float | None = None,
 ) -> list[str] | None:
+    """Collect paper titles via OpenAI web search.
+
+    Search results go stale, so caching is opt-in: with `cache_ttl_seconds`
+    set, the titles found for an identical query are reused for that long.
+    """
     client = client or LLMFacadeClient(llm_name=llm_name)
 
-    env = Environment()
-    template = env.from_string(prompt_template)
+    template = compile_template(prompt_template)
     collected: set[str] = set()
+    # Cached per query: everything else that shapes the prompt is in the namespace.
+    namespace = make_cache_key(
+        "openai_websearch_titles",
+        llm_name,
+        prompt_template,
+        str(max_results),
+        str(conference_preference),
+    )
+    use_cache = cache_ttl_seconds is not None and llm_cache_enabled()
+    cache = get_default_cache() if use_cache else None
 
     for _i, query in enumerate(queries):
         logger.info(f"Searching papers with OpenAI web search for query: '{query}'")
@@ -45,23 +59,31 @@ def openai_websearch_titles(
         }
         prompt = template.render(data)
 
-        try:
-            output, cost = client.web_search(message=prompt)
-        except Exception as exc:
-            logger.warning(f"OpenAI web search failed for '{query}': {exc}")
-            continue
+        cache_key = make_cache_key(namespace, query)
+        titles = cache.get(cache_key, max_age=cache_ttl_seconds) if cache else None
+        if titles is None:
+            try:
+                output, cost = client.web_search(message=prompt)
+            except Exception as exc:
+                logger.warning(f"OpenAI web search failed for '{query}': {exc}")
+                continue
+
+            if not output:
+                logger.warning(f"No response for query: '{query}'")
+                continue
 
-        if not output:
-            logger.warning(f"No response for query: '{query}'")
-            continue
+            titles = output.get("titles", [])
+            if cache is not None and titles:
+                cache.set(cache_key, titles)
 
-        titles = output.get("titles", [])
         for title in titles:
             title = title.strip()
-            if title and not _is_excluded_title(title):
+            if title and title not in collected and not is_excluded_title(title):
                 collected.add(title)
                 if len(collected) >= max_results:
-                    return sorted(collected)
+                    break
+        if len(collected) >= max_results:
+            break
 
         # if i < len(queries) - 1:
         #     logger.info(f"Waiting {sleep_sec} seconds before next query...")
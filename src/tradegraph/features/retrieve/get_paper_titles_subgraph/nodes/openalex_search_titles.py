@@ -1,19 +1,14 @@
 import logging
 from time import sleep
 
+from tradegraph.features.retrieve.get_paper_titles_subgraph.nodes.conference_papers import (
+    is_excluded_title,
+)
 from tradegraph.services.api_client.openalex_client import OpenAlexClient
 
 logger = logging.getLogger(__name__)
 
 
-_EXCLUDE_KEYWORDS = ("survey", "review", "overview", "systematic review")
-
-
-def _is_excluded_title(title: str) -> bool:
-    lowered = title.lower()
-    return any(word in lowered for word in _EXCLUDE_KEYWORDS)
-
-
 def openalex_search_titles(
     queries: list[str],
     *,
@@ -52,7 +47,7 @@ def openalex_search_titles(
 
             for item in results:
                 title = item.get("display_name", "").strip()
-                if title and not _is_excluded_title(title):
+                if title and not is_excluded_title(title):
                     collected.add(title)
                     if len(collected) >= max_results:
                         return sorted(collected)
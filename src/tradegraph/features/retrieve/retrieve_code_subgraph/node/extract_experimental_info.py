@@ -1,4 +1,3 @@
-from jinja2 import Environment
 from pydantic import BaseModel
 
 from tradegraph.services.api_client.llm_client.llm_facade_client import (
@@ -6,6 +5,8 @@ from tradegraph.services.api_client.llm_client.llm_facade_client import (
     LLMFacadeClient,
 )
 from tradegraph.types.paper import CandidatePaperInfo
+from tradegraph.utils.llm_cache import llm_cache
+from tradegraph.utils.template_cache import compile_template
 
 
 class LLMOutput(BaseModel):
@@ -13,6 +14,9 @@ class LLMOutput(BaseModel):
     extract_info: str
 
 
+# Exact-match only: the prompt embeds the repository contents, so a "similar"
+# prompt can still describe different code.
+@llm_cache(LLMOutput)
 def extract_experimental_info(
     llm_name: LLM_MODEL,
     method_text: CandidatePaperInfo,
@@ -23,8 +27,7 @@ def extract_experimental_info(
     if client is None:
         client = LLMFacadeClient(llm_name=llm_name)
 
-    env = Environment()
-    template = env.from_string(prompt_template)
+    template = compile_template(prompt_template)
     data = {
         "method_text": method_text,
         "repository_content_str": repository_content_str,
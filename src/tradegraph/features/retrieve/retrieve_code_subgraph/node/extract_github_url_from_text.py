@@ -1,8 +1,8 @@
 import re
+import threading
 from logging import getLogger
 from urllib.parse import urlparse
 
-from jinja2 import Environment
 from pydantic import BaseModel
 
 from tradegraph.services.api_client.github_client import GithubClient
@@ -10,9 +10,16 @@ from tradegraph.services.api_client.llm_client.llm_facade_client import (
     LLM_MODEL,
     LLMFacadeClient,
 )
+from tradegraph.utils.template_cache import compile_template
 
 logger = getLogger(__name__)
 
+_GITHUB_URL_RE = re.compile(r"https?://github\.com/[\w\-\_]+/[\w\-\_]+")
+
+_REPO_EXISTS_MAXSIZE = 1024
+_REPO_EXISTS: dict[tuple[str, str], bool] = {}
+_REPO_EXISTS_LOCK = threading.Lock()
+
 
 class LLMOutput(BaseModel):
     index: int | None
@@ -22,12 +29,11 @@ def _extract_github_urls_from_text(
     paper_full_text: str, github_client: GithubClient
 ) -> list[str]:
     try:
-        matches = re.findall(
-            r"https?://github\.com/[\w\-\_]+/[\w\-\_]+", paper_full_text
-        )
+        matches = _GITHUB_URL_RE.findall(paper_full_text)
+        # Papers often repeat the same link; probe each distinct URL once.
+        urls = dict.fromkeys(url.replace("http://", "https://") for url in matches)
         valid_urls: list[str] = []
-        for url in matches:
-            url = url.replace("http://", "https://")
+        for url in urls:
             if _is_valid_github_url(url, github_client):
                 valid_urls.append(url)
         return valid_urls
@@ -44,20 +50,36 @@ def _is_valid_github_url(github_url: str, github_client: GithubClient) -> bool:
     github_owner, repository_name = parts[0], parts[1]
 
     try:
-        info = github_client.get_repository(github_owner, repository_name)
-        return info is not None
+        return _repo_exists(github_client, github_owner, repository_name)
     except Exception:
         return False
 
 
+def _repo_exists(
+    github_client: GithubClient, github_owner: str, repository_name: str
+) -> bool:
+    # Keyed on the repository alone so answers are shared across clients and
+    # subgraph runs. Errors propagate and are therefore not cached.
+    key = (github_owner.lower(), repository_name.lower())
+    with _REPO_EXISTS_LOCK:
+        if key in _REPO_EXISTS:
+            return _REPO_EXISTS[key]
+
+    exists = github_client.get_repository(github_owner, repository_name) is not None
+    with _REPO_EXISTS_LOCK:
+        if len(_REPO_EXISTS) >= _REPO_EXISTS_MAXSIZE:
+            _REPO_EXISTS.pop(next(iter(_REPO_EXISTS)))
+        _REPO_EXISTS[key] = exists
+    return exists
+
+
 def _select_github_url(
     paper_summary: str,
     candidates: list[str],
     prompt_template: str,
     llm_client: LLMFacadeClient,
 ) -> int | None:
-    env = Environment()
-    template = env.from_string(prompt_template)
+    template = compile_template(prompt_template)
     data = {
         "paper_summary": paper_summary,
         "extract_github_url_list": candidates,
@@ -1,15 +1,72 @@
+import hashlib
 import logging
+import os
 import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
-from tradegraph.services.api_client.github_client import GithubClient
+from tradegraph.services.api_client.github_client import (
+    MAX_PARALLEL_REQUESTS,
+    GithubClient,
+)
 from tradegraph.utils.logging_utils import setup_logging
 
 setup_logging()
 logger = logging.getLogger(__name__)
 
+_GITHUB_REPO_RE = re.compile(r"https://github\.com/([^/]+)/([^/]+)")
 
-def retrieve_repository_contents(github_url: str) -> str:
-    match = re.match(r"https://github\.com/([^/]+)/([^/]+)", github_url)
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "tradegraph", "github"
+)
+
+
+def _read_cached_blob(cache_dir: str, blob_sha: str) -> bytes | None:
+    blob_path = os.path.join(cache_dir, f"{blob_sha}.bin")
+    if not os.path.exists(blob_path):
+        return None
+    try:
+        with open(blob_path, "rb") as f:
+            return f.read()
+    except Exception as e:
+        logger.warning(f"Failed to read cached blob: {e}")
+        return None
+
+
+def _git_blob_sha(file_bytes: bytes) -> str:
+    header = f"blob {len(file_bytes)}\0".encode("ascii")
+    return hashlib.sha1(header + file_bytes).hexdigest()
+
+
+def _write_cached_blob(cache_dir: str, blob_sha: str, file_bytes: bytes) -> None:
+    # The raw download is taken at the branch ref, which may have moved since
+    # the tree was read; only bytes that hash to the tree's SHA are cached.
+    if _git_blob_sha(file_bytes) != blob_sha:
+        logger.info(f"Blob {blob_sha} changed since the tree was read; not caching")
+        return
+    blob_path = os.path.join(cache_dir, f"{blob_sha}.bin")
+    tmp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # A unique temp file per writer: threads fetching identical files
+        # write the same SHA concurrently.
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(file_bytes)
+        os.replace(tmp_path, blob_path)
+    except Exception as e:
+        logger.warning(f"Failed to save blob cache: {e}")
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _format_file(file_path: str, file_bytes: bytes) -> str:
+    content_str = file_bytes.decode("utf-8", errors="replace")
+    return f"File Path: {file_path}\nContent:\n{content_str}"
+
+
+def retrieve_repository_contents(github_url: str, cache_dir: str | None = None) -> str:
+    match = _GITHUB_REPO_RE.match(github_url)
     if not match:
         raise ValueError(f"Invalid GitHub URL: {github_url}")
     github_owner, repository_name = match.group(1), match.group(2)
@@ -33,25 +90,48 @@ def retrieve_repository_contents(github_url: str) -> str:
     if repository_tree_info is None:
         return ""
 
-    file_paths = [
-        entry.get("path", "")
+    # The recursive tree already carries each blob's SHA, so no Contents API
+    # call is needed per file.
+    file_entries = [
+        (entry.get("path", ""), entry.get("sha"))
         for entry in repository_tree_info["tree"]
-        if entry.get("path", "").endswith((".py", ".ipynb"))
+        if entry.get("type", "blob") == "blob"
+        and entry.get("path", "").endswith((".py", ".ipynb"))
     ]
 
-    contents = []
-    for file_path in file_paths:
-        file_bytes = client.get_repository_content(
-            github_owner=github_owner,
-            repository_name=repository_name,
-            file_path=file_path,
-        )
+    # Blobs are content-addressed, so a file cached under its SHA is valid
+    # for any branch or repository that contains the same content.
+    cache_dir = cache_dir or os.getenv("TRADEGRAPH_GITHUB_CACHE_DIR", DEFAULT_CACHE_DIR)
+
+    def _fetch(file_entry: tuple[str, str | None]) -> str | None:
+        file_path, blob_sha = file_entry
+        file_bytes = _read_cached_blob(cache_dir, blob_sha) if blob_sha else None
+        if file_bytes is not None:
+            return _format_file(file_path, file_bytes)
+
+        try:
+            file_bytes = client.download_raw_file(
+                github_owner=github_owner,
+                repository_name=repository_name,
+                ref=default_branch,
+                file_path=file_path,
+            )
+            if file_bytes is None and blob_sha:
+                file_bytes = client.get_blob(github_owner, repository_name, blob_sha)
+        except Exception as e:
+            logger.warning(f"Failed to retrieve file data: {file_path}: {e}")
+            return None
         if file_bytes is None:
             logger.warning(f"Failed to retrieve file data: {file_path}")
-            continue
-        try:
-            content_str = file_bytes.decode("utf-8")
-        except AttributeError:
-            content_str = str(file_bytes)
-        contents.append(f"File Path: {file_path}\nContent:\n{content_str}")
+            return None
+        if blob_sha:
+            _write_cached_blob(cache_dir, blob_sha, file_bytes)
+        return _format_file(file_path, file_bytes)
+
+    # Files are independent requests; fetch them concurrently over the
+    # client's pooled session. map() keeps the tree order in the output.
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+        contents = [
+            content for content in executor.map(_fetch, file_entries) if content
+        ]
     return "\n".join(contents)
@@ -1,5 +1,6 @@
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, cast
 
 from langgraph.graph import END, START, StateGraph
@@ -64,19 +65,31 @@ class RetrieveCodeSubgraph(BaseSubgraph):
     def __init__(
         self,
         llm_name: LLM_MODEL = "gemini-2.0-flash-001",
+        max_workers: int = 8,
     ):
         check_api_key(llm_api_key_check=True)
         self.llm_name = llm_name
+        # Studies are independent, so their LLM calls run concurrently; the
+        # LLM client's own semaphore still caps in-flight requests.
+        self.max_workers = max_workers
 
     def _extract_github_url_from_text(self, state: RetrieveCodeState) -> dict:
         research_study_list = state["research_study_list"]
-        for research_study in research_study_list:
-            github_url = extract_github_url_from_text(
+
+        def _extract(research_study: dict[str, Any]) -> str:
+            return extract_github_url_from_text(
                 paper_full_text=research_study["full_text"],
                 paper_summary=research_study["llm_extracted_info"]["methodology"],
                 llm_name=cast(LLM_MODEL, self.llm_name),
                 prompt_template=extract_github_url_from_text_prompt,
             )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            github_urls = list(executor.map(_extract, research_study_list))
+
+        for research_study, github_url in zip(
+            research_study_list, github_urls, strict=True
+        ):
             research_study["meta_data"] = {}
             research_study["meta_data"]["github_url"] = github_url
         return {
@@ -100,19 +113,28 @@ class RetrieveCodeSubgraph(BaseSubgraph):
     def _extract_experimental_info(self, state: RetrieveCodeState) -> dict:
         code_str_list = state["code_str_list"]
         research_study_list = state["research_study_list"]
-        for code_str, research_study in zip(
-            code_str_list, research_study_list, strict=True
-        ):
+
+        def _extract(pair: tuple[str, dict[str, Any]]) -> tuple[str, str] | None:
+            code_str, research_study = pair
             if code_str == "":
+                return None
+            return extract_experimental_info(
+                llm_name=cast(LLM_MODEL, self.llm_name),
+                method_text=research_study["llm_extracted_info"]["methodology"],
+                repository_content_str=code_str,
+                prompt_template=extract_experimental_info_prompt,
+            )
+
+        pairs = list(zip(code_str_list, research_study_list, strict=True))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(_extract, pairs))
+
+        for research_study, result in zip(research_study_list, results, strict=True):
+            if result is None:
                 research_study["experimental_code"] = ""
                 research_study["experimental_info"] = ""
             else:
-                extract_code, experimental_info = extract_experimental_info(
-                    llm_name=cast(LLM_MODEL, self.llm_name),
-                    method_text=research_study["llm_extracted_info"]["methodology"],
-                    repository_content_str=code_str,
-                    prompt_template=extract_experimental_info_prompt,
-                )
+                extract_code, experimental_info = result
                 research_study["llm_extracted_info"]["experimental_code"] = extract_code
                 research_study["llm_extracted_info"]["experimental_info"] = (
                     experimental_info
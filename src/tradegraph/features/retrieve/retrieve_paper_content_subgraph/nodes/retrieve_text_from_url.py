@@ -7,10 +7,41 @@ from urllib.parse import urlparse
 import requests
 from langchain_community.document_loaders import PyPDFLoader
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # pypdfium2 is optional; fall back to the pure-Python pypdf
+    pdfium = None
+
 logger = getLogger(__name__)
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+_ARXIV_ABS_RE = re.compile(r"^https?://arxiv\.org/abs/")
+_CACHE_KEY_SAN_RE = re.compile(r"[^\w_-]")
+
+
+def _extract_text_with_pdfium(pdf_path: str) -> str:
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        texts = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            # PDFium separates lines with CRLF; drop both like the pypdf path.
+            text = textpage.get_text_range()
+            texts.append(text.replace("\r", "").replace("\n", ""))
+            textpage.close()
+            page.close()
+        return "".join(texts)
+    finally:
+        pdf.close()
+
 
 def _extract_text_from_pdf(pdf_path: str) -> str | None:
+    if pdfium is not None:
+        try:
+            return _extract_text_with_pdfium(pdf_path)
+        except Exception as e:
+            logger.warning(f"pypdfium2 failed on {pdf_path}, retrying with pypdf: {e}")
     try:
         loader = PyPDFLoader(pdf_path)
         pages = loader.load_and_split()
@@ -32,13 +63,13 @@ def retrieve_text_from_url(
     parsed_url = urlparse(pdf_url)
     if "arxiv.org" in pdf_url:
         # Extract ArXiv ID for better cache key
-        arxiv_id = re.sub(r"^https?://arxiv\.org/abs/", "", pdf_url)
+        arxiv_id = _ARXIV_ABS_RE.sub("", pdf_url)
         cache_key = f"arxiv_{arxiv_id}"
     else:
         # Use URL-based cache key for non-ArXiv URLs
         cache_key = f"pdf_{parsed_url.netloc}_{parsed_url.path.replace('/', '_')}"
         # Clean up the cache key
-        cache_key = re.sub(r"[^\w_-]", "_", cache_key)
+        cache_key = _CACHE_KEY_SAN_RE.sub("_", cache_key)
 
     text_path = os.path.join(papers_dir, f"{cache_key}.txt")
     pdf_path = os.path.join(papers_dir, f"{cache_key}.pdf")
@@ -65,8 +96,11 @@ def retrieve_text_from_url(
         response.raise_for_status()
 
         os.makedirs(papers_dir, exist_ok=True)
+        # Let urllib3 undo any Content-Encoding and copy in 1 MiB blocks
+        # rather than copyfileobj's small default buffer.
+        response.raw.decode_content = True
         with open(pdf_path, "wb") as fp:
-            shutil.copyfileobj(response.raw, fp)
+            shutil.copyfileobj(response.raw, fp, length=DOWNLOAD_CHUNK_SIZE)
         logger.info(f"Downloaded PDF from {pdf_url} to {pdf_path}")
 
     except Exception as e:
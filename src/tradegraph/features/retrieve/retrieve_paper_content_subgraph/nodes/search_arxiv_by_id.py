@@ -1,59 +1,128 @@
+from io import BytesIO
 from logging import getLogger
 from typing import Any
 
 import feedparser
 
-from tradegraph.services.api_client.arxiv_client import ArxivClient
+from tradegraph.services.api_client.arxiv_client import (
+    MAX_ID_LIST_SIZE,
+    ArxivClient,
+    base_arxiv_id,
+)
 from tradegraph.services.api_client.retry_policy import (
     HTTPClientFatalError,
     HTTPClientRetryableError,
 )
 from tradegraph.types.arxiv import ArxivInfo
+from tradegraph.utils.llm_cache import API_CACHE_MAX_AGE, get_api_cache
+
+try:
+    from lxml import etree
+except ImportError:  # lxml is optional; fall back to feedparser
+    etree = None
 
 logger = getLogger(__name__)
 
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ARXIV = "{http://arxiv.org/schemas/atom}"
+
 
 class ArxivPaperNormalizer:
     def __init__(self, client: ArxivClient | None = None):
         self.client = client or ArxivClient()
 
     def _validate_entry(self, entry: Any) -> ArxivInfo | None:
-        if not hasattr(entry, "id"):
+        # FeedParserDict supports plain dict lookups, which avoid the
+        # attribute-to-key mapping and exception probing of hasattr/getattr.
+        entry_id = entry.get("id")
+        if not entry_id:
             return None
 
-        arxiv_id = entry.id.split("/")[-1]
+        arxiv_id = _id_from_entry_id(entry_id)
+
+        doi = entry.get("arxiv_doi")
+        if doi is None:
+            doi = next(
+                (
+                    link.get("href", "").replace("http://dx.doi.org/", "")
+                    for link in entry.get("links") or ()
+                    if link.get("title") == "doi"
+                ),
+                None,
+            )
+
+        authors = entry.get("authors") or ()
+        affiliations = [
+            author["arxiv_affiliation"]
+            for author in authors
+            if "arxiv_affiliation" in author
+        ]
+
+        return ArxivInfo(
+            id=arxiv_id,
+            url=f"https://arxiv.org/abs/{arxiv_id}",
+            title=entry.get("title") or "No Title",
+            authors=[author.get("name", "") for author in authors],
+            published_date=entry.get("published", ""),
+            summary=entry.get("summary", ""),
+            journal=entry.get("arxiv_journal_ref"),
+            doi=doi,
+            affiliation=", ".join(affiliations) if affiliations else None,
+        )
+
+    def _validate_element(self, entry: Any) -> ArxivInfo | None:
+        entry_id = entry.findtext(f"{_ATOM}id")
+        if not entry_id:
+            return None
 
-        doi = None
-        if hasattr(entry, "arxiv_doi"):
-            doi = entry.arxiv_doi
-        elif hasattr(entry, "links"):
-            for link in entry.links:
+        arxiv_id = _id_from_entry_id(entry_id)
+
+        doi = entry.findtext(f"{_ARXIV}doi")
+        if doi is None:
+            for link in entry.iterfind(f"{_ATOM}link"):
                 if link.get("title") == "doi":
                     doi = link.get("href", "").replace("http://dx.doi.org/", "")
                     break
 
-        journal_ref = None
-        if hasattr(entry, "arxiv_journal_ref"):
-            journal_ref = entry.arxiv_journal_ref
-
+        authors = []
         affiliations = []
-        if hasattr(entry, "authors"):
-            for author in entry.authors:
-                if hasattr(author, "arxiv_affiliation"):
-                    affiliations.append(author.arxiv_affiliation)
+        for author in entry.iterfind(f"{_ATOM}author"):
+            authors.append((author.findtext(f"{_ATOM}name") or "").strip())
+            affiliations.extend(
+                (affiliation.text or "").strip()
+                for affiliation in author.iterfind(f"{_ARXIV}affiliation")
+            )
 
         return ArxivInfo(
             id=arxiv_id,
             url=f"https://arxiv.org/abs/{arxiv_id}",
-            title=entry.title or "No Title",
-            authors=[a.name for a in getattr(entry, "authors", [])],
-            published_date=entry.published if hasattr(entry, "published") else "",
-            summary=getattr(entry, "summary", ""),
-            journal=journal_ref,  # Use journal_ref instead of None
+            title=(entry.findtext(f"{_ATOM}title") or "").strip() or "No Title",
+            authors=authors,
+            published_date=(entry.findtext(f"{_ATOM}published") or "").strip(),
+            summary=(entry.findtext(f"{_ATOM}summary") or "").strip(),
+            journal=entry.findtext(f"{_ARXIV}journal_ref"),
             doi=doi,
             affiliation=", ".join(affiliations) if affiliations else None,
         )
 
+    def _parse_feed(self, xml_feed: str | bytes) -> list[ArxivInfo]:
+        if etree is None:
+            feed = feedparser.parse(xml_feed)
+            return [p for entry in feed.entries if (p := self._validate_entry(entry))]
+
+        if isinstance(xml_feed, str):
+            xml_feed = xml_feed.encode("utf-8")
+        # Stream over <entry> elements with libxml2 instead of feedparser,
+        # whose HTML sanitizing dominates parse time and is not needed here.
+        papers = []
+        for _, entry in etree.iterparse(
+            BytesIO(xml_feed), events=("end",), tag=f"{_ATOM}entry"
+        ):
+            if paper := self._validate_element(entry):
+                papers.append(paper)
+            entry.clear()
+        return papers
+
     def get_by_id(self, arxiv_id: str) -> ArxivInfo | None:
         try:
             xml_feed = self.client.get_paper_by_id(arxiv_id=arxiv_id)
@@ -61,11 +130,45 @@ class ArxivPaperNormalizer:
             logger.warning(f"ArXiv API request failed: {e}")
             return None
 
-        feed = feedparser.parse(xml_feed)
-        for entry in feed.entries:
-            if paper := self._validate_entry(entry):
-                return paper
-        return None
+        papers = self._parse_feed(xml_feed)
+        return papers[0] if papers else None
+
+    def get_by_ids(self, arxiv_ids: list[str]) -> list[ArxivInfo | None]:
+        papers: list[ArxivInfo | None] = []
+        for i in range(0, len(arxiv_ids), MAX_ID_LIST_SIZE):
+            chunk = arxiv_ids[i : i + MAX_ID_LIST_SIZE]
+            try:
+                xml_feed = self.client.get_papers_by_ids(arxiv_ids=chunk)
+            except HTTPClientFatalError as e:
+                # One malformed ID rejects the whole query; isolate it.
+                logger.warning(f"ArXiv batch request failed, retrying per ID: {e}")
+                papers.extend(self.get_by_id(arxiv_id) for arxiv_id in chunk)
+                continue
+            except HTTPClientRetryableError as e:
+                logger.warning(f"ArXiv API request failed: {e}")
+                papers.extend([None] * len(chunk))
+                continue
+
+            # Entries carry versioned IDs; match them on the base ID.
+            by_base_id = {
+                base_arxiv_id(paper.id): paper for paper in self._parse_feed(xml_feed)
+            }
+            papers.extend(
+                by_base_id.get(base_arxiv_id(arxiv_id)) for arxiv_id in chunk
+            )
+        return papers
+
+
+def _id_from_entry_id(entry_id: str) -> str:
+    # Everything after /abs/, so old-style IDs keep their archive
+    # ("http://arxiv.org/abs/hep-th/9901001v1" -> "hep-th/9901001v1").
+    entry_id = entry_id.strip()
+    _, sep, arxiv_id = entry_id.partition("/abs/")
+    return arxiv_id if sep else entry_id.rsplit("/", 1)[-1]
+
+
+def _cache_key(arxiv_id: str) -> str:
+    return f"arxiv:{arxiv_id.strip()}"
 
 
 def search_arxiv_by_id(
@@ -75,12 +178,52 @@ def search_arxiv_by_id(
     if not arxiv_id.strip():
         return None
 
+    cache = get_api_cache()
+    if cache is not None and (
+        cached := cache.get(_cache_key(arxiv_id), max_age=API_CACHE_MAX_AGE)
+    ):
+        return cached
+
     normalizer = ArxivPaperNormalizer(client)
     paper = normalizer.get_by_id(arxiv_id.strip())
+    if not paper:
+        return None
 
-    if paper:
-        return paper.model_dump()
-    return None
+    result = paper.model_dump()
+    if cache is not None:
+        cache.set(_cache_key(arxiv_id), result)
+    return result
+
+
+def search_arxiv_by_ids(
+    arxiv_ids: list[str],
+    client: ArxivClient | None = None,
+) -> list[dict | None]:
+    """Batch variant of `search_arxiv_by_id`; results follow `arxiv_ids` order."""
+    results: list[dict | None] = [None] * len(arxiv_ids)
+    cache = get_api_cache()
+
+    positions = []
+    for i, arxiv_id in enumerate(arxiv_ids):
+        if not arxiv_id.strip():
+            continue
+        if cache is not None and (
+            cached := cache.get(_cache_key(arxiv_id), max_age=API_CACHE_MAX_AGE)
+        ):
+            results[i] = cached
+        else:
+            positions.append(i)
+    if not positions:
+        return results
+
+    normalizer = ArxivPaperNormalizer(client)
+    papers = normalizer.get_by_ids([arxiv_ids[i].strip() for i in positions])
+    for i, paper in zip(positions, papers):
+        if paper:
+            results[i] = paper.model_dump()
+            if cache is not None:
+                cache.set(_cache_key(arxiv_ids[i]), results[i])
+    return results
 
 
 if __name__ == "__main__":
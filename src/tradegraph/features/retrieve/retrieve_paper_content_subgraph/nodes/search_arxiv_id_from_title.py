@@ -1,14 +1,25 @@
+import asyncio
 import logging
+import re
 
-from jinja2 import Environment
 
 from tradegraph.services.api_client.llm_client.llm_facade_client import (
     LLM_MODEL,
     LLMFacadeClient,
 )
+from tradegraph.utils.rate_limiter import estimate_tokens, get_token_bucket
+from tradegraph.utils.template_cache import compile_template
 
 logger = logging.getLogger(__name__)
 
+_ARXIV_URL_ID_RE = re.compile(r"arxiv\.org/(?:abs|pdf)/(\d{4}\.\d{4,5}(?:v\d+)?)")
+
+
+def extract_arxiv_id_from_url(url: str) -> str | None:
+    if match := _ARXIV_URL_ID_RE.search(url):
+        return match.group(1)
+    return None
+
 
 def search_arxiv_id_from_title(
     llm_name: LLM_MODEL,
@@ -19,8 +30,7 @@ def search_arxiv_id_from_title(
 ) -> str | None:
     client = client or LLMFacadeClient(llm_name=llm_name)
 
-    env = Environment()
-    template = env.from_string(prompt_template)
+    template = compile_template(prompt_template)
 
     logger.info(f"OpenAI web search for title: '{title}'")
     data = {
@@ -49,6 +59,24 @@ def search_arxiv_id_from_title(
     return arxiv_id
 
 
+async def asearch_arxiv_id_from_title(
+    llm_name: LLM_MODEL,
+    prompt_template: str,
+    title: str,
+    conference_preference: str | None = None,
+    client: LLMFacadeClient | None = None,
+) -> str | None:
+    await get_token_bucket(llm_name).acquire(estimate_tokens(prompt_template, title))
+    return await asyncio.to_thread(
+        search_arxiv_id_from_title,
+        llm_name=llm_name,
+        prompt_template=prompt_template,
+        title=title,
+        conference_preference=conference_preference,
+        client=client,
+    )
+
+
 if __name__ == "__main__":
     from tradegraph.features.retrieve.retrieve_paper_content_subgraph.prompt.openai_websearch_arxiv_ids_prompt import (
         openai_websearch_arxiv_ids_prompt,
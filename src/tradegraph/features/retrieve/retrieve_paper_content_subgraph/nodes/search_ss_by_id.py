@@ -7,8 +7,12 @@ from tradegraph.services.api_client.retry_policy import (
     HTTPClientFatalError,
     HTTPClientRetryableError,
 )
-from tradegraph.services.api_client.semantic_scholar_client import SemanticScholarClient
+from tradegraph.services.api_client.semantic_scholar_client import (
+    MAX_BATCH_SIZE,
+    SemanticScholarClient,
+)
 from tradegraph.types.semantic_scholar import SemanticScholarInfo
+from tradegraph.utils.llm_cache import API_CACHE_MAX_AGE, get_api_cache
 
 logger = getLogger(__name__)
 
@@ -45,21 +49,7 @@ class SemanticScholarPaperNormalizer:
 
     def get_by_arxiv_id(self, arxiv_id: str) -> SemanticScholarInfo | None:
         try:
-            fields = (
-                "paperId",
-                "title",
-                "abstract",
-                "year",
-                "authors",
-                "venue",
-                "externalIds",
-                "openAccessPdf",
-            )
-
-            response_data = self.client.get_paper_by_arxiv_id(
-                arxiv_id=arxiv_id,
-                fields=fields,
-            )
+            response_data = self.client.get_paper_by_arxiv_id(arxiv_id=arxiv_id)
         except (HTTPClientRetryableError, HTTPClientFatalError) as e:
             logger.warning(f"Semantic Scholar API request failed: {e}")
             return None
@@ -69,6 +59,36 @@ class SemanticScholarPaperNormalizer:
 
         return self._validate_entry(response_data)
 
+    def get_by_arxiv_ids(
+        self, arxiv_ids: list[str]
+    ) -> list[SemanticScholarInfo | None]:
+        papers: list[SemanticScholarInfo | None] = []
+        for i in range(0, len(arxiv_ids), MAX_BATCH_SIZE):
+            chunk = arxiv_ids[i : i + MAX_BATCH_SIZE]
+            try:
+                response_data = self.client.get_papers_by_arxiv_ids_batch(
+                    arxiv_ids=chunk
+                )
+            except (HTTPClientRetryableError, HTTPClientFatalError) as e:
+                if e.status_code == 413:
+                    # Payload too large for the batch endpoint; look up one by one.
+                    papers.extend(self.get_by_arxiv_id(arxiv_id) for arxiv_id in chunk)
+                else:
+                    logger.warning(f"Semantic Scholar batch request failed: {e}")
+                    papers.extend([None] * len(chunk))
+                continue
+
+            # The API answers positionally, with null for unknown IDs.
+            papers.extend(
+                self._validate_entry(entry) if entry else None
+                for entry in response_data
+            )
+        return papers
+
+
+def _cache_key(arxiv_id: str) -> str:
+    return f"semantic_scholar:{arxiv_id.strip()}"
+
 
 def search_ss_by_id(
     arxiv_id: str,
@@ -77,12 +97,52 @@ def search_ss_by_id(
     if not arxiv_id.strip():
         return None
 
+    cache = get_api_cache()
+    if cache is not None and (
+        cached := cache.get(_cache_key(arxiv_id), max_age=API_CACHE_MAX_AGE)
+    ):
+        return cached
+
     normalizer = SemanticScholarPaperNormalizer(client)
     paper = normalizer.get_by_arxiv_id(arxiv_id.strip())
+    if not paper:
+        return None
+
+    result = paper.model_dump()
+    if cache is not None:
+        cache.set(_cache_key(arxiv_id), result)
+    return result
 
-    if paper:
-        return paper.model_dump()
-    return None
+
+def search_ss_by_ids(
+    arxiv_ids: list[str],
+    client: SemanticScholarClient | None = None,
+) -> list[dict | None]:
+    """Batch variant of `search_ss_by_id`; results follow the order of `arxiv_ids`."""
+    results: list[dict | None] = [None] * len(arxiv_ids)
+    cache = get_api_cache()
+
+    positions = []
+    for i, arxiv_id in enumerate(arxiv_ids):
+        if not arxiv_id.strip():
+            continue
+        if cache is not None and (
+            cached := cache.get(_cache_key(arxiv_id), max_age=API_CACHE_MAX_AGE)
+        ):
+            results[i] = cached
+        else:
+            positions.append(i)
+    if not positions:
+        return results
+
+    normalizer = SemanticScholarPaperNormalizer(client)
+    papers = normalizer.get_by_arxiv_ids([arxiv_ids[i].strip() for i in positions])
+    for i, paper in zip(positions, papers):
+        if paper:
+            results[i] = paper.model_dump()
+            if cache is not None:
+                cache.set(_cache_key(arxiv_ids[i]), results[i])
+    return results
 
 
 if __name__ == "__main__":
@@ -1,7 +1,9 @@
+import asyncio
+import inspect
 import json
 import logging
 import os
-from typing import Literal, Any
+from typing import Any, Callable, Literal
 
 from langgraph.graph import END, START, StateGraph
 # In newer langgraph, compiled graphs are returned by StateGraph.compile()
@@ -15,13 +17,14 @@ from tradegraph.features.retrieve.retrieve_paper_content_subgraph.nodes.retrieve
     retrieve_text_from_url,
 )
 from tradegraph.features.retrieve.retrieve_paper_content_subgraph.nodes.search_arxiv_by_id import (
-    search_arxiv_by_id,
+    search_arxiv_by_ids,
 )
 from tradegraph.features.retrieve.retrieve_paper_content_subgraph.nodes.search_arxiv_id_from_title import (
-    search_arxiv_id_from_title,
+    asearch_arxiv_id_from_title,
+    extract_arxiv_id_from_url,
 )
 from tradegraph.features.retrieve.retrieve_paper_content_subgraph.nodes.search_ss_by_id import (
-    search_ss_by_id,
+    search_ss_by_ids,
 )
 from tradegraph.features.retrieve.retrieve_paper_content_subgraph.prompt.openai_websearch_arxiv_ids_prompt import (
     openai_websearch_arxiv_ids_prompt,
@@ -71,13 +74,37 @@ class RetrievePaperContentSubgraph(BaseSubgraph):
         save_dir: str,
         target_study_list_source: UsedStudyListSource,
         paper_provider: str = "arxiv",
+        max_concurrency: int = 8,
     ):
         self.save_dir = save_dir
         self.papers_dir = os.path.join(self.save_dir, "papers")
         self.paper_provider = paper_provider
         self.target_study_list_source = target_study_list_source
+        # Upper bound on concurrent per-paper API requests.
+        self.max_concurrency = max_concurrency
         os.makedirs(self.papers_dir, exist_ok=True)
 
+    async def _gather_bounded(
+        self, func: Callable[[str], Any], args: list[str]
+    ) -> list[Any]:
+        # Blocking lookups run on worker threads; either way at most
+        # max_concurrency calls are in flight at once.
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        is_async = inspect.iscoroutinefunction(func)
+
+        async def _call(arg: str) -> Any:
+            async with semaphore:
+                if is_async:
+                    return await func(arg)
+                return await asyncio.to_thread(func, arg)
+
+        # Reference lists often repeat a paper; each distinct argument is
+        # looked up once and its result shared by every occurrence.
+        unique_args = list(dict.fromkeys(args))
+        results = await asyncio.gather(*(_call(arg) for arg in unique_args))
+        result_by_arg = dict(zip(unique_args, results))
+        return [result_by_arg[arg] for arg in args]
+
     @retrieve_paper_content_timed
     def _initialize(self, state: RetrievePaperContentState) -> dict:
         if self.target_study_list_source == "research_study_list":
@@ -89,100 +116,153 @@ class RetrievePaperContentSubgraph(BaseSubgraph):
         return {"temp_research_study_list": research_study_list}
 
     @retrieve_paper_content_timed
-    def _search_arxiv_id_from_title(self, state: RetrievePaperContentState) -> dict:
+    async def _search_arxiv_id_from_title(
+        self, state: RetrievePaperContentState
+    ) -> dict:
         research_study_list = state["temp_research_study_list"]
 
-        for research_study in research_study_list:
-            title = research_study.get("title", "")
-            arxiv_id = search_arxiv_id_from_title(
+        async def _search(title: str) -> str | None:
+            return await asearch_arxiv_id_from_title(
                 llm_name="gpt-4o-2024-11-20",
                 prompt_template=openai_websearch_arxiv_ids_prompt,
                 title=title,
             )
-            research_study["arxiv_id"] = arxiv_id
-
-        return {"temp_research_study_list": research_study_list}
-
-    @retrieve_paper_content_timed
-    def _search_arxiv_by_id(self, state: RetrievePaperContentState) -> dict:
-        research_study_list = state["temp_research_study_list"]
 
+        # Only studies whose ID is neither known nor readable from an arXiv URL
+        # need the (slow, rate-limited) web search.
+        todo = []
         for research_study in research_study_list:
-            if arxiv_id := research_study.get("arxiv_id", ""):
-                arxiv_info = search_arxiv_by_id(arxiv_id)
-
-                if arxiv_info:
-                    if "external_sources" not in research_study:
-                        research_study["external_sources"] = {}
-                    research_study["external_sources"]["arxiv_info"] = arxiv_info
-
-                    if arxiv_info.get("summary"):
-                        research_study["abstract"] = arxiv_info["summary"]
+            if research_study.get("arxiv_id"):
+                continue
+            url = research_study.get("arxiv_url") or research_study.get("url") or ""
+            if arxiv_id := extract_arxiv_id_from_url(url):
+                research_study["arxiv_id"] = arxiv_id
+            else:
+                todo.append(research_study)
+
+        # Each web search is dominated by model latency, so run them together.
+        arxiv_ids = await self._gather_bounded(
+            _search, [research_study.get("title", "") for research_study in todo]
+        )
+        for research_study, arxiv_id in zip(todo, arxiv_ids):
+            research_study["arxiv_id"] = arxiv_id
 
-                    if "meta_data" not in research_study:
-                        research_study["meta_data"] = {}
+        return {"temp_research_study_list": research_study_list}
 
-                    for key, value in arxiv_info.items():
-                        if key not in ["title", "summary"]:
-                            research_study["meta_data"][key] = (
-                                value  #  TODO: Match the structure of MetaData
-                            )
+    @staticmethod
+    def _merge_arxiv_info(research_study: dict, arxiv_info: dict) -> None:
+        if "external_sources" not in research_study:
+            research_study["external_sources"] = {}
+        research_study["external_sources"]["arxiv_info"] = arxiv_info
 
-        return {"temp_research_study_list": research_study_list}
+        if arxiv_info.get("summary"):
+            research_study["abstract"] = arxiv_info["summary"]
 
-    @retrieve_paper_content_timed
-    def _search_ss_by_id(
-        self, state: RetrievePaperContentState
-    ) -> dict[str, list[dict]]:
-        research_study_list = state["temp_research_study_list"]
+        if "meta_data" not in research_study:
+            research_study["meta_data"] = {}
 
-        for research_study in research_study_list:
-            if arxiv_id := research_study.get("arxiv_id", ""):
-                semantic_scholar_info = search_ss_by_id(arxiv_id)
+        for key, value in arxiv_info.items():
+            if key not in ["title", "summary"]:
+                research_study["meta_data"][key] = (
+                    value  #  TODO: Match the structure of MetaData
+                )
 
-                if semantic_scholar_info:
-                    if "external_sources" not in research_study:
-                        research_study["external_sources"] = {}
-                    research_study["external_sources"]["semantic_scholar_info"] = (
-                        semantic_scholar_info
-                    )
+    @staticmethod
+    def _merge_semantic_scholar_info(
+        research_study: dict, semantic_scholar_info: dict
+    ) -> None:
+        if "external_sources" not in research_study:
+            research_study["external_sources"] = {}
+        research_study["external_sources"]["semantic_scholar_info"] = (
+            semantic_scholar_info
+        )
 
-                    if semantic_scholar_info.get("abstract"):
-                        research_study["abstract"] = semantic_scholar_info["abstract"]
+        if semantic_scholar_info.get("abstract"):
+            research_study["abstract"] = semantic_scholar_info["abstract"]
 
-                    if "meta_data" not in research_study:
-                        research_study["meta_data"] = {}
+        if "meta_data" not in research_study:
+            research_study["meta_data"] = {}
 
-                    for key, value in semantic_scholar_info.items():
-                        if key not in ["title", "abstract"]:
-                            research_study["meta_data"][key] = (
-                                value  #  TODO: Match the structure of MetaData
-                            )
+        for key, value in semantic_scholar_info.items():
+            if key not in ["title", "abstract"]:
+                research_study["meta_data"][key] = (
+                    value  #  TODO: Match the structure of MetaData
+                )
 
-        return {"temp_research_study_list": research_study_list}
+    @staticmethod
+    async def _search_batched(
+        func: Callable[[list[str]], list[dict | None]], arxiv_ids: list[str]
+    ) -> list[dict | None]:
+        # Batch endpoints answer many IDs per request (100 for arXiv, 500 for
+        # Semantic Scholar) instead of one call each.
+        unique_ids = list(dict.fromkeys(arxiv_ids))
+        unique_infos = await asyncio.to_thread(func, unique_ids)
+        info_by_id = dict(zip(unique_ids, unique_infos))
+        return [info_by_id[arxiv_id] for arxiv_id in arxiv_ids]
+
+    async def _search_metadata(self, targets: list[dict]) -> None:
+        arxiv_ids = [study["arxiv_id"] for study in targets]
+
+        # Both sources are queried at once; the configured provider is merged
+        # last so its abstract and metadata win, and a failure of the other
+        # source only costs the extra fields.
+        arxiv_infos, semantic_scholar_infos = await asyncio.gather(
+            self._search_batched(search_arxiv_by_ids, arxiv_ids),
+            self._search_batched(search_ss_by_ids, arxiv_ids),
+            return_exceptions=True,
+        )
+        primary = (
+            "semantic_scholar" if self.paper_provider == "semantic_scholar" else "arxiv"
+        )
+        sources = {
+            "arxiv": (arxiv_infos, self._merge_arxiv_info),
+            "semantic_scholar": (
+                semantic_scholar_infos,
+                self._merge_semantic_scholar_info,
+            ),
+        }
+        secondary = next(name for name in sources if name != primary)
+
+        for name in (secondary, primary):
+            infos, merge = sources[name]
+            if isinstance(infos, BaseException):
+                if name == primary:
+                    raise infos
+                logger.warning(f"Secondary {name} metadata lookup failed: {infos}")
+                continue
+            for research_study, info in zip(targets, infos):
+                if info:
+                    merge(research_study, info)
+
+    async def _retrieve_full_texts(self, targets: list[dict]) -> None:
+        def _retrieve(arxiv_url: str) -> str:
+            return retrieve_text_from_url(papers_dir=self.papers_dir, pdf_url=arxiv_url)
+
+        full_texts = await self._gather_bounded(
+            _retrieve, [study["arxiv_url"] for study in targets]
+        )
+        for research_study, full_text in zip(targets, full_texts):
+            research_study["full_text"] = full_text
 
     @retrieve_paper_content_timed
-    def _retrieve_text_from_url(
+    async def _enrich_studies(
         self, state: RetrievePaperContentState
     ) -> dict[str, list[dict]]:
         research_study_list = state["temp_research_study_list"]
 
-        for research_study in research_study_list:
-            if arxiv_url := research_study.get("arxiv_url", ""):
-                full_text = retrieve_text_from_url(
-                    papers_dir=self.papers_dir,
-                    pdf_url=arxiv_url,
-                )
-                research_study["full_text"] = full_text
+        # Metadata lookups and PDF downloads touch disjoint keys of each study,
+        # so both run at once instead of as consecutive passes over the list.
+        await asyncio.gather(
+            self._search_metadata(
+                [study for study in research_study_list if study.get("arxiv_id")]
+            ),
+            self._retrieve_full_texts(
+                [study for study in research_study_list if study.get("arxiv_url")]
+            ),
+        )
 
         return {"temp_research_study_list": research_study_list}
 
-    def select_provider(self, state: RetrievePaperContentState) -> str:
-        if self.paper_provider == "semantic_scholar":
-            return "search_ss_by_id"
-        else:
-            return "search_arxiv_by_id"
-
     @retrieve_paper_content_timed
     def _format_output(self, state: RetrievePaperContentState) -> dict:
         if self.target_study_list_source == "research_study_list":
@@ -200,27 +280,19 @@ class RetrievePaperContentSubgraph(BaseSubgraph):
         graph_builder.add_node(
             "search_arxiv_id_from_title", self._search_arxiv_id_from_title
         )
-        graph_builder.add_node("search_arxiv_by_id", self._search_arxiv_by_id)
-        graph_builder.add_node("search_ss_by_id", self._search_ss_by_id)
-        graph_builder.add_node("retrieve_text_from_url", self._retrieve_text_from_url)
+        graph_builder.add_node("enrich_studies", self._enrich_studies)
         graph_builder.add_node("format_output", self._format_output)
 
         graph_builder.add_edge(START, "initialize")
         graph_builder.add_edge("initialize", "search_arxiv_id_from_title")
-        graph_builder.add_conditional_edges(
-            "search_arxiv_id_from_title",
-            self.select_provider,
-            {
-                "search_arxiv_by_id": "search_arxiv_by_id",
-                "search_ss_by_id": "search_ss_by_id",
-            },
-        )
-        graph_builder.add_edge("search_arxiv_by_id", "retrieve_text_from_url")
-        graph_builder.add_edge("search_ss_by_id", "retrieve_text_from_url")
-        graph_builder.add_edge("retrieve_text_from_url", "format_output")
+        graph_builder.add_edge("search_arxiv_id_from_title", "enrich_studies")
+        graph_builder.add_edge("enrich_studies", "format_output")
         graph_builder.add_edge("format_output", END)
         return graph_builder.compile()
 
+    def run(self, state: dict[str, Any], config: dict | None = None) -> dict[str, Any]:
+        return self._run_async(state, config)
+
 
 def main():
     save_dir = "/workspaces/airas/data"
@@ -1,10 +1,30 @@
-from jinja2 import Environment
+import asyncio
+
 from pydantic import BaseModel
 
+from tradegraph.features.retrieve.summarize_paper_subgraph.prompt.summarize_paper_prompt import (
+    merge_paper_summaries_prompt,
+)
 from tradegraph.services.api_client.llm_client.llm_facade_client import (
     LLM_MODEL,
     LLMFacadeClient,
 )
+from tradegraph.utils.rate_limiter import estimate_tokens, get_token_bucket
+from tradegraph.utils.template_cache import compile_template
+
+# Texts above roughly 50K tokens are summarized map-reduce style: one call
+# per ~8K-token chunk (with 10% overlap), then one call merging the results.
+LONG_PAPER_CHARS = 200_000
+CHUNK_CHARS = 32_000
+CHUNK_OVERLAP_CHARS = 3_200
+
+_FIELDS = (
+    "main_contributions",
+    "methodology",
+    "experimental_setup",
+    "limitations",
+    "future_research_directions",
+)
 
 
 class LLMOutput(BaseModel):
@@ -28,8 +48,7 @@ def summarize_paper(
         "paper_text": paper_text,
     }
 
-    env = Environment()
-    template = env.from_string(prompt_template)
+    template = compile_template(prompt_template)
     messages = template.render(data)
 
     output, cost = client.structured_outputs(message=messages, data_model=LLMOutput)
@@ -41,3 +60,86 @@ def summarize_paper(
         output["limitations"],
         output["future_research_directions"],
     )
+
+
+def _chunk_text(
+    text: str,
+    max_chars: int = CHUNK_CHARS,
+    overlap: int = CHUNK_OVERLAP_CHARS,
+) -> list[str]:
+    # Extracted PDF text has its line breaks stripped, so section headings
+    # cannot be located reliably; cut at a sentence end near the window edge.
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = min(start + max_chars, len(text))
+        if end < len(text):
+            cut = text.rfind(". ", start + max_chars * 9 // 10, end)
+            if cut != -1:
+                end = cut + 1
+        chunks.append(text[start:end])
+        if end == len(text):
+            break
+        start = end - overlap
+    return chunks
+
+
+def merge_paper_summaries(
+    llm_name: LLM_MODEL,
+    partial_summaries: list[tuple[str, str, str, str, str]],
+    client: LLMFacadeClient | None = None,
+) -> tuple[str, str, str, str, str]:
+    if client is None:
+        client = LLMFacadeClient(llm_name=llm_name)
+
+    messages = compile_template(merge_paper_summaries_prompt).render(
+        partial_summaries=[dict(zip(_FIELDS, summary)) for summary in partial_summaries]
+    )
+    output, cost = client.structured_outputs(message=messages, data_model=LLMOutput)
+    return tuple(output[field] for field in _FIELDS)
+
+
+async def _asummarize_chunk(
+    llm_name: LLM_MODEL,
+    prompt_template: str,
+    paper_text: str,
+    client: LLMFacadeClient | None = None,
+) -> tuple[str, str, str, str, str]:
+    await get_token_bucket(llm_name).acquire(
+        estimate_tokens(prompt_template, paper_text)
+    )
+    return await asyncio.to_thread(
+        summarize_paper,
+        llm_name=llm_name,
+        prompt_template=prompt_template,
+        paper_text=paper_text,
+        client=client,
+    )
+
+
+async def asummarize_paper(
+    llm_name: LLM_MODEL,
+    prompt_template: str,
+    paper_text: str,
+    client: LLMFacadeClient | None = None,
+) -> tuple[str, str, str, str, str]:
+    if len(paper_text) <= LONG_PAPER_CHARS:
+        return await _asummarize_chunk(llm_name, prompt_template, paper_text, client)
+
+    # Several short calls run in parallel and stay within the context window,
+    # where one call over the whole text would be slow or rejected.
+    partial_summaries = await asyncio.gather(
+        *(
+            _asummarize_chunk(llm_name, prompt_template, chunk, client)
+            for chunk in _chunk_text(paper_text)
+        )
+    )
+    await get_token_bucket(llm_name).acquire(
+        estimate_tokens(merge_paper_summaries_prompt, *map(str, partial_summaries))
+    )
+    return await asyncio.to_thread(
+        merge_paper_summaries,
+        llm_name=llm_name,
+        partial_summaries=partial_summaries,
+        client=client,
+    )
@@ -31,3 +31,32 @@ Below is the full text of the research paper:
 }
 ```
 """
+
+merge_paper_summaries_prompt = """
+You are an expert research assistant. A long research paper was split into consecutive parts, and each part was summarized separately. Combine these partial summaries into one structured summary of the whole paper.
+
+Partial summaries, in paper order:
+
+```
+{% for summary in partial_summaries %}
+## Part {{ loop.index }}
+{{ summary | tojson }}
+{% endfor %}
+```
+
+## **Instructions:**
+1. Merge the information for each field across all parts, removing repetition.
+2. Ignore `"Not mentioned"` values when another part provides information for that field.
+3. Your response **must be a valid JSON object** that can be directly parsed using `json.loads()`.
+4. **If no part has information for a field, set its value to `"Not mentioned"`.**
+## **Output Format (JSON)**:
+```json
+{
+    "main_contributions": "<Concise description of the main research problem and contributions>",
+    "methodology": "<Brief explanation of the key techniques, models, or algorithms>",
+    "experimental_setup": "<Description of datasets, benchmarks, and validation methods>",
+    "limitations": "<Summary of weaknesses, constraints, or assumptions>",
+    "future_research_directions": "<Potential areas for extending this research>"
+}
+```
+"""
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 from typing import Any
@@ -11,7 +12,7 @@ from tradegraph.features.retrieve.summarize_paper_subgraph.input_data import (
     summarize_paper_subgraph_input_data,
 )
 from tradegraph.features.retrieve.summarize_paper_subgraph.nodes.summarize_paper import (
-    summarize_paper,
+    asummarize_paper,
 )
 from tradegraph.features.retrieve.summarize_paper_subgraph.prompt.summarize_paper_prompt import (
     summarize_paper_prompt,
@@ -50,41 +51,59 @@ class SummarizePaperSubgraph(BaseSubgraph):
     InputState = SummarizePaperInputState
     OutputState = SummarizePaperOutputState
 
-    def __init__(self, llm_name: LLM_MODEL):
+    def __init__(self, llm_name: LLM_MODEL, max_concurrency: int = 8):
         self.llm_name = llm_name
+        # Upper bound on summarization calls in flight at once.
+        self.max_concurrency = max_concurrency
 
     @summarize_paper_subgraph_timed
-    def _summarize_paper(self, state: SummarizePaperState) -> dict[str, list[dict]]:
+    async def _summarize_paper(
+        self, state: SummarizePaperState
+    ) -> dict[str, list[dict]]:
         research_study_list = state["research_study_list"]
 
+        todo = []
         for research_study in research_study_list:
             if research_study.get("llm_extracted_info"):
                 logger.info(
                     f"Skipping summarization for '{research_study.get('title', 'N/A')}' as info already exists."
                 )
                 continue
+            if research_study.get("full_text", ""):
+                todo.append(research_study)
 
-            full_text = research_study.get("full_text", "")
-            if full_text:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _summarize(research_study: dict) -> None:
+            async with semaphore:
                 (
                     main_contributions,
                     methodology,
                     experimental_setup,
                     limitations,
                     future_research_directions,
-                ) = summarize_paper(
+                ) = await asummarize_paper(
                     llm_name=self.llm_name,
                     prompt_template=summarize_paper_prompt,
-                    paper_text=full_text,
+                    paper_text=research_study["full_text"],
                 )
 
-                research_study["llm_extracted_info"] = {
-                    "main_contributions": main_contributions,
-                    "methodology": methodology,
-                    "experimental_setup": experimental_setup,
-                    "limitations": limitations,
-                    "future_research_directions": future_research_directions,
-                }
+            research_study["llm_extracted_info"] = {
+                "main_contributions": main_contributions,
+                "methodology": methodology,
+                "experimental_setup": experimental_setup,
+                "limitations": limitations,
+                "future_research_directions": future_research_directions,
+            }
+
+        tasks = [asyncio.create_task(_summarize(study)) for study in todo]
+        try:
+            for done, task in enumerate(asyncio.as_completed(tasks), start=1):
+                await task
+                logger.info(f"Summarized {done}/{len(tasks)} papers")
+        finally:
+            for task in tasks:
+                task.cancel()
 
         return {"research_study_list": research_study_list}
 
@@ -96,6 +115,9 @@ class SummarizePaperSubgraph(BaseSubgraph):
         graph_builder.add_edge("summarize_paper", END)
         return graph_builder.compile()
 
+    def run(self, state: dict[str, Any], config: dict | None = None) -> dict[str, Any]:
+        return self._run_async(state, config)
+
 
 def main():
     llm_name = "o3-mini-2025-01-31"
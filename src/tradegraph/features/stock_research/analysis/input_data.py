@@ -11,6 +11,10 @@ class AnalysisState(TypedDict):
     investment_method: Dict[str, Any]  # Original method
     experiment_design: Dict[str, Any]  # Experiment parameters
     llm_name: str
+    model_routing: Dict[str, str]  # Per-node LLM overrides, keyed by node name
+    batch_mode: bool  # Use the OpenAI Batch API for LLM calls
+    use_cache: bool  # Replay cached LLM responses
+    json_writer: Any  # BackgroundWriter of the current run, if any
     save_dir: str
     
     # Generated outputs
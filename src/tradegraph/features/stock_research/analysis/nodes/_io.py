@@ -0,0 +1,60 @@
+"""File output helpers for the analysis nodes."""
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, List, Optional
+
+from tradegraph.utils.fast_json import dumps_indented
+
+
+def _atomic_write_json(path: str, obj: Any) -> None:
+    # Serialized in memory and written with a single call; the rename keeps
+    # readers from ever seeing a half-written file.
+    data = dumps_indented(obj)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class BackgroundWriter:
+    """Writes the JSON artifacts of one analysis run off the critical path.
+
+    Each write overlaps the next node's LLM call. Leaving the `with` block
+    waits for every queued write and re-raises the first error.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="analysis-writer"
+        )
+        self._futures: List[Future] = []
+
+    def write_json(self, path: str, obj: Any) -> None:
+        self._futures.append(self._executor.submit(_atomic_write_json, path, obj))
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        for future in self._futures:
+            future.result()
+
+    def __enter__(self) -> "BackgroundWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def write_json(
+    path: str, obj: Any, writer: Optional[BackgroundWriter] = None
+) -> None:
+    """Write `obj` as indented JSON to `path`.
+
+    With a `writer` the write is queued on it and `obj` must not be mutated
+    afterwards; without one (a node run on its own) it happens right away.
+    """
+    if writer is None:
+        _atomic_write_json(path, obj)
+    else:
+        writer.write_json(path, obj)
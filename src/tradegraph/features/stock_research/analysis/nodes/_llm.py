@@ -0,0 +1,193 @@
+"""Shared helpers for the LLM calls of the analysis nodes."""
+
+import io
+import json
+from typing import Any, Dict, Optional, TextIO
+
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+    RateLimitError,
+)
+from tenacity import wait_random_exponential
+
+from tradegraph.services.api_client.llm_client.openai_client import (
+    run_chat_completion_batch,
+)
+from tradegraph.services.api_client.retry_policy import make_retry_policy
+from tradegraph.utils.fast_json import json_loads, prompt_json
+from tradegraph.utils.llm_cache import cached_chat_complete, chat_complete
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; truncated JSON is then not salvaged
+    ijson = None
+
+
+DEFAULT_LLM_NAME = "gpt-4o-mini-2024-07-18"
+
+LLM_RETRY = make_retry_policy(
+    max_retries=5,
+    wait=wait_random_exponential(min=1, max=30),
+    retryable_exc=(
+        APIConnectionError,
+        APITimeoutError,
+        InternalServerError,
+        RateLimitError,
+    ),
+)
+
+
+def resolve_llm_name(state: Dict[str, Any], node_name: str) -> str:
+    """Return the model for `node_name`: its `model_routing` entry if any."""
+    routed = (state.get("model_routing") or {}).get(node_name)
+    return routed or state.get("llm_name", DEFAULT_LLM_NAME)
+
+
+def project(data: Any, spec: Dict[str, Any]) -> Any:
+    """Keep only the keys of `data` named in `spec`.
+
+    A nested dict in `spec` selects keys of the corresponding sub-dict; any
+    other value keeps the whole subtree. Non-dict data is returned as is.
+    """
+    if not isinstance(data, dict):
+        return data
+    return {
+        key: project(data[key], sub) if isinstance(sub, dict) else data[key]
+        for key, sub in spec.items()
+        if key in data
+    }
+
+
+def strict_object(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON schema of an object in the shape structured-output strict mode needs."""
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+
+
+def string_fields(*names: str) -> Dict[str, Any]:
+    return strict_object({name: {"type": "string"} for name in names})
+
+
+def json_schema_format(name: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    """`response_format` that constrains decoding to `schema`."""
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "schema": schema, "strict": True},
+    }
+
+
+def batch_chat_completion(client, poll_interval: float = 30.0, **kwargs: Any) -> str:
+    """Run a chat completion through the OpenAI Batch API (50% token price).
+
+    Blocks until the batch job finishes, which can take minutes to hours.
+    """
+    body = run_chat_completion_batch(
+        client, {"request-0": kwargs}, poll_interval=poll_interval
+    )["request-0"]
+    if body is None:
+        raise RuntimeError("Batch chat completion request failed")
+    return body["choices"][0]["message"]["content"]
+
+
+@LLM_RETRY
+def _request_chat_completion(
+    client, out: Optional[TextIO], out_start: int, **kwargs: Any
+) -> str:
+    if out is not None:
+        # Drop whatever a failed attempt already streamed into the file.
+        out.seek(out_start)
+        out.truncate()
+    return chat_complete(client, out, **kwargs)
+
+
+def chat_completion(
+    client,
+    batch_mode: bool = False,
+    out: Optional[TextIO] = None,
+    use_cache: bool = False,
+    **kwargs: Any,
+) -> str:
+    """Return the text of a chat completion.
+
+    In batch mode the request goes through the Batch API; otherwise it is
+    streamed into `out` when given, or issued as a regular request. Rate
+    limits, timeouts and server errors are retried with jittered backoff.
+    With `use_cache`, responses are cached on disk by `cached_chat_complete`,
+    so re-running the analysis on the same inputs skips the API call.
+    """
+    out_start = out.tell() if out is not None else 0
+
+    def complete(client, out: Optional[TextIO], **kwargs: Any) -> str:
+        if not batch_mode:
+            return _request_chat_completion(client, out, out_start, **kwargs)
+        # Not under LLM_RETRY: the Batch API calls are retried one by one, so
+        # a failed poll never resubmits the job.
+        content = batch_chat_completion(client, **kwargs)
+        if out is not None:
+            out.write(content)
+        return content
+
+    return cached_chat_complete(
+        client, use_cache=use_cache, out=out, complete=complete, **kwargs
+    )
+
+
+_SHARED_CONTEXT_HEADER = (
+    "You are reviewing the backtest of a trading strategy. The performance "
+    "metrics and the performance analysis produced so far are given below "
+    "as JSON.\n\n"
+)
+
+
+def build_shared_context(state: Dict[str, Any]) -> str:
+    """Serialize the analysis context shared by several node prompts.
+
+    Keys are sorted so the text is byte-identical across nodes; sent as the
+    leading system message it forms a stable prefix that OpenAI's automatic
+    prompt caching bills at a discount on the repeated calls.
+    """
+    context = {
+        "performance_analysis": state.get("performance_analysis", {}),
+        "performance_metrics": state.get("performance_metrics", {}),
+    }
+    return _SHARED_CONTEXT_HEADER + prompt_json(context, sort_keys=True)
+
+
+def parse_json_response(text: str) -> Optional[Dict[str, Any]]:
+    """Parse the JSON object in an LLM response, salvaging what it can.
+
+    Code fences and trailing prose around the object are ignored. When the
+    object itself is cut off (e.g. at `max_tokens`), ijson recovers the
+    top-level keys that were completed before the cut.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    # Fast path for the usual case of nothing but the object itself.
+    try:
+        obj = json_loads(text[start:text.rfind("}") + 1])
+        return obj if isinstance(obj, dict) else None
+    except json.JSONDecodeError:
+        pass
+    try:
+        obj, _ = json.JSONDecoder().raw_decode(text, start)
+        return obj if isinstance(obj, dict) else None
+    except json.JSONDecodeError:
+        pass
+    if ijson is None:
+        return None
+
+    salvaged = {}
+    try:
+        source = io.BytesIO(text[start:].encode("utf-8"))
+        for key, value in ijson.kvitems(source, "", use_float=True):
+            salvaged[key] = value
+    except ijson.JSONError:
+        pass
+    return salvaged or None
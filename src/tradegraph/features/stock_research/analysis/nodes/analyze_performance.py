@@ -1,9 +1,64 @@
 """Node for analyzing backtest performance metrics."""
 
 import os
-import json
 from typing import Dict, Any
-from openai import OpenAI
+
+from tradegraph.utils.fast_json import prompt_json
+from tradegraph.utils.openai_client import get_client
+from ._io import write_json
+from ._llm import (
+    chat_completion,
+    json_schema_format,
+    parse_json_response,
+    resolve_llm_name,
+    strict_object,
+    string_fields,
+)
+
+# The filled-in schema is ~1200 tokens; a tight cap bounds decode time, and a
+# low temperature keeps the JSON terse and on-schema.
+_MAX_TOKENS = 1400
+_TEMPERATURE = 0.2
+
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+_PERFORMANCE_ANALYSIS_SCHEMA = strict_object({
+    "overall_assessment": strict_object({
+        "performance_grade": {"type": "string"},
+        "met_expectations": {"type": "boolean"},
+        "key_strengths": _STRING_LIST,
+        "key_weaknesses": _STRING_LIST,
+    }),
+    "return_analysis": strict_object({
+        "absolute_performance": string_fields(
+            "total_return", "annualized_return", "comparison_to_benchmark"
+        ),
+        "consistency": string_fields(
+            "monthly_consistency", "volatility_assessment", "return_distribution"
+        ),
+    }),
+    "risk_analysis": strict_object({
+        "drawdown_analysis": string_fields(
+            "max_drawdown", "recovery_time", "drawdown_frequency"
+        ),
+        "risk_metrics": string_fields("sharpe_ratio", "sortino_ratio", "calmar_ratio"),
+        "tail_risk": string_fields("var_95", "worst_day", "black_swan_vulnerability"),
+    }),
+    "trading_analysis": strict_object({
+        "efficiency": string_fields(
+            "win_rate", "profit_factor", "average_win_loss_ratio"
+        ),
+        "execution": string_fields("number_of_trades", "holding_period", "turnover"),
+        "costs": string_fields(
+            "transaction_costs", "slippage_impact", "net_vs_gross"
+        ),
+    }),
+    "regime_performance": string_fields(
+        "bull_market", "bear_market", "high_volatility", "performance_stability"
+    ),
+    "statistical_significance": string_fields(
+        "t_statistic", "information_ratio", "alpha", "confidence_level"
+    ),
+})
 
 
 def analyze_performance_node(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -14,18 +69,18 @@ def analyze_performance_node(state: Dict[str, Any]) -> Dict[str, Any]:
     performance_metrics = state.get("performance_metrics", {})
     raw_results = state.get("raw_results", {})
     investment_method = state.get("investment_method", {})
-    llm_name = state.get("llm_name", "gpt-4o-mini-2024-07-18")
+    llm_name = resolve_llm_name(state, "analyze_performance")
     
-    client = OpenAI()
+    client = get_client()
     
     prompt = f"""Analyze these trading strategy backtest results in detail.
 
 Performance Metrics:
-{json.dumps(performance_metrics, indent=2)}
+{prompt_json(performance_metrics)}
 
 Investment Method:
-{json.dumps(investment_method.get('method_name', 'Unknown'), indent=2)}
-Expected Performance: {json.dumps(investment_method.get('performance_expectations', {}), indent=2)}
+{prompt_json(investment_method.get('method_name', 'Unknown'))}
+Expected Performance: {prompt_json(investment_method.get('performance_expectations', {}))}
 
 Provide comprehensive performance analysis:
 
@@ -99,17 +154,20 @@ Provide comprehensive performance analysis:
 Be specific with numbers and provide actionable interpretations."""
 
     try:
-        response = client.chat.completions.create(
+        response = chat_completion(
+            client,
+            batch_mode=state.get("batch_mode", False),
+            use_cache=state.get("use_cache", False),
             model=llm_name,
             messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-            max_tokens=2000
+            temperature=_TEMPERATURE,
+            max_tokens=_MAX_TOKENS,
+            response_format=json_schema_format(
+                "performance_analysis", _PERFORMANCE_ANALYSIS_SCHEMA
+            ),
         )
-        response = response.choices[0].message.content
-        # Try to parse as JSON
-        try:
-            performance_analysis = json.loads(response)
-        except json.JSONDecodeError:
+        performance_analysis = parse_json_response(response)
+        if not performance_analysis:
             performance_analysis = {
                 "analysis": response,
                 "overall_assessment": {"performance_grade": "Pending"}
@@ -120,10 +178,11 @@ Be specific with numbers and provide actionable interpretations."""
     
     # Save performance analysis
     save_dir = state.get("save_dir", "./stock_research_output")
-    os.makedirs(os.path.join(save_dir, "analysis"), exist_ok=True)
-    
-    with open(os.path.join(save_dir, "analysis", "performance_analysis.json"), "w") as f:
-        json.dump(performance_analysis, f, indent=2)
+    write_json(
+        os.path.join(save_dir, "analysis", "performance_analysis.json"),
+        performance_analysis,
+        state.get("json_writer"),
+    )
     
     # Update state
     state["performance_analysis"] = performance_analysis
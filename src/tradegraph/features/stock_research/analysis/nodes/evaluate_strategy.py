@@ -1,9 +1,77 @@
 """Node for evaluating strategy effectiveness."""
 
 import os
-import json
 from typing import Dict, Any
-from openai import OpenAI
+
+from tradegraph.utils.fast_json import prompt_json
+from tradegraph.utils.openai_client import get_client
+from ._io import write_json
+from ._llm import (
+    build_shared_context,
+    chat_completion,
+    json_schema_format,
+    parse_json_response,
+    resolve_llm_name,
+    strict_object,
+    string_fields,
+)
+
+_MAX_TOKENS = 1500
+_TEMPERATURE = 0.2
+
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+_STRATEGY_EVALUATION_SCHEMA = strict_object({
+    "viability_assessment": strict_object({
+        "overall_viability": {"type": "string"},
+        "confidence_score": {"type": "number"},
+        "reasoning": {"type": "string"},
+    }),
+    "anomaly_validation": strict_object({
+        "anomaly_confirmed": {"type": "boolean"},
+        "strength_assessment": {"type": "string"},
+        "persistence_likelihood": {"type": "string"},
+        "explanation": {"type": "string"},
+    }),
+    "implementation_readiness": strict_object({
+        "ready_for_production": {"type": "boolean"},
+        "required_improvements": {
+            "type": "array",
+            "items": string_fields("area", "priority", "suggestion"),
+        },
+        "estimated_time_to_ready": {"type": "string"},
+    }),
+    "competitive_analysis": string_fields(
+        "uniqueness", "crowding_risk", "alpha_decay_estimate", "moat_assessment"
+    ),
+    "scalability_analysis": strict_object({
+        "minimum_capital": {"type": "string"},
+        "optimal_capital": {"type": "string"},
+        "capacity_limit": {"type": "string"},
+        "scaling_challenges": _STRING_LIST,
+    }),
+    "risk_assessment": strict_object({
+        "primary_risks": {
+            "type": "array",
+            "items": string_fields("risk", "impact", "mitigation"),
+        },
+        "black_swan_vulnerability": {"type": "string"},
+        "correlation_risks": {"type": "string"},
+        "operational_risks": _STRING_LIST,
+    }),
+    "cost_benefit_analysis": strict_object({
+        "expected_net_return": {"type": "string"},
+        "break_even_capital": {"type": "string"},
+        "cost_structure": string_fields(
+            "fixed_costs", "variable_costs", "total_expense_ratio"
+        ),
+    }),
+    "recommendation": strict_object({
+        "action": {"type": "string"},
+        "confidence": {"type": "string"},
+        "rationale": {"type": "string"},
+        "next_steps": _STRING_LIST,
+    }),
+})
 
 
 def evaluate_strategy_node(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -11,24 +79,20 @@ def evaluate_strategy_node(state: Dict[str, Any]) -> Dict[str, Any]:
     
     This node assesses whether the strategy is worth implementing.
     """
-    performance_analysis = state.get("performance_analysis", {})
     performance_metrics = state.get("performance_metrics", {})
     trading_strategy = state.get("trading_strategy", {})
     market_anomaly = state.get("market_anomaly", {})
-    llm_name = state.get("llm_name", "gpt-4o-mini-2024-07-18")
+    llm_name = resolve_llm_name(state, "evaluate_strategy")
     
-    client = OpenAI()
+    client = get_client()
     
     prompt = f"""Evaluate this trading strategy's effectiveness and real-world viability.
 
-Performance Analysis:
-{json.dumps(performance_analysis, indent=2)}
-
 Original Strategy:
-{json.dumps(trading_strategy.get('strategy_name', ''), indent=2)}
+{prompt_json(trading_strategy.get('strategy_name', ''))}
 
 Market Anomaly Exploited:
-{json.dumps(market_anomaly.get('anomaly_name', ''), indent=2)}
+{prompt_json(market_anomaly.get('anomaly_name', ''))}
 
 Create a comprehensive strategy evaluation:
 
@@ -92,17 +156,23 @@ Create a comprehensive strategy evaluation:
 Provide honest, critical evaluation focused on real-world implementation."""
 
     try:
-        response = client.chat.completions.create(
+        response = chat_completion(
+            client,
+            batch_mode=state.get("batch_mode", False),
+            use_cache=state.get("use_cache", False),
             model=llm_name,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-            max_tokens=2000
+            messages=[
+                {"role": "system", "content": build_shared_context(state)},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=_TEMPERATURE,
+            max_tokens=_MAX_TOKENS,
+            response_format=json_schema_format(
+                "strategy_evaluation", _STRATEGY_EVALUATION_SCHEMA
+            ),
         )
-        response = response.choices[0].message.content
-        # Try to parse as JSON
-        try:
-            strategy_evaluation = json.loads(response)
-        except json.JSONDecodeError:
+        strategy_evaluation = parse_json_response(response)
+        if not strategy_evaluation:
             strategy_evaluation = {
                 "evaluation": response,
                 "viability_assessment": {"overall_viability": "Pending"}
@@ -113,8 +183,11 @@ Provide honest, critical evaluation focused on real-world implementation."""
     
     # Save strategy evaluation
     save_dir = state.get("save_dir", "./stock_research_output")
-    with open(os.path.join(save_dir, "analysis", "strategy_evaluation.json"), "w") as f:
-        json.dump(strategy_evaluation, f, indent=2)
+    write_json(
+        os.path.join(save_dir, "analysis", "strategy_evaluation.json"),
+        strategy_evaluation,
+        state.get("json_writer"),
+    )
     
     # Update state
     state["strategy_evaluation"] = strategy_evaluation
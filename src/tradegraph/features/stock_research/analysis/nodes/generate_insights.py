@@ -1,9 +1,65 @@
 """Node for generating actionable insights from analysis."""
 
 import os
-import json
-from typing import Dict, Any, List
-from openai import OpenAI
+import re
+from typing import Dict, Any, List, Tuple
+
+from tradegraph.utils.fast_json import prompt_json
+from tradegraph.utils.openai_client import get_client
+from ._io import write_json
+from ._llm import (
+    build_shared_context,
+    chat_completion,
+    project,
+    resolve_llm_name,
+)
+
+_MAX_TOKENS = 1600
+_TEMPERATURE = 0.7
+
+# Parts of the strategy evaluation the insights draw on. Capital, cost and
+# competition estimates add input tokens without shaping the insights;
+# "evaluation" and "error" keep the fallback documents intact.
+_EVALUATION_FOR_INSIGHTS = {
+    "viability_assessment": True,
+    "anomaly_validation": True,
+    "implementation_readiness": {"required_improvements": True},
+    "risk_assessment": {"primary_risks": True, "operational_risks": True},
+    "recommendation": True,
+    "evaluation": True,
+    "error": True,
+}
+
+# Matches a section heading, bold ("2. **Success Factors**") and/or markdown
+# ("### 1. **Key Findings**", "## Key Findings"), or a "- Label: text"
+# bullet, so the response is scanned in a single pass.
+_INSIGHTS_RE = re.compile(
+    r"^[ \t]*(?:#+[ \t]*)?(?:\d+\.[ \t]*)?\*\*(?P<section>[^*\n]+)\*\*"
+    r"|^[ \t]*#+[ \t]*(?:\d+\.[ \t]*)?(?P<heading>[^*\n]+?)[ \t]*$"
+    r"|^[ \t]*-[ \t]*(?P<key>[^:\n]+):[ \t]*(?P<value>.*)$",
+    re.MULTILINE,
+)
+
+
+def parse_insights(text: str) -> Tuple[List[str], List[Dict[str, str]]]:
+    """Extract the key findings and improvement bullets from the insights."""
+    key_insights = []
+    improvement_suggestions = []
+    
+    current_section = ""
+    for match in _INSIGHTS_RE.finditer(text):
+        title = match.group("section") or match.group("heading")
+        if title:
+            current_section = title.strip(" :").lower()
+        elif current_section.startswith("key findings"):
+            key_insights.append(match.group(0).strip())
+        elif current_section.startswith("improvement opportunities"):
+            improvement_suggestions.append({
+                "area": match.group("key").strip(),
+                "suggestion": match.group("value").strip(),
+                "priority": "medium"  # Default, could be extracted from text
+            })
+    return key_insights, improvement_suggestions
 
 
 def generate_insights_node(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -11,20 +67,16 @@ def generate_insights_node(state: Dict[str, Any]) -> Dict[str, Any]:
     
     This node distills key findings and provides specific recommendations.
     """
-    performance_analysis = state.get("performance_analysis", {})
     strategy_evaluation = state.get("strategy_evaluation", {})
     performance_metrics = state.get("performance_metrics", {})
-    llm_name = state.get("llm_name", "gpt-4o-mini-2024-07-18")
+    llm_name = resolve_llm_name(state, "generate_insights")
     
-    client = OpenAI()
+    client = get_client()
     
     prompt = f"""Generate actionable insights from this trading strategy analysis.
 
-Performance Analysis:
-{json.dumps(performance_analysis, indent=2)}
-
 Strategy Evaluation:
-{json.dumps(strategy_evaluation, indent=2)}
+{prompt_json(project(strategy_evaluation, _EVALUATION_FOR_INSIGHTS))}
 
 Key Metrics Summary:
 - Total Return: {performance_metrics.get('total_return', 'N/A')}
@@ -73,39 +125,30 @@ Generate comprehensive insights:
 
 Format insights to be specific, quantified, and immediately actionable."""
 
+    save_dir = state.get("save_dir", "./stock_research_output")
+    insights_md_path = os.path.join(save_dir, "analysis", "insights.md")
+    os.makedirs(os.path.join(save_dir, "analysis"), exist_ok=True)
+    
     try:
-        response = client.chat.completions.create(
-            model=llm_name,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-            max_tokens=2000
-        )
-        insights_response = response.choices[0].message.content
+        # Stream the readable insights document to disk as it is generated
+        with open(insights_md_path, "w", buffering=1) as f:
+            f.write("# Trading Strategy Insights\n\n")
+            insights_response = chat_completion(
+                client,
+                batch_mode=state.get("batch_mode", False),
+                use_cache=state.get("use_cache", False),
+                out=f,
+                model=llm_name,
+                messages=[
+                    {"role": "system", "content": build_shared_context(state)},
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=_TEMPERATURE,
+                max_tokens=_MAX_TOKENS
+            )
         
         # Parse the insights into structured format
-        key_insights = []
-        improvement_suggestions = []
-        
-        # Extract key insights (simplified parsing)
-        lines = insights_response.split('\n')
-        current_section = ""
-        
-        for line in lines:
-            if "**Key Findings**" in line:
-                current_section = "findings"
-            elif "**Improvement Opportunities**" in line:
-                current_section = "improvements"
-            elif current_section == "findings" and "-" in line and ":" in line:
-                key_insights.append(line.strip())
-            elif current_section == "improvements" and "-" in line:
-                # Try to parse improvement suggestions
-                parts = line.split(":")
-                if len(parts) >= 2:
-                    improvement_suggestions.append({
-                        "area": parts[0].replace("-", "").strip(),
-                        "suggestion": ":".join(parts[1:]).strip(),
-                        "priority": "medium"  # Default, could be extracted from text
-                    })
+        key_insights, improvement_suggestions = parse_insights(insights_response)
         
         # Ensure we have some insights
         if not key_insights:
@@ -135,10 +178,10 @@ Format insights to be specific, quantified, and immediately actionable."""
         key_insights = ["Error generating insights"]
         improvement_suggestions = [{"area": "Error", "suggestion": str(e)}]
         insights_response = f"Error: {e}"
+        with open(insights_md_path, "w") as f:
+            f.write(f"# Trading Strategy Insights\n\n{insights_response}")
     
     # Save insights
-    save_dir = state.get("save_dir", "./stock_research_output")
-    
     insights_document = {
         "full_insights": insights_response,
         "key_insights": key_insights,
@@ -151,12 +194,11 @@ Format insights to be specific, quantified, and immediately actionable."""
         }
     }
     
-    with open(os.path.join(save_dir, "analysis", "insights.json"), "w") as f:
-        json.dump(insights_document, f, indent=2)
-    
-    # Save readable insights document
-    with open(os.path.join(save_dir, "analysis", "insights.md"), "w") as f:
-        f.write(f"# Trading Strategy Insights\n\n{insights_response}")
+    write_json(
+        os.path.join(save_dir, "analysis", "insights.json"),
+        insights_document,
+        state.get("json_writer"),
+    )
     
     # Update state
     state["key_insights"] = key_insights
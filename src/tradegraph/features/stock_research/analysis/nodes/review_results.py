@@ -1,9 +1,15 @@
 """Node for reviewing overall results and providing final recommendations."""
 
 import os
-import json
 from typing import Dict, Any
-from openai import OpenAI
+
+from tradegraph.utils.fast_json import prompt_json
+from tradegraph.utils.openai_client import get_client
+from ._io import write_json
+from ._llm import chat_completion, resolve_llm_name
+
+_MAX_TOKENS = 1800
+_TEMPERATURE = 0.7
 
 
 def review_results_node(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -16,22 +22,22 @@ def review_results_node(state: Dict[str, Any]) -> Dict[str, Any]:
     key_insights = state.get("key_insights", [])
     improvement_suggestions = state.get("improvement_suggestions", [])
     investment_method = state.get("investment_method", {})
-    llm_name = state.get("llm_name", "gpt-4o-mini-2024-07-18")
+    llm_name = resolve_llm_name(state, "review_results")
     
-    client = OpenAI()
+    client = get_client()
     
     prompt = f"""Provide a comprehensive final review of this trading strategy research.
 
 Strategy: {investment_method.get('method_name', 'Unknown')}
 
 Performance Summary:
-{json.dumps(performance_analysis.get('overall_assessment', {}), indent=2)}
+{prompt_json(performance_analysis.get('overall_assessment', {}))}
 
 Viability Assessment:
-{json.dumps(strategy_evaluation.get('viability_assessment', {}), indent=2)}
+{prompt_json(strategy_evaluation.get('viability_assessment', {}))}
 
 Key Insights:
-{json.dumps(key_insights[:5], indent=2)}
+{prompt_json(key_insights[:5])}
 
 Create a final review document with:
 
@@ -88,24 +94,27 @@ Clear recommendation with reasoning and confidence level.
 
 Be honest, specific, and actionable in the review."""
 
+    save_dir = state.get("save_dir", "./stock_research_output")
+    final_review_path = os.path.join(save_dir, "analysis", "final_review.md")
+    os.makedirs(os.path.join(save_dir, "analysis"), exist_ok=True)
+    
     try:
-        response = client.chat.completions.create(
-            model=llm_name,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-            max_tokens=2000
-        )
-        final_review = response.choices[0].message.content
+        # Stream the markdown review to disk as it is generated
+        with open(final_review_path, "w", buffering=1) as f:
+            chat_completion(
+                client,
+                batch_mode=state.get("batch_mode", False),
+                use_cache=state.get("use_cache", False),
+                out=f,
+                model=llm_name,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=_TEMPERATURE,
+                max_tokens=_MAX_TOKENS
+            )
     except Exception as e:
         print(f"Error creating final review: {e}")
-        final_review = f"Error generating final review: {e}"
-    
-    # Save final review
-    save_dir = state.get("save_dir", "./stock_research_output")
-    
-    # Save as markdown
-    with open(os.path.join(save_dir, "analysis", "final_review.md"), "w") as f:
-        f.write(final_review)
+        with open(final_review_path, "w") as f:
+            f.write(f"Error generating final review: {e}")
     
     # Create summary JSON
     review_summary = {
@@ -122,8 +131,11 @@ Be honest, specific, and actionable in the review."""
         "next_steps": improvement_suggestions[:3]
     }
     
-    with open(os.path.join(save_dir, "analysis", "review_summary.json"), "w") as f:
-        json.dump(review_summary, f, indent=2)
+    write_json(
+        os.path.join(save_dir, "analysis", "review_summary.json"),
+        review_summary,
+        state.get("json_writer"),
+    )
     
     print("Final review completed")
     
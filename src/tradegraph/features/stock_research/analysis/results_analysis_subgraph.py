@@ -3,27 +3,45 @@
 This subgraph analyzes experiment results and generates insights.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from langgraph.graph import StateGraph, END
 from ....core.base import BaseSubgraph
 from .nodes.analyze_performance import analyze_performance_node
 from .nodes.evaluate_strategy import evaluate_strategy_node
 from .nodes.generate_insights import generate_insights_node
 from .nodes.review_results import review_results_node
+from .nodes._io import BackgroundWriter
 from .input_data import AnalysisState
 
 
 class ResultsAnalysisSubgraph(BaseSubgraph):
     """Subgraph for analyzing trading strategy results."""
     
-    def __init__(self, llm_name: str = "gpt-4o-mini-2024-07-18"):
+    def __init__(
+        self,
+        llm_name: str = "gpt-4o-mini-2024-07-18",
+        batch_mode: bool = False,
+        model_routing: Optional[Dict[str, str]] = None,
+        use_cache: bool = False,
+    ):
         """Initialize the ResultsAnalysisSubgraph.
         
         Args:
             llm_name: Name of the LLM to use
+            batch_mode: Send each LLM call through the OpenAI Batch API, which
+                halves the token price but can take hours per node
+            model_routing: Per-node model overrides keyed by node name, e.g.
+                {"review_results": "gpt-4.1-nano-2025-04-14"} to let a
+                cheaper model write up the final review
+            use_cache: Replay cached LLM responses for identical requests.
+                Off by default so the sampled insights and review are fresh
+                on every run; enable to reproduce an earlier analysis
         """
         super().__init__(name="ResultsAnalysisSubgraph")
         self.llm_name = llm_name
+        self.batch_mode = batch_mode
+        self.model_routing = model_routing or {}
+        self.use_cache = use_cache
     
     def build_graph(self):
         """Build the results analysis graph."""
@@ -62,10 +80,21 @@ class ResultsAnalysisSubgraph(BaseSubgraph):
                 - key_insights: Actionable insights
                 - improvement_suggestions: Recommendations
         """
-        graph = self.build_graph()
+        graph = self.graph
         
         # Set defaults
         if "llm_name" not in state:
             state["llm_name"] = self.llm_name
+        if "batch_mode" not in state:
+            state["batch_mode"] = self.batch_mode
+        if "model_routing" not in state:
+            state["model_routing"] = self.model_routing
+        if "use_cache" not in state:
+            state["use_cache"] = self.use_cache
         
-        return graph.invoke(state)
\ No newline at end of file
+        # The nodes queue their JSON artifacts on this run's writer, which
+        # is drained before returning.
+        with BackgroundWriter() as writer:
+            result = graph.invoke({**state, "json_writer": writer})
+        result.pop("json_writer", None)
+        return result
\ No newline at end of file
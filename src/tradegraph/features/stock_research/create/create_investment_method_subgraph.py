@@ -10,20 +10,33 @@ from .nodes.generate_investment_idea import generate_investment_idea_node
 from .nodes.design_trading_strategy import design_trading_strategy_node
 from .nodes.identify_market_anomaly import identify_market_anomaly_node
 from .nodes.refine_investment_method import refine_investment_method_node
+from .nodes.generate_investment_method_batched import generate_investment_method_batched_node
 from .input_data import InvestmentMethodState
 
 
 class CreateInvestmentMethodSubgraph(BaseSubgraph):
     """Subgraph for creating novel investment methods and strategies."""
     
-    def __init__(self, llm_name: str = "gpt-4o-mini-2024-07-18"):
+    def __init__(
+        self,
+        llm_name: str = "gpt-4o-mini-2024-07-18",
+        use_cache: bool = False,
+        batched: bool = False,
+    ):
         """Initialize the CreateInvestmentMethodSubgraph.
         
         Args:
             llm_name: Name of the LLM to use for generation
+            use_cache: Replay cached LLM responses for identical requests.
+                Off by default so every run samples a fresh investment idea;
+                enable to reproduce an earlier run without API calls
+            batched: Generate all four stages in one LLM call, falling back
+                to the sequential nodes when the combined response is incomplete
         """
         super().__init__(name="CreateInvestmentMethodSubgraph")
         self.llm_name = llm_name
+        self.use_cache = use_cache
+        self.batched = batched
     
     def build_graph(self):
         """Build the investment method creation graph."""
@@ -36,7 +49,19 @@ class CreateInvestmentMethodSubgraph(BaseSubgraph):
         workflow.add_node("refine_method", refine_investment_method_node)
         
         # Define flow
-        workflow.set_entry_point("generate_idea")
+        if self.batched:
+            workflow.add_node("generate_method_batched", generate_investment_method_batched_node)
+            workflow.set_entry_point("generate_method_batched")
+            workflow.add_conditional_edges(
+                "generate_method_batched",
+                self._check_batched_status,
+                {
+                    "success": END,
+                    "failed": "generate_idea"
+                }
+            )
+        else:
+            workflow.set_entry_point("generate_idea")
         workflow.add_edge("generate_idea", "identify_anomaly")
         workflow.add_edge("identify_anomaly", "design_strategy")
         workflow.add_edge("design_strategy", "refine_method")
@@ -44,6 +69,10 @@ class CreateInvestmentMethodSubgraph(BaseSubgraph):
         
         return workflow.compile()
     
+    def _check_batched_status(self, state: Dict[str, Any]) -> str:
+        """Check if the batched call produced every stage."""
+        return state.get("batched_status", "failed")
+    
     def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """Run the investment method creation pipeline.
         
@@ -62,11 +91,13 @@ class CreateInvestmentMethodSubgraph(BaseSubgraph):
                 - trading_strategy: Detailed trading rules
                 - investment_method: Complete refined method
         """
-        graph = self.build_graph()
+        graph = self.graph
         
         # Set defaults
         if "llm_name" not in state:
             state["llm_name"] = self.llm_name
+        if "use_cache" not in state:
+            state["use_cache"] = self.use_cache
         if "investment_goals" not in state:
             state["investment_goals"] = ["high Sharpe ratio", "consistent returns", "manageable risk"]
         if "constraints" not in state:
@@ -11,6 +11,7 @@ class InvestmentMethodState(TypedDict):
     investment_goals: List[str]  # Investment objectives
     constraints: List[str]  # Trading constraints
     llm_name: str
+    use_cache: bool  # Replay cached LLM responses
     save_dir: str
     
     # Generated outputs
@@ -18,6 +19,7 @@ class InvestmentMethodState(TypedDict):
     market_anomaly: Dict[str, Any]  # Identified market inefficiency
     trading_strategy: Dict[str, Any]  # Detailed trading rules
     investment_method: Dict[str, Any]  # Complete refined method
+    batched_status: str  # "success" or "failed" for the single-call path
     
 
 class AnomalyInferenceState(TypedDict):
@@ -0,0 +1,12 @@
+"""Helpers for building the create-node prompts."""
+
+from typing import Any, Dict
+
+
+def anomaly_for_prompt(market_anomaly: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop the anecdotal recent examples, which later stages do not use."""
+    evidence = market_anomaly.get("evidence")
+    if not isinstance(evidence, dict) or "recent_examples" not in evidence:
+        return market_anomaly
+    evidence = {k: v for k, v in evidence.items() if k != "recent_examples"}
+    return {**market_anomaly, "evidence": evidence}
@@ -1,38 +1,13 @@
 """Node for generating investment ideas."""
 
 import os
-import json
 from typing import Dict, Any
-from openai import OpenAI
 
+from tradegraph.utils.fast_json import prompt_json
+from tradegraph.utils.llm_cache import cached_chat_complete
+from tradegraph.utils.openai_client import get_client
 
-def generate_investment_idea_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    """Generate a novel investment idea based on market insights and research.
-    
-    This node creates innovative investment thesis by combining insights
-    from news, research papers, and market conditions.
-    """
-    market_insights = state.get("market_insights", "")
-    research_papers = state.get("research_papers", "")
-    investment_goals = state.get("investment_goals", [])
-    constraints = state.get("constraints", [])
-    llm_name = state.get("llm_name", "gpt-4o-mini-2024-07-18")
-    
-    client = OpenAI()
-    
-    prompt = f"""Generate a novel investment idea based on current market conditions and research.
-
-Market Insights:
-{market_insights}
-
-Research Papers Summary:
-{research_papers}
-
-Investment Goals:
-{json.dumps(investment_goals, indent=2)}
-
-Constraints:
-{json.dumps(constraints, indent=2)}
+_SYSTEM_PROMPT = """Generate a novel investment idea based on current market conditions and research. The market insights, research summary, investment goals and constraints are given by the user.
 
 Create an innovative investment thesis that:
 
@@ -72,24 +47,57 @@ Be creative but realistic. Focus on strategies that could actually be implemente
 
 Format as a detailed investment thesis document."""
 
-    try:
-        response = client.chat.completions.create(
-            model=llm_name,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.8,
-            max_tokens=2000
-        )
-        investment_idea = response.choices[0].message.content
-    except Exception as e:
-        print(f"Error generating investment idea: {e}")
-        investment_idea = "Failed to generate investment idea."
+
+def generate_investment_idea_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Generate a novel investment idea based on market insights and research.
+    
+    This node creates innovative investment thesis by combining insights
+    from news, research papers, and market conditions.
+    """
+    market_insights = state.get("market_insights", "")
+    research_papers = state.get("research_papers", "")
+    investment_goals = state.get("investment_goals", [])
+    constraints = state.get("constraints", [])
+    llm_name = state.get("llm_name", "gpt-4o-mini-2024-07-18")
+    
+    client = get_client()
     
-    # Save the investment idea
+    user_message = f"""Market Insights:
+{market_insights}
+
+Research Papers Summary:
+{research_papers}
+
+Investment Goals:
+{prompt_json(investment_goals)}
+
+Constraints:
+{prompt_json(constraints)}"""
+
     save_dir = state.get("save_dir", "./stock_research_output")
     os.makedirs(os.path.join(save_dir, "investment_method"), exist_ok=True)
     
+    # Stream the idea straight to disk so a partial draft survives a crash
     with open(os.path.join(save_dir, "investment_method", "investment_idea.md"), "w") as f:
-        f.write(investment_idea)
+        try:
+            investment_idea = cached_chat_complete(
+                client,
+                use_cache=state.get("use_cache", False),
+                out=f,
+                model=llm_name,
+                messages=[
+                    {"role": "system", "content": _SYSTEM_PROMPT},
+                    {"role": "user", "content": user_message},
+                ],
+                temperature=0.8,
+                max_tokens=2000
+            )
+        except Exception as e:
+            print(f"Error generating investment idea: {e}")
+            investment_idea = "Failed to generate investment idea."
+            f.seek(0)
+            f.truncate()
+            f.write(investment_idea)
     
     # Update state
     state["investment_idea"] = investment_idea
@@ -0,0 +1,132 @@
+"""Node for generating the whole investment method in a single LLM call."""
+
+import os
+import json
+from typing import Dict, Any, Optional
+
+from tradegraph.utils.fast_json import json_loads, prompt_json, write_json
+from tradegraph.utils.llm_cache import cached_chat_complete
+from tradegraph.utils.openai_client import get_client
+from .generate_investment_idea import _SYSTEM_PROMPT as _IDEA_PROMPT
+from .identify_market_anomaly import _SYSTEM_PROMPT as _ANOMALY_PROMPT
+from .design_trading_strategy import _SYSTEM_PROMPT as _STRATEGY_PROMPT
+from .refine_investment_method import (
+    _SYSTEM_PROMPT as _REFINE_PROMPT,
+    save_investment_method,
+)
+
+_SYSTEM_PROMPT = f"""Develop a complete investment method in four stages, each building on the results of the previous ones. The market insights, research summary, investment goals and constraints are given by the user; wherever a stage below refers to an investment idea, market anomaly or trading strategy given by the user, use the result of the earlier stage instead.
+
+Return a single JSON object with exactly these keys:
+- "investment_idea": the stage 1 investment thesis as a markdown string
+- "market_anomaly": the stage 2 JSON object
+- "trading_strategy": the stage 3 JSON object
+- "investment_method": the stage 4 JSON object
+
+## Stage 1: Investment idea
+{_IDEA_PROMPT}
+
+## Stage 2: Market anomaly
+{_ANOMALY_PROMPT}
+
+## Stage 3: Trading strategy
+{_STRATEGY_PROMPT}
+
+## Stage 4: Investment method
+{_REFINE_PROMPT}"""
+
+
+def _parse_batched_response(response_text: str) -> Optional[Dict[str, Any]]:
+    """Return the combined response if it has all four stages, else None."""
+    try:
+        result = json_loads(response_text)
+    except (TypeError, json.JSONDecodeError):
+        return None
+    if not isinstance(result, dict):
+        return None
+    idea = result.get("investment_idea")
+    if not isinstance(idea, str) or not idea.strip():
+        return None
+    for key in ("market_anomaly", "trading_strategy", "investment_method"):
+        if not isinstance(result.get(key), dict) or not result[key]:
+            return None
+    return result
+
+
+def generate_investment_method_batched_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Generate the idea, anomaly, strategy and refined method in one call.
+
+    Sets batched_status to "failed" when the combined response is missing
+    a stage, so the subgraph can fall back to the sequential nodes.
+    """
+    market_insights = state.get("market_insights", "")
+    research_papers = state.get("research_papers", "")
+    investment_goals = state.get("investment_goals", [])
+    constraints = state.get("constraints", [])
+    llm_name = state.get("llm_name", "gpt-4o-mini-2024-07-18")
+
+    client = get_client()
+
+    user_message = f"""Market Insights:
+{market_insights}
+
+Research Papers Summary:
+{research_papers}
+
+Investment Goals:
+{prompt_json(investment_goals)}
+
+Constraints:
+{prompt_json(constraints)}"""
+
+    try:
+        response_text = cached_chat_complete(
+            client,
+            use_cache=state.get("use_cache", False),
+            model=llm_name,
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": user_message},
+            ],
+            temperature=0.7,
+            max_tokens=6000,
+            response_format={"type": "json_object"}
+        )
+        result = _parse_batched_response(response_text)
+    except Exception as e:
+        print(f"Error generating batched investment method: {e}")
+        result = None
+
+    if result is None:
+        print("Batched generation incomplete; falling back to sequential nodes")
+        state["batched_status"] = "failed"
+        return state
+
+    investment_idea = result["investment_idea"]
+    market_anomaly = result["market_anomaly"]
+    trading_strategy = result["trading_strategy"]
+    investment_method = result["investment_method"]
+
+    # Save the same artifacts as the sequential nodes
+    save_dir = state.get("save_dir", "./stock_research_output")
+    method_dir = os.path.join(save_dir, "investment_method")
+    os.makedirs(method_dir, exist_ok=True)
+
+    with open(os.path.join(method_dir, "investment_idea.md"), "w") as f:
+        f.write(investment_idea)
+    write_json(os.path.join(method_dir, "market_anomaly.json"), market_anomaly)
+    write_json(os.path.join(method_dir, "trading_strategy.json"), trading_strategy)
+    save_investment_method(
+        save_dir, investment_idea, market_anomaly, trading_strategy, investment_method
+    )
+
+    # Update state
+    state["investment_idea"] = investment_idea
+    state["market_anomaly"] = market_anomaly
+    state["trading_strategy"] = trading_strategy
+    state["investment_method"] = investment_method
+    state["batched_status"] = "success"
+
+    print(f"Generated investment method in one call: {investment_method.get('method_name', 'Unknown')}")
+
+    return state
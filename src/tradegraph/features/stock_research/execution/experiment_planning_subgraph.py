@@ -4,7 +4,7 @@ This subgraph creates comprehensive experiment plans for testing investment meth
 """
 
 from typing import Any, Dict
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph, START, END
 from ....core.base import BaseSubgraph
 from .nodes.design_experiment import design_experiment_node
 from .nodes.prepare_datasets import prepare_datasets_node
@@ -35,11 +35,14 @@ class ExperimentPlanningSubgraph(BaseSubgraph):
         workflow.add_node("define_metrics", define_metrics_node)
         workflow.add_node("create_backtest_code", create_backtest_code_node)
         
-        # Define flow
-        workflow.set_entry_point("design_experiment")
+        # Define flow: metrics only depend on the strategy, so they are
+        # defined while the experiment design and datasets are prepared.
+        workflow.add_edge(START, "design_experiment")
+        workflow.add_edge(START, "define_metrics")
         workflow.add_edge("design_experiment", "prepare_datasets")
-        workflow.add_edge("prepare_datasets", "define_metrics")
-        workflow.add_edge("define_metrics", "create_backtest_code")
+        workflow.add_edge(
+            ["prepare_datasets", "define_metrics"], "create_backtest_code"
+        )
         workflow.add_edge("create_backtest_code", END)
         
         return workflow.compile()
@@ -61,7 +64,7 @@ class ExperimentPlanningSubgraph(BaseSubgraph):
                 - evaluation_metrics: Performance metrics to calculate
                 - backtest_code: Executable backtesting code
         """
-        graph = self.build_graph()
+        graph = self.graph
         
         # Set defaults
         if "llm_name" not in state:
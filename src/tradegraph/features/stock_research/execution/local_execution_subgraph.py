@@ -75,7 +75,7 @@ class LocalExecutionSubgraph(BaseSubgraph):
                 - performance_metrics: Calculated metrics
                 - execution_status: success/failed
         """
-        graph = self.build_graph()
+        graph = self.graph
         
         # Set defaults
         if "llm_name" not in state:
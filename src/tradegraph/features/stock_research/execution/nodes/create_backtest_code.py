@@ -3,7 +3,8 @@
 import os
 import json
 from typing import Dict, Any
-from openai import OpenAI
+
+from tradegraph.utils.openai_client import get_client
 
 
 def create_backtest_code_node(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -18,7 +19,7 @@ def create_backtest_code_node(state: Dict[str, Any]) -> Dict[str, Any]:
     experiment_design = state.get("experiment_design", {})
     llm_name = state.get("llm_name", "gpt-4o-mini-2024-07-18")
     
-    client = OpenAI()
+    client = get_client()
     
     prompt = f"""Create complete, executable Python code for backtesting this trading strategy.
 
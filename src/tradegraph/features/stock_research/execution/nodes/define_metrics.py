@@ -3,7 +3,8 @@
 import os
 import json
 from typing import Dict, Any
-from openai import OpenAI
+
+from tradegraph.utils.openai_client import get_client
 
 
 def define_metrics_node(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -15,7 +16,7 @@ def define_metrics_node(state: Dict[str, Any]) -> Dict[str, Any]:
     investment_goals = state.get("investment_goals", [])
     llm_name = state.get("llm_name", "gpt-4o-mini-2024-07-18")
     
-    client = OpenAI()
+    client = get_client()
     
     prompt = f"""Define comprehensive evaluation metrics for this trading strategy.
 
@@ -204,12 +205,11 @@ Ensure metrics align with investment goals and provide comprehensive evaluation.
     
     # Save metrics specification
     save_dir = state.get("save_dir", "./stock_research_output")
+    os.makedirs(os.path.join(save_dir, "experiment"), exist_ok=True)
     with open(os.path.join(save_dir, "experiment", "evaluation_metrics.json"), "w") as f:
         json.dump(evaluation_metrics, f, indent=2)
     
-    # Update state
-    state["evaluation_metrics"] = evaluation_metrics
-    
     print("Evaluation metrics defined")
     
-    return state
\ No newline at end of file
+    # Return only this node's output: it runs alongside the design branch
+    return {"evaluation_metrics": evaluation_metrics}
\ No newline at end of file
@@ -3,7 +3,8 @@
 import os
 import json
 from typing import Dict, Any
-from openai import OpenAI
+
+from tradegraph.utils.openai_client import get_client
 
 
 def design_experiment_node(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -17,7 +18,7 @@ def design_experiment_node(state: Dict[str, Any]) -> Dict[str, Any]:
     test_period = state.get("test_period", "2019-2024")
     llm_name = state.get("llm_name", "gpt-4o-mini-2024-07-18")
     
-    client = OpenAI()
+    client = get_client()
     
     prompt = f"""Design a comprehensive experiment plan for testing this trading strategy.
 
@@ -165,9 +166,7 @@ Design an experiment that will thoroughly validate the strategy and identify any
     with open(os.path.join(save_dir, "experiment", "experiment_design.json"), "w") as f:
         json.dump(experiment_design, f, indent=2)
     
-    # Update state
-    state["experiment_design"] = experiment_design
-    
     print("Experiment design completed")
     
-    return state
\ No newline at end of file
+    # Return only this node's output: define_metrics runs in the same step
+    return {"experiment_design": experiment_design}
\ No newline at end of file
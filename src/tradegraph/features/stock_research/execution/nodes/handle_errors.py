@@ -3,7 +3,8 @@
 import os
 import json
 from typing import Dict, Any
-from openai import OpenAI
+
+from tradegraph.utils.openai_client import get_client
 
 
 def handle_errors_node(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -16,7 +17,7 @@ def handle_errors_node(state: Dict[str, Any]) -> Dict[str, Any]:
     backtest_code = state.get("backtest_code", "")
     llm_name = state.get("llm_name", "gpt-4o-mini-2024-07-18")
     
-    client = OpenAI()
+    client = get_client()
     
     # Combine all error information
     error_context = {
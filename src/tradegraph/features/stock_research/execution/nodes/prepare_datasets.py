@@ -3,7 +3,8 @@
 import os
 import json
 from typing import Dict, Any
-from openai import OpenAI
+
+from tradegraph.utils.openai_client import get_client
 
 
 def prepare_datasets_node(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -15,7 +16,7 @@ def prepare_datasets_node(state: Dict[str, Any]) -> Dict[str, Any]:
     experiment_design = state.get("experiment_design", {})
     llm_name = state.get("llm_name", "gpt-4o-mini-2024-07-18")
     
-    client = OpenAI()
+    client = get_client()
     
     prompt = f"""Define comprehensive dataset requirements for this trading strategy backtest.
 
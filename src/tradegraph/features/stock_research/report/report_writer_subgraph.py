@@ -57,7 +57,7 @@ class ReportWriterSubgraph(BaseSubgraph):
                 - final_report: Complete markdown report
                 - html_report: HTML version
         """
-        graph = self.build_graph()
+        graph = self.graph
         
         # Set defaults
         if "llm_name" not in state:
@@ -57,7 +57,7 @@ class InvestmentPapersSubgraph(BaseSubgraph):
                 - paper_contents: Full paper contents
                 - paper_summaries: Summaries of papers
         """
-        graph = self.build_graph()
+        graph = self.graph
         
         # Set defaults
         if "llm_name" not in state:
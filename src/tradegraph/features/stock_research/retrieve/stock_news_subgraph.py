@@ -58,7 +58,7 @@ class StockNewsSubgraph(BaseSubgraph):
                 - filtered_news: List of relevant news
                 - news_summary: Summary of important news
         """
-        graph = self.build_graph()
+        graph = self.graph
         
         # Set default values
         if "llm_name" not in state:
@@ -14,11 +14,7 @@ that should be cited at specific placeholder positions in a manuscript.
 
 **Format**
 Output must be a valid Python dictionary literal that can be parsed by `ast.literal_eval`
-and must have exactly **{{ n_queries }} keys**:
-
-{% for i in range(1, n_queries + 1) -%}
-    - `"generated_query_{{ i }}"`: string
-{%- endfor %}
+and must have exactly one key, `"queries"`, whose value is a list of exactly **{{ n_queries }} strings**.
 
 No extra text, no markdown, no backticks.
 
@@ -1,9 +1,11 @@
+import re
 from logging import getLogger
 from typing import Any, Protocol, runtime_checkable
 
 import requests
 
 from tradegraph.services.api_client.base_http_client import BaseHTTPClient
+from tradegraph.services.api_client.rate_limit import HeaderAwareLimiter
 from tradegraph.services.api_client.response_parser import ResponseParser
 from tradegraph.services.api_client.retry_policy import make_retry_policy, raise_for_status
 
@@ -11,6 +13,24 @@ logger = getLogger(__name__)
 
 ARXIV_RETRY = make_retry_policy()
 
+# arXiv asks API users for no more than one request every three seconds;
+# the limiter is shared by every client instance in the process.
+ARXIV_RATE_LIMITER = HeaderAwareLimiter(max_rate=1, time_period=3.0)
+
+# Maximum number of IDs sent in one id_list query.
+MAX_ID_LIST_SIZE = 100
+
+_VERSION_RE = re.compile(r"v\d+$")
+
+
+def base_arxiv_id(arxiv_id: str) -> str:
+    """Strip the version suffix: "1706.03762v5" -> "1706.03762".
+
+    Only a trailing vN is removed, so old-style IDs such as "solv-int/9901001"
+    keep their archive name.
+    """
+    return _VERSION_RE.sub("", arxiv_id.strip())
+
 
 @runtime_checkable
 class ResponseParserProtocol(Protocol):
@@ -24,7 +44,11 @@ class ArxivClient(BaseHTTPClient):
         default_headers: dict[str, str] | None = None,
         parser: ResponseParserProtocol | None = None,
     ):
-        super().__init__(base_url=base_url, default_headers=default_headers)
+        super().__init__(
+            base_url=base_url,
+            default_headers=default_headers,
+            rate_limiter=ARXIV_RATE_LIMITER,
+        )
         self._parser = parser or ResponseParser()
 
     @ARXIV_RETRY
@@ -119,7 +143,7 @@ class ArxivClient(BaseHTTPClient):
         if not arxiv_id.strip():
             raise ValueError("arxiv_id must be provided")
 
-        clean_id = arxiv_id.strip().split("v")[0]
+        clean_id = base_arxiv_id(arxiv_id)
 
         params = {
             "id_list": clean_id,
@@ -130,6 +154,38 @@ class ArxivClient(BaseHTTPClient):
 
         return self._parser.parse(response, as_="xml")
 
+    @ARXIV_RETRY
+    def get_papers_by_ids(
+        self,
+        arxiv_ids: list[str],
+        timeout: float = 30.0,
+    ) -> str:
+        """
+        Get paper details for several arXiv IDs with one id_list query.
+
+        Args:
+            arxiv_ids: arXiv IDs (at most MAX_ID_LIST_SIZE)
+            timeout: Request timeout in seconds
+
+        Returns:
+            XML string response from arXiv API, one entry per found paper
+        """
+        if not arxiv_ids:
+            raise ValueError("arxiv_ids must be provided")
+        if len(arxiv_ids) > MAX_ID_LIST_SIZE:
+            raise ValueError(f"At most {MAX_ID_LIST_SIZE} IDs per request")
+
+        clean_ids = [base_arxiv_id(arxiv_id) for arxiv_id in arxiv_ids]
+
+        params = {
+            "id_list": ",".join(clean_ids),
+            "max_results": len(clean_ids),
+        }
+        response = self.get(path="query", params=params, timeout=timeout)
+        raise_for_status(response, path="query")
+
+        return self._parser.parse(response, as_="xml")
+
 
 if __name__ == "__main__":
     import feedparser
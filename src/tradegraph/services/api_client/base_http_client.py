@@ -3,6 +3,8 @@ import logging
 import httpx
 import requests
 
+from tradegraph.services.api_client.rate_limit import HeaderAwareLimiter
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,10 +15,12 @@ class BaseHTTPClient:
         *,
         default_headers: dict[str, str] | None = None,
         session: requests.Session | None = None,
+        rate_limiter: HeaderAwareLimiter | None = None,
     ):
         self.base_url = base_url.rstrip("/")
         self.default_headers = default_headers or {}
         self.session = session or requests.Session()
+        self.rate_limiter = rate_limiter
 
     def request(
         self,
@@ -32,6 +36,8 @@ class BaseHTTPClient:
         url = f"{self.base_url}/{path.lstrip('/')}"
         headers = {**self.default_headers, **(headers or {})}
 
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
         try:
             response = self.session.request(
                 method=method.upper(),
@@ -42,10 +48,16 @@ class BaseHTTPClient:
                 stream=stream,
                 timeout=timeout,
             )
-            return response
         except Exception as e:
             logger.warning(f"[{self.__class__.__name__}] {method} {url}: {e}")
             raise
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(response.headers)
+            if response.status_code == 429:
+                self.rate_limiter.shrink()
+            elif response.ok:
+                self.rate_limiter.relax()
+        return response
 
     def get(self, path: str, **kwargs) -> requests.Response:
         return self.request("GET", path, **kwargs)
@@ -56,6 +68,9 @@ class BaseHTTPClient:
     def put(self, path: str, **kwargs) -> requests.Response:
         return self.request("PUT", path, **kwargs)
 
+    def patch(self, path: str, **kwargs) -> requests.Response:
+        return self.request("PATCH", path, **kwargs)
+
 
 class AsyncBaseHTTPClient:
     def __init__(
@@ -1,16 +1,19 @@
 import base64
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, Literal, Protocol, runtime_checkable
+from urllib.parse import quote
 
 import requests  # type: ignore
+from requests.adapters import HTTPAdapter
 from tenacity import (
     before_sleep_log,
     retry,
     retry_if_exception_type,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
 )
 
 from tradegraph.services.api_client.base_http_client import BaseHTTPClient
@@ -37,10 +40,12 @@ class GithubClientFatalError(GithubClientError): ...
 
 DEFAULT_MAX_RETRIES = 10
 DEFAULT_INITIAL_WAIT = 1.0
+RAW_CONTENT_BASE_URL = "https://raw.githubusercontent.com"
+MAX_PARALLEL_REQUESTS = 16
 
 GITHUB_RETRY = retry(
     stop=stop_after_attempt(DEFAULT_MAX_RETRIES),
-    wait=wait_exponential(multiplier=DEFAULT_INITIAL_WAIT),
+    wait=wait_random_exponential(multiplier=DEFAULT_INITIAL_WAIT),
     before_sleep=before_sleep_log(logger, logging.WARNING),
     reraise=True,
     retry=(
@@ -69,6 +74,11 @@ class GithubClient(BaseHTTPClient):
             base_url=base_url,
             default_headers={**auth_headers, **(default_headers or {})},
         )
+        # Enough pooled connections for the parallel file and blob requests.
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=MAX_PARALLEL_REQUESTS),
+        )
         self._parser = parser or ResponseParser()
 
     @staticmethod
@@ -430,6 +440,159 @@ class GithubClient(BaseHTTPClient):
                 self._raise_for_status(response, path)
                 return None
 
+    # --------------------------------------------------
+    # Git data
+    # --------------------------------------------------
+
+    @GITHUB_RETRY
+    def _get_git_json(self, path: str) -> dict:
+        response = self.get(path=path)
+        match response.status_code:
+            case 200:
+                return self._parser.parse(response, as_="json")
+            case 404:
+                logger.error(f"Resource not found (404): {path}")
+                raise GithubClientFatalError(f"Resource not found (404): {path}")
+            case _:
+                self._raise_for_status(response, path)
+
+    @GITHUB_RETRY
+    def _post_git_json(self, path: str, payload: dict) -> dict:
+        response = self.post(path=path, json=payload)
+        match response.status_code:
+            case 200 | 201:
+                return self._parser.parse(response, as_="json")
+            case 404 | 409 | 422:
+                logger.error(f"Git data request failed ({response.status_code}): {path}")
+                raise GithubClientFatalError(
+                    f"Git data request failed ({response.status_code}) for {path}: {response.text}"
+                )
+            case _:
+                self._raise_for_status(response, path)
+
+    @GITHUB_RETRY
+    def get_blob(
+        self, github_owner: str, repository_name: str, blob_sha: str
+    ) -> bytes:
+        # https://docs.github.com/ja/rest/git/blobs?apiVersion=2022-11-28#get-a-blob
+        path = f"/repos/{github_owner}/{repository_name}/git/blobs/{blob_sha}"
+        response = self.get(
+            path=path, headers={"Accept": "application/vnd.github.raw+json"}
+        )
+        match response.status_code:
+            case 200:
+                return self._parser.parse(response, as_="bytes")
+            case 404:
+                logger.warning(f"Blob not found (404): {path}")
+                raise GithubClientFatalError(f"Resource not found (404): {path}")
+            case _:
+                self._raise_for_status(response, path)
+
+    def download_raw_file(
+        self, github_owner: str, repository_name: str, ref: str, file_path: str
+    ) -> bytes | None:
+        # raw.githubusercontent.com is CDN-served and not metered by the REST
+        # API rate limit. Returns None on any failure so callers can fall back.
+        url = (
+            f"{RAW_CONTENT_BASE_URL}/{github_owner}/{repository_name}/"
+            f"{quote(ref)}/{quote(file_path)}"
+        )
+        token = os.getenv("GITHUB_PERSONAL_ACCESS_TOKEN")
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        try:
+            response = self.session.get(url, headers=headers, timeout=10.0)
+        except requests.RequestException as e:
+            logger.warning(f"Raw download failed for {url}: {e}")
+            return None
+        if response.status_code != 200:
+            logger.warning(f"Raw download failed ({response.status_code}): {url}")
+            return None
+        return response.content
+
+    def create_blob(
+        self, github_owner: str, repository_name: str, file_content: bytes
+    ) -> str:
+        # https://docs.github.com/ja/rest/git/blobs?apiVersion=2022-11-28#create-a-blob
+        blob = self._post_git_json(
+            f"/repos/{github_owner}/{repository_name}/git/blobs",
+            {
+                "content": base64.b64encode(file_content).decode(),
+                "encoding": "base64",
+            },
+        )
+        return blob["sha"]
+
+    @GITHUB_RETRY
+    def _update_branch_ref(
+        self, github_owner: str, repository_name: str, branch_name: str, sha: str
+    ) -> None:
+        # https://docs.github.com/ja/rest/git/refs?apiVersion=2022-11-28#update-a-reference
+        path = f"/repos/{github_owner}/{repository_name}/git/refs/heads/{branch_name}"
+        response = self.patch(path=path, json={"sha": sha})
+        match response.status_code:
+            case 200:
+                logger.info(f"Branch updated (200): {branch_name} → {sha}")
+            case 422:
+                logger.error(f"Branch update rejected (422): {path}")
+                raise GithubClientFatalError(
+                    f"Branch update rejected (422) for {path}: {response.text}"
+                )
+            case _:
+                self._raise_for_status(response, path)
+
+    def commit_files_bytes(
+        self,
+        github_owner: str,
+        repository_name: str,
+        branch_name: str,
+        files: list[tuple[str, bytes]],
+        commit_message: str,
+        max_workers: int = 8,
+    ) -> bool:
+        """Commit several files to `branch_name` as a single commit.
+
+        Uses the Git data API: blobs are created in parallel, then one tree,
+        one commit and one ref update follow, instead of a Contents API
+        read-and-write round trip per file.
+        """
+        if not files:
+            return True
+        repo = f"/repos/{github_owner}/{repository_name}"
+
+        ref = self._get_git_json(f"{repo}/git/ref/heads/{branch_name}")
+        head_sha = ref["object"]["sha"]
+        head_commit = self._get_git_json(f"{repo}/git/commits/{head_sha}")
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as pool:
+            blob_shas = list(
+                pool.map(
+                    lambda item: self.create_blob(
+                        github_owner, repository_name, item[1]
+                    ),
+                    files,
+                )
+            )
+
+        tree = self._post_git_json(
+            f"{repo}/git/trees",
+            {
+                "base_tree": head_commit["tree"]["sha"],
+                "tree": [
+                    {"path": file_path, "mode": "100644", "type": "blob", "sha": sha}
+                    for (file_path, _), sha in zip(files, blob_shas)
+                ],
+            },
+        )
+        commit = self._post_git_json(
+            f"{repo}/git/commits",
+            {"message": commit_message, "tree": tree["sha"], "parents": [head_sha]},
+        )
+        self._update_branch_ref(
+            github_owner, repository_name, branch_name, commit["sha"]
+        )
+        logger.info(f"Committed {len(files)} files to {branch_name}: {commit['sha']}")
+        return True
+
     # --------------------------------------------------
     # Github Actions
     # --------------------------------------------------
@@ -1,12 +1,11 @@
-import ast
 import logging
 import os
-import re
 from typing import Any, Literal
 
 from google import genai
 from pydantic import BaseModel
 
+from tradegraph.utils.fast_json import json_loads
 from tradegraph.utils.logging_utils import setup_logging
 
 setup_logging()
@@ -130,10 +129,9 @@ class GoogelGenAIClient:
                 "response_schema": list[data_model],
             },
         )
-        output = response.text
-        if "null" in output:
-            output = re.sub(r"(?<=[:,\s])null(?=[,\s}])", "None", output)
-        output = ast.literal_eval(output)[0]
+        # The response is JSON (response_mime_type above), so decode it as
+        # such instead of rewriting null and evaluating it as a Python literal.
+        output = json_loads(response.text)[0]
         cost = self._calculate_cost(
             model_name,
             response.usage_metadata.prompt_token_count,
@@ -147,6 +145,14 @@ class GoogelGenAIClient:
         result = self.client.models.embed_content(model=model_name, contents=message)
         return result.embeddings[0].values
 
+    def text_embedding_batch(
+        self, messages: list[str], model_name: str = "gemini-embedding-001"
+    ) -> list[list[float]]:
+        # embed_content accepts a list of contents and returns one embedding
+        # per entry, in order.
+        result = self.client.models.embed_content(model=model_name, contents=messages)
+        return [embedding.values for embedding in result.embeddings]
+
 
 if __name__ == "__main__":
 
@@ -1,7 +1,9 @@
 import logging
+import threading
 from logging import getLogger
 from typing import Literal
 
+import openai
 from google.genai import errors as genai_errors
 from requests.exceptions import ConnectionError, HTTPError, RequestException, Timeout
 from tenacity import (
@@ -10,7 +12,7 @@ from tenacity import (
     retry,
     retry_if_exception_type,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
 )
 
 from tradegraph.services.api_client.llm_client.google_genai_client import (
@@ -26,7 +28,9 @@ logger = getLogger(__name__)
 
 LLM_MODEL = Literal[OPENAI_MODEL, VERTEXAI_MODEL]
 DEFAULT_MAX_RETRIES = 10
-WAIT_POLICY = wait_exponential(multiplier=1.0, max=180.0)
+DEFAULT_MAX_CONCURRENCY = 5
+# Jittered backoff so concurrent callers hitting a 429 do not retry in lockstep.
+WAIT_POLICY = wait_random_exponential(multiplier=1.0, max=180.0)
 
 RETRY_EXC = (
     ConnectionError,
@@ -34,8 +38,15 @@ RETRY_EXC = (
     Timeout,
     RequestException,
     genai_errors.APIError,
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError,
 )
 
+# Shared across all facade instances so parallel nodes cannot exceed the cap.
+_LLM_SEMAPHORE = threading.BoundedSemaphore(DEFAULT_MAX_CONCURRENCY)
+
 LLM_RETRY = retry(
     retry=retry_if_exception_type(RETRY_EXC),
     stop=stop_after_attempt(DEFAULT_MAX_RETRIES),
@@ -58,17 +69,53 @@ class LLMFacadeClient:
 
     @LLM_RETRY
     def generate(self, message: str):
-        return self.client.generate(model_name=self.llm_name, message=message)
+        with _LLM_SEMAPHORE:
+            return self.client.generate(model_name=self.llm_name, message=message)
 
     @LLM_RETRY
     def structured_outputs(self, message: str, data_model):
-        return self.client.structured_outputs(
-            model_name=self.llm_name, message=message, data_model=data_model
+        with _LLM_SEMAPHORE:
+            return self.client.structured_outputs(
+                model_name=self.llm_name, message=message, data_model=data_model
+            )
+
+    def batch_structured_outputs(
+        self, requests: dict[str, tuple[str, type]], poll_interval: float = 30.0
+    ):
+        """
+        Run structured-output requests via the OpenAI Batch API (only available for OpenAI models).
+
+        Args:
+            requests: Mapping of custom_id to (message, data_model)
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            Tuple of ({custom_id: output}, cost)
+        """
+        if not hasattr(self.client, "batch_structured_outputs"):
+            raise ValueError(f"Batch API not supported for {self.llm_name}")
+        return self.client.batch_structured_outputs(
+            model_name=self.llm_name, requests=requests, poll_interval=poll_interval
         )
 
     @LLM_RETRY
     def text_embedding(self, message: str, model_name: str = "gemini-embedding-001"):
-        return self.client.text_embedding(message=message, model_name=model_name)
+        with _LLM_SEMAPHORE:
+            return self.client.text_embedding(message=message, model_name=model_name)
+
+    @LLM_RETRY
+    def text_embedding_batch(
+        self, messages: list[str], model_name: str = "gemini-embedding-001"
+    ) -> list[list[float]]:
+        """Embed several texts in one request (only available for Gemini models)."""
+        if not messages:
+            return []
+        if not hasattr(self.client, "text_embedding_batch"):
+            raise ValueError(f"Batch embedding not supported for {self.llm_name}")
+        with _LLM_SEMAPHORE:
+            return self.client.text_embedding_batch(
+                messages=messages, model_name=model_name
+            )
 
     @LLM_RETRY
     def web_search(self, message: str):
@@ -83,4 +130,5 @@ class LLMFacadeClient:
         """
         if not hasattr(self.client, "web_search"):
             raise ValueError(f"Web search not supported for {self.llm_name}")
-        return self.client.web_search(model_name=self.llm_name, message=message)
+        with _LLM_SEMAPHORE:
+            return self.client.web_search(model_name=self.llm_name, message=message)
@@ -1,15 +1,39 @@
 import json
 import logging
 import re
+import time
 from typing import Literal
 
 import tiktoken
-from openai import OpenAI
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
 from pydantic import BaseModel
+from tenacity import wait_random_exponential
 
+from tradegraph.services.api_client.retry_policy import make_retry_policy
+from tradegraph.utils.fast_json import json_loads
 from tradegraph.utils.logging_utils import setup_logging
 
 setup_logging()
+logger = logging.getLogger(__name__)
+
+# Applied to each Batch API call separately: a transient error while polling
+# retries the poll instead of resubmitting (and re-billing) the whole job.
+BATCH_API_RETRY = make_retry_policy(
+    max_retries=5,
+    wait=wait_random_exponential(min=1, max=30),
+    retryable_exc=(
+        APIConnectionError,
+        APITimeoutError,
+        InternalServerError,
+        RateLimitError,
+    ),
+)
 
 # https://platform.openai.com/docs/models
 OPENAI_MODEL_INFO = {
@@ -87,6 +111,60 @@ OPENAI_MODEL = Literal[
 ]
 
 
+def run_chat_completion_batch(
+    client: OpenAI, bodies: dict[str, dict], poll_interval: float = 30.0
+) -> dict[str, dict | None]:
+    """Run chat completions through the Batch API (50% token price).
+
+    `bodies` maps a custom_id to the arguments of one chat completion. Blocks
+    until the batch finishes and returns the response body per custom_id
+    (None for failed requests). Each upload, status poll and download is
+    retried on its own by BATCH_API_RETRY.
+    """
+    lines = [
+        json.dumps(
+            {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body,
+            }
+        )
+        for custom_id, body in bodies.items()
+    ]
+    batch_file = BATCH_API_RETRY(client.files.create)(
+        file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch",
+    )
+    batch = BATCH_API_RETRY(client.batches.create)(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    logger.info(f"Submitted batch {batch.id} with {len(lines)} requests")
+
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(poll_interval)
+        batch = BATCH_API_RETRY(client.batches.retrieve)(batch.id)
+    if batch.status != "completed" or batch.output_file_id is None:
+        raise RuntimeError(f"Batch {batch.id} finished with status {batch.status}")
+
+    results: dict[str, dict | None] = {custom_id: None for custom_id in bodies}
+    content = BATCH_API_RETRY(client.files.content)(batch.output_file_id).text
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") != 200:
+            logger.warning(
+                f"Batch request {record['custom_id']} failed: {record.get('error')}"
+            )
+            continue
+        results[record["custom_id"]] = response["body"]
+    return results
+
+
 class OpenAIClient:
     def __init__(self) -> None:
         self.logger = logging.getLogger(__name__)
@@ -151,8 +229,7 @@ class OpenAIClient:
             input=message,
             text_format=data_model,
         )
-        output = response.output_text
-        output = json.loads(output)
+        output = json_loads(response.output_text)
         cost = self._calculate_cost(
             model_name,
             response.usage.input_tokens,
@@ -160,6 +237,51 @@ class OpenAIClient:
         )
         return output, cost
 
+    def batch_structured_outputs(
+        self,
+        model_name: OPENAI_MODEL,
+        requests: dict[str, tuple[str, type[BaseModel]]],
+        poll_interval: float = 30.0,
+    ) -> tuple[dict[str, dict | None], float]:
+        """Run structured-output requests through the Batch API (50% token price).
+
+        `requests` maps a custom_id to `(message, data_model)`. Blocks until the
+        batch finishes and returns the parsed output per custom_id (None for
+        failed requests) together with the total cost.
+        """
+        bodies = {}
+        for custom_id, (message, data_model) in requests.items():
+            message = message.encode("utf-8", "ignore").decode("utf-8")
+            message = self._truncate_prompt(model_name, message)
+            bodies[custom_id] = {
+                "model": model_name,
+                "messages": [{"role": "user", "content": message}],
+                "response_format": {
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": data_model.__name__,
+                        "schema": data_model.model_json_schema(),
+                    },
+                },
+            }
+
+        outputs: dict[str, dict | None] = {}
+        total_cost = 0.0
+        for custom_id, body in run_chat_completion_batch(
+            self.client, bodies, poll_interval=poll_interval
+        ).items():
+            if body is None:
+                outputs[custom_id] = None
+                continue
+            outputs[custom_id] = json_loads(body["choices"][0]["message"]["content"])
+            # Batch API requests are billed at half the synchronous price.
+            total_cost += 0.5 * self._calculate_cost(
+                model_name,
+                body["usage"]["prompt_tokens"],
+                body["usage"]["completion_tokens"],
+            )
+        return outputs, total_cost
+
     def text_embedding(self, message: str, model_name: str = "gemini-embedding-001"):
         return
 
@@ -198,7 +320,7 @@ class OpenAIClient:
         if match:
             assistant_content = match.group(1)
 
-        output = json.loads(assistant_content)
+        output = json_loads(assistant_content)
 
         cost = self._calculate_cost(
             model_name,
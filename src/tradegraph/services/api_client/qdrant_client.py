@@ -80,6 +80,33 @@ class QdrantClient(BaseHTTPClient):
 
         return self._parser.parse(response, as_="json")
 
+    def query_points_batch(
+        self,
+        collection_name: str,
+        query_vectors: list[list[float]],
+        limit: int = 10,
+        timeout: float = 15.0,
+    ) -> Any:
+        # https://api.qdrant.tech/api-reference/search/query-batch-points
+        payload = {
+            "searches": [
+                {
+                    "query": {"nearest": query_vector},
+                    "limit": limit,
+                    "with_payload": True,
+                }
+                for query_vector in query_vectors
+            ]
+        }
+        response = self.post(
+            path=f"/collections/{collection_name}/points/query/batch",
+            json=payload,
+            timeout=timeout,
+        )
+        raise_for_status(response, path="search")
+
+        return self._parser.parse(response, as_="json")
+
     def retrieve_a_points(
         self, collection_name: str, id: int | str, timeout: float = 15.0
     ):
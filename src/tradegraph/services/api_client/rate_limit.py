@@ -0,0 +1,82 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from logging import getLogger
+from typing import Mapping
+
+logger = getLogger(__name__)
+
+_MAX_INTERVAL = 60.0
+
+
+def _parse_retry_after(value: str) -> float | None:
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_reset(value: str) -> float | None:
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    # Some APIs send an epoch timestamp, others the seconds left.
+    return max(0.0, reset - time.time()) if reset > 1e9 else reset
+
+
+class HeaderAwareLimiter:
+    """Spaces out requests to one API and honors its rate-limit headers.
+
+    Callers block in `acquire` until their slot comes up, so a pool of worker
+    threads shares the budget of `max_rate` requests per `time_period`
+    seconds. `update` pauses everyone when the server reports an exhausted
+    quota, and `shrink` halves the rate after a 429 that slipped through;
+    `relax` then eases it back toward `max_rate` as requests succeed again.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        if max_rate <= 0 or time_period <= 0:
+            raise ValueError("max_rate and time_period must be positive")
+        self.base_interval = time_period / max_rate
+        self.interval = self.base_interval
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_at)
+            self._next_at = slot + self.interval
+        if (delay := slot - now) > 0:
+            time.sleep(delay)
+
+    def _pause(self, seconds: float) -> None:
+        with self._lock:
+            self._next_at = max(self._next_at, time.monotonic() + seconds)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        pause = None
+        if retry_after := headers.get("Retry-After"):
+            pause = _parse_retry_after(retry_after)
+        elif headers.get("X-RateLimit-Remaining") == "0":
+            if reset := headers.get("X-RateLimit-Reset"):
+                pause = _parse_reset(reset)
+        if pause:
+            logger.info(f"Rate limit reached; pausing requests for {pause:.1f}s")
+            self._pause(pause)
+
+    def shrink(self, factor: float = 2.0) -> None:
+        with self._lock:
+            self.interval = min(self.interval * factor, _MAX_INTERVAL)
+
+    def relax(self, factor: float = 1.25) -> None:
+        with self._lock:
+            self.interval = max(self.interval / factor, self.base_interval)
+
+
+__all__ = ["HeaderAwareLimiter"]
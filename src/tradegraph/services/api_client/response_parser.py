@@ -4,6 +4,8 @@ from typing import Any, Literal, overload
 import httpx
 import requests
 
+from tradegraph.utils.fast_json import json_loads
+
 logger = logging.getLogger(__name__)
 
 Response = requests.Response | httpx.Response
@@ -40,7 +42,16 @@ class ResponseParser:
     def _to_json(self, response: Response) -> dict:
         if "application/json" not in response.headers.get("Content-Type", ""):
             raise UnexpectedContentTypeError("Expected JSON response")
-        return response.json() if response.text.strip() else {}
+        content = response.content
+        if not content.strip():
+            return {}
+        # Decode the raw bytes directly; for batch responses with hundreds of
+        # papers this beats requests' text decoding plus stdlib json.
+        try:
+            return json_loads(content)
+        except ValueError:
+            # e.g. NaN literals or a non-UTF-8 charset, which orjson rejects.
+            return response.json()
 
     def _to_text(self, response: Response) -> str:
         if "text/" not in response.headers.get("Content-Type", ""):
@@ -15,7 +15,12 @@ from tenacity.wait import wait_base as WaitBase
 from tradegraph.services.api_client.response_parser import Response
 
 
-class HTTPClientError(RuntimeError): ...
+class HTTPClientError(RuntimeError):
+    def __init__(self, message: str, *, status_code: int | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
 class HTTPClientRetryableError(HTTPClientError): ...
 class HTTPClientFatalError(HTTPClientError): ...
 
@@ -52,5 +57,7 @@ def raise_for_status(response: Response, *, path: str = "") -> None:
     if 200 <= code < 300:
         return
     if code in (408, 429) or 500 <= code < 600:
-        raise HTTPClientRetryableError(f"{code} on {path}: {response.text}")
-    raise HTTPClientFatalError(f"{code} on {path}: {response.text}")
+        raise HTTPClientRetryableError(
+            f"{code} on {path}: {response.text}", status_code=code
+        )
+    raise HTTPClientFatalError(f"{code} on {path}: {response.text}", status_code=code)
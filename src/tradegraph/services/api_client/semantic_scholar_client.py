@@ -4,7 +4,9 @@ from typing import Any, Protocol, runtime_checkable
 
 import requests
 
+from tradegraph.services.api_client.arxiv_client import base_arxiv_id
 from tradegraph.services.api_client.base_http_client import BaseHTTPClient
+from tradegraph.services.api_client.rate_limit import HeaderAwareLimiter
 from tradegraph.services.api_client.response_parser import ResponseParser
 from tradegraph.services.api_client.retry_policy import make_retry_policy, raise_for_status
 
@@ -12,6 +14,26 @@ logger = getLogger(__name__)
 
 SEMANTIC_SCHOLAR_RETRY = make_retry_policy()
 
+# Maximum number of IDs accepted by one /paper/batch request.
+MAX_BATCH_SIZE = 500
+
+# Fields returned by the arXiv ID lookups unless the caller asks for others.
+PAPER_FIELDS = (
+    "paperId",
+    "title",
+    "abstract",
+    "year",
+    "authors",
+    "venue",
+    "externalIds",
+    "openAccessPdf",
+)
+
+# Shared per process: keyed requests get a far larger budget than the
+# unauthenticated pool.
+_RATE_LIMITER_WITH_KEY = HeaderAwareLimiter(max_rate=100, time_period=1.0)
+_RATE_LIMITER_WITHOUT_KEY = HeaderAwareLimiter(max_rate=1, time_period=1.0)
+
 
 @runtime_checkable
 class ResponseParserProtocol(Protocol):
@@ -36,6 +58,9 @@ class SemanticScholarClient(BaseHTTPClient):
         super().__init__(
             base_url=base_url.rstrip("/"),
             default_headers=headers,
+            rate_limiter=(
+                _RATE_LIMITER_WITH_KEY if api_key else _RATE_LIMITER_WITHOUT_KEY
+            ),
         )
         self._parser = parser or ResponseParser()
 
@@ -154,20 +179,8 @@ class SemanticScholarClient(BaseHTTPClient):
         if not arxiv_id.strip():
             raise ValueError("arxiv_id must be provided")
 
-        clean_id = arxiv_id.strip().split("v")[0]
-
-        DEFAULT_FIELDS = (
-            "paperId",
-            "title",
-            "abstract",
-            "year",
-            "authors",
-            "venue",
-            "externalIds",
-            "openAccessPdf",
-        )
-
-        fields = fields or DEFAULT_FIELDS
+        clean_id = base_arxiv_id(arxiv_id)
+        fields = fields or PAPER_FIELDS
 
         path = f"paper/ARXIV:{clean_id}"
         params: dict[str, Any] = {
@@ -178,6 +191,44 @@ class SemanticScholarClient(BaseHTTPClient):
         raise_for_status(resp, path=path)
         return self._parser.parse(resp, as_="json")
 
+    @SEMANTIC_SCHOLAR_RETRY
+    def get_papers_by_arxiv_ids_batch(
+        self,
+        arxiv_ids: list[str],
+        *,
+        fields: tuple[str, ...] | None = None,
+        timeout: float = 60.0,
+    ) -> list[dict[str, Any] | None]:
+        """
+        Get paper details for many arXiv IDs with a single batch request.
+
+        Args:
+            arxiv_ids: arXiv IDs (at most MAX_BATCH_SIZE)
+            fields: Fields to include in response
+            timeout: Request timeout in seconds
+
+        Returns:
+            One entry per input ID, in input order; None for unknown papers
+        """
+        if not arxiv_ids:
+            return []
+        if len(arxiv_ids) > MAX_BATCH_SIZE:
+            raise ValueError(f"At most {MAX_BATCH_SIZE} IDs per batch request")
+
+        fields = fields or PAPER_FIELDS
+
+        path = "paper/batch"
+        params: dict[str, Any] = {
+            "fields": ",".join(fields),
+        }
+        payload = {
+            "ids": [f"ARXIV:{base_arxiv_id(arxiv_id)}" for arxiv_id in arxiv_ids]
+        }
+
+        resp = self.post(path=path, params=params, json=payload, timeout=timeout)
+        raise_for_status(resp, path=path)
+        return self._parser.parse(resp, as_="json")
+
 
 if __name__ == "__main__":
     client = SemanticScholarClient()
@@ -1,9 +1,13 @@
 import logging
 import os
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
 
+# Subgraphs call this from their constructors; a successful check is
+# remembered for the process (failures raise and are not cached).
+@lru_cache(maxsize=None)
 def check_api_key(
     llm_api_key_check: bool = False,
     devin_api_key_check: bool = False,
@@ -66,3 +70,8 @@ def check_api_key(
         full_message = "\n".join(message_lines)
         logger.error(full_message)
         raise RuntimeError("Missing required API keys. Aborting process.")
+
+
+def reset_api_key_cache() -> None:
+    """Forget previous successful checks, e.g. after changing the environment."""
+    check_api_key.cache_clear()
@@ -1,3 +1,4 @@
+import inspect
 import time
 from functools import wraps
 from logging import getLogger
@@ -17,16 +18,10 @@ def time_node(
 ) -> Callable[..., Callable[..., object]]:
     def decorator(func):
         actual_node = node_name or func.__name__
+        header = f"[{subgraph_name}.{actual_node}]".ljust(40)
 
-        @wraps(func)
-        def wrapper(self, state, *args, **kwargs):
-            header = f"[{subgraph_name}.{actual_node}]".ljust(40)
-            logger.info(f"{header} Start")
-            start = time.time()
-
-            result = func(self, state, *args, **kwargs)
-            end = time.time()
-            duration = round(end - start, 4)
+        def _record(state, start: float) -> None:
+            duration = round(time.time() - start, 4)
 
             execution_time = state.get("execution_time", {})
             subgraph_log = execution_time.get(subgraph_name, {})
@@ -38,6 +33,25 @@ def time_node(
             state["execution_time"] = execution_time
 
             logger.info(f"{header} End    Execution Time: {duration:7.4f} seconds")
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(self, state, *args, **kwargs):
+                logger.info(f"{header} Start")
+                start = time.time()
+                result = await func(self, state, *args, **kwargs)
+                _record(state, start)
+                return result
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(self, state, *args, **kwargs):
+            logger.info(f"{header} Start")
+            start = time.time()
+            result = func(self, state, *args, **kwargs)
+            _record(state, start)
             return result
 
         return wrapper
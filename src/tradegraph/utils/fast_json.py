@@ -0,0 +1,53 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib module
+    orjson = None
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON text or bytes.
+
+    Errors are raised as json.JSONDecodeError (orjson's subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def prompt_json(obj: Any, sort_keys: bool = False) -> str:
+    """Serialize `obj` compactly for a prompt; indentation only costs tokens."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, default=str, option=option).decode("utf-8")
+    return json.dumps(
+        obj,
+        default=str,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        sort_keys=sort_keys,
+    )
+
+
+def dumps_indented(obj: Any) -> bytes:
+    """Serialize `obj` as UTF-8 JSON with two-space indentation."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(obj, indent=2, default=str).encode("utf-8")
+
+
+def pretty_json(obj: Any) -> str:
+    return dumps_indented(obj).decode("utf-8")
+
+
+def write_json(path: str, obj: Any) -> None:
+    """Write `obj` to `path` as indented JSON in a single call."""
+    with open(path, "wb") as f:
+        f.write(dumps_indented(obj))
+
+
+__all__ = ["dumps_indented", "json_loads", "pretty_json", "prompt_json", "write_json"]
@@ -0,0 +1,11 @@
+"""Whether httpx clients can negotiate HTTP/2 in this environment."""
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:  # HTTP/2 needs the httpx[http2] extra
+    HTTP2_AVAILABLE = False
+
+
+__all__ = ["HTTP2_AVAILABLE"]
@@ -0,0 +1,231 @@
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from functools import wraps
+from logging import getLogger
+from typing import IO, Any, Callable
+
+from pydantic import BaseModel
+
+logger = getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "tradegraph", "llm_cache.sqlite"
+)
+# Paper metadata lookups live in their own file and are re-fetched after a day.
+DEFAULT_API_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "tradegraph", "api_cache.sqlite"
+)
+API_CACHE_MAX_AGE = 24 * 60 * 60
+
+
+def llm_cache_enabled() -> bool:
+    return os.getenv("TRADEGRAPH_LLM_CACHE", "1").lower() not in ("0", "false", "off")
+
+
+def api_cache_enabled() -> bool:
+    return os.getenv("TRADEGRAPH_API_CACHE", "1").lower() not in ("0", "false", "off")
+
+
+def make_cache_key(*parts: str) -> str:
+    h = hashlib.blake2b(digest_size=32)
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def _stable_repr(value: Any) -> str:
+    # Pydantic models contribute their JSON schema so that schema changes
+    # invalidate previously cached responses.
+    if isinstance(value, type) and issubclass(value, BaseModel):
+        return json.dumps(value.model_json_schema(), sort_keys=True)
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+class LLMResponseCache:
+    """Exact-match response cache persisted in a local SQLite file."""
+
+    def __init__(self, path: str | None = None):
+        self.path = path or os.getenv("TRADEGRAPH_LLM_CACHE_PATH", DEFAULT_CACHE_PATH)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection per operation keeps the cache safe to use from the
+        # worker threads that run concurrent LLM calls.
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, key: str, max_age: float | None = None) -> Any | None:
+        """Return the cached value, ignoring entries older than `max_age` seconds."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, created_at = row
+        if max_age is not None and time.time() - created_at >= max_age:
+            return None
+        return json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created_at) "
+                "VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time()),
+            )
+
+
+_default_cache: LLMResponseCache | None = None
+
+
+def get_default_cache() -> LLMResponseCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = LLMResponseCache()
+    return _default_cache
+
+
+_api_cache: LLMResponseCache | None = None
+
+
+def get_api_cache() -> LLMResponseCache | None:
+    """Cache for API lookups, or None when TRADEGRAPH_API_CACHE=0.
+
+    Read entries with `max_age=API_CACHE_MAX_AGE`.
+    """
+    global _api_cache
+    if not api_cache_enabled():
+        return None
+    if _api_cache is None:
+        _api_cache = LLMResponseCache(
+            os.getenv("TRADEGRAPH_API_CACHE_PATH", DEFAULT_API_CACHE_PATH)
+        )
+    return _api_cache
+
+
+def llm_cache(
+    *key_parts: Any, ignore: tuple[str, ...] = ("client",)
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Cache the JSON-serializable result of an LLM-backed function on disk.
+
+    The key covers the function, its bound arguments (except `ignore`) and any
+    static `key_parts` such as prompt templates or output data models. Empty
+    results are not cached so that failed calls are retried on the next run.
+    A `use_cache` parameter of the decorated function, if it has one, turns
+    the cache on or off per call. Set TRADEGRAPH_LLM_CACHE=0 to bypass the
+    cache everywhere.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(func)
+        static_parts = [_stable_repr(part) for part in key_parts]
+        skipped = (*ignore, "use_cache")
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not llm_cache_enabled():
+                return func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            if not bound.arguments.get("use_cache", True):
+                return func(*args, **kwargs)
+            arguments = {k: v for k, v in bound.arguments.items() if k not in skipped}
+            key = make_cache_key(
+                f"{func.__module__}.{func.__qualname__}",
+                *static_parts,
+                _stable_repr(arguments),
+            )
+
+            cache = get_default_cache()
+            cached = cache.get(key)
+            if cached is not None:
+                logger.info(f"LLM cache hit for {func.__qualname__}")
+                return cached
+
+            result = func(*args, **kwargs)
+            if result:
+                cache.set(key, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def chat_complete(client: Any, out: IO[str] | None = None, **kwargs: Any) -> str:
+    """Return the content of an OpenAI chat completion, uncached.
+
+    When `out` is given the completion is streamed into it as it is generated.
+    """
+    if out is None:
+        response = client.chat.completions.create(**kwargs)
+        return response.choices[0].message.content
+    parts = []
+    for chunk in client.chat.completions.create(stream=True, **kwargs):
+        if chunk.choices and (delta := chunk.choices[0].delta.content):
+            parts.append(delta)
+            out.write(delta)
+            out.flush()
+    return "".join(parts)
+
+
+def cached_chat_complete(
+    client: Any,
+    use_cache: bool = True,
+    out: IO[str] | None = None,
+    complete: Callable[..., str] = chat_complete,
+    **kwargs: Any,
+) -> str:
+    """Return the content of an OpenAI chat completion, cached on disk.
+
+    `kwargs` are passed to `client.chat.completions.create` and together form
+    the cache key (model, messages, sampling parameters, response_format), so
+    replaying a pipeline on identical inputs skips the API call. On a miss the
+    request is made by `complete(client, out, **kwargs)`, which callers can
+    swap for one with retries or the Batch API; a cached response is written
+    to `out` as a whole. Set TRADEGRAPH_LLM_CACHE=0 to bypass the cache.
+    """
+    if not (use_cache and llm_cache_enabled()):
+        return complete(client, out, **kwargs)
+
+    key = make_cache_key("chat.completions", _stable_repr(kwargs))
+    cache = get_default_cache()
+    cached = cache.get(key)
+    if cached is not None:
+        logger.info(f"LLM cache hit for chat completion with {kwargs.get('model')}")
+        if out is not None:
+            out.write(cached)
+        return cached
+
+    content = complete(client, out, **kwargs)
+    if content:
+        cache.set(key, content)
+    return content
+
+
+__all__ = [
+    "API_CACHE_MAX_AGE",
+    "LLMResponseCache",
+    "api_cache_enabled",
+    "cached_chat_complete",
+    "chat_complete",
+    "get_api_cache",
+    "get_default_cache",
+    "llm_cache",
+    "llm_cache_enabled",
+    "make_cache_key",
+]
@@ -0,0 +1,35 @@
+"""Process-wide OpenAI client shared by the stock research nodes."""
+
+import threading
+from typing import Optional
+
+import httpx
+from openai import OpenAI
+
+from tradegraph.utils.http2 import HTTP2_AVAILABLE
+
+_client: Optional[OpenAI] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> OpenAI:
+    """Return the process-wide OpenAI client.
+
+    Reusing one client keeps its connection pool, so the nodes after the
+    first skip the TCP/TLS handshake with the API. The first construction is
+    locked because parallel graph branches may ask for the client at once.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = OpenAI(
+                    http_client=httpx.Client(
+                        http2=HTTP2_AVAILABLE,
+                        limits=httpx.Limits(max_keepalive_connections=20),
+                    )
+                )
+    return _client
+
+
+__all__ = ["get_client"]
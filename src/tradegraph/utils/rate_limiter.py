@@ -0,0 +1,69 @@
+import asyncio
+import os
+import threading
+import time
+from logging import getLogger
+
+logger = getLogger(__name__)
+
+DEFAULT_TOKENS_PER_MIN = float(os.getenv("TRADEGRAPH_LLM_TPM", "200000"))
+
+
+def estimate_tokens(*texts: str) -> int:
+    # Roughly four characters per token for English text.
+    return max(1, sum(len(text) for text in texts) // 4)
+
+
+class AsyncTokenBucket:
+    """Client-side token bucket that paces concurrent coroutines.
+
+    Callers reserve tokens up front and then sleep until the bucket has
+    refilled, so waiters are served in arrival order. Only a thread lock is
+    held (never across an await), which keeps one bucket usable from any
+    event loop, e.g. from the separate asyncio.run calls of each subgraph.
+    """
+
+    def __init__(self, rate_per_min: float, burst: float | None = None):
+        if rate_per_min <= 0:
+            raise ValueError("rate_per_min must be positive")
+        self.rate_per_sec = rate_per_min / 60.0
+        self.capacity = burst if burst is not None else rate_per_min
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated_at) * self.rate_per_sec,
+            )
+            self._updated_at = now
+            # A single request larger than the bucket would otherwise wait forever.
+            self._tokens -= min(tokens, self.capacity)
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_sec
+
+    async def acquire(self, tokens: float = 1) -> None:
+        delay = self._reserve(tokens)
+        if delay > 0:
+            logger.debug(f"Rate limiter: waiting {delay:.2f}s for {tokens} tokens")
+            await asyncio.sleep(delay)
+
+
+_BUCKETS: dict[str, AsyncTokenBucket] = {}
+_BUCKETS_LOCK = threading.Lock()
+
+
+def get_token_bucket(llm_name: str) -> AsyncTokenBucket:
+    """Return the process-wide bucket shared by all calls to `llm_name`."""
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(llm_name)
+        if bucket is None:
+            bucket = _BUCKETS[llm_name] = AsyncTokenBucket(DEFAULT_TOKENS_PER_MIN)
+        return bucket
+
+
+__all__ = ["AsyncTokenBucket", "estimate_tokens", "get_token_bucket"]
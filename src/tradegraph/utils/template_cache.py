@@ -0,0 +1,14 @@
+from functools import lru_cache
+
+from jinja2 import Environment, Template
+
+_ENV = Environment(autoescape=False, cache_size=400)
+
+
+@lru_cache(maxsize=64)
+def compile_template(source: str) -> Template:
+    """Return the compiled Jinja template for `source`, parsing it only once."""
+    return _ENV.from_string(source)
+
+
+__all__ = ["compile_template"]
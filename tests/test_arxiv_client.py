@@ -0,0 +1,22 @@
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("requests")
+pytest.importorskip("tenacity")
+
+from tradegraph.services.api_client.arxiv_client import base_arxiv_id  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "arxiv_id, expected",
+    [
+        ("1706.03762", "1706.03762"),
+        ("1706.03762v5", "1706.03762"),
+        (" 2401.00001v12 ", "2401.00001"),
+        ("solv-int/9901001", "solv-int/9901001"),
+        ("solv-int/9901001v2", "solv-int/9901001"),
+        ("hep-th/9901001v1", "hep-th/9901001"),
+    ],
+)
+def test_base_arxiv_id(arxiv_id, expected):
+    assert base_arxiv_id(arxiv_id) == expected
@@ -0,0 +1,88 @@
+import pytest
+
+pytest.importorskip("langgraph")
+pytest.importorskip("requests")
+
+from tradegraph.features.retrieve.get_paper_titles_subgraph.nodes import (  # noqa: E402
+    conference_papers,
+)
+from tradegraph.features.retrieve.get_paper_titles_subgraph.nodes.conference_papers import (  # noqa: E402
+    filter_papers_by_queries,
+    is_excluded_title,
+)
+
+PAPERS = [
+    {"name": "Deep Momentum Networks", "eventtype": "Poster"},
+    {"name": "Momentum Strategies with Deep Learning", "eventtype": "Oral"},
+    {"name": "Mean Reversion in Équity Markets", "eventtype": "Poster"},
+    {"name": "", "eventtype": "Poster"},
+    {"eventtype": "Oral"},
+]
+
+
+@pytest.fixture(params=["automaton", "substring"])
+def matcher(request, monkeypatch):
+    # Exercise the scan without pyahocorasick as well as with it (if installed).
+    if request.param == "substring":
+        monkeypatch.setattr(conference_papers, "ahocorasick", None)
+    elif conference_papers.ahocorasick is None:
+        pytest.skip("pyahocorasick is not installed")
+
+
+def _names(papers):
+    return [paper.get("name") for paper in papers]
+
+
+def test_every_query_must_match(matcher):
+    result = filter_papers_by_queries(PAPERS, ["deep", "MOMENTUM"])
+    assert _names(result) == [
+        "Deep Momentum Networks",
+        "Momentum Strategies with Deep Learning",
+    ]
+    assert filter_papers_by_queries(PAPERS, ["deep", "reversion"]) == []
+
+
+def test_single_query_is_case_insensitive(matcher):
+    result = filter_papers_by_queries(PAPERS, ["NETWORKS"])
+    assert _names(result) == ["Deep Momentum Networks"]
+
+
+def test_eventtype_filter(matcher):
+    result = filter_papers_by_queries(PAPERS, ["momentum"], eventtype="Oral")
+    assert _names(result) == ["Momentum Strategies with Deep Learning"]
+
+
+def test_no_active_queries_keeps_every_paper(matcher):
+    assert filter_papers_by_queries(PAPERS, []) == PAPERS
+    assert filter_papers_by_queries(PAPERS, ["", "  "]) == PAPERS
+    assert _names(filter_papers_by_queries(PAPERS, [], eventtype="Oral")) == [
+        "Momentum Strategies with Deep Learning",
+        None,
+    ]
+
+
+def test_duplicate_queries_are_counted_once(matcher):
+    result = filter_papers_by_queries(PAPERS, ["deep", "Deep", "momentum"])
+    assert len(result) == 2
+
+
+def test_non_ascii_names_and_queries(matcher):
+    assert _names(filter_papers_by_queries(PAPERS, ["équity"])) == [
+        "Mean Reversion in Équity Markets"
+    ]
+    assert _names(filter_papers_by_queries(PAPERS, ["mean", "markets"])) == [
+        "Mean Reversion in Équity Markets"
+    ]
+
+
+@pytest.mark.parametrize(
+    "title, excluded",
+    [
+        ("A Survey of Momentum Strategies", True),
+        ("Systematic REVIEW of factor investing", True),
+        ("An overview of market anomalies", True),
+        ("Deep Momentum Networks", False),
+    ],
+)
+def test_is_excluded_title(title, excluded):
+    assert is_excluded_title(title) is excluded
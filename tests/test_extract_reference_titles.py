@@ -0,0 +1,101 @@
+import pytest
+
+pytest.importorskip("langgraph")
+pytest.importorskip("pydantic")
+pytest.importorskip("openai")
+
+from tradegraph.features.retrieve.extract_reference_titles_subgraph.nodes.extract_reference_titles import (  # noqa: E402
+    NearDuplicateTitleIndex,
+    select_unique_references,
+)
+
+
+def _titles(references):
+    return [reference["title"] for reference in references]
+
+
+def test_select_unique_references_drops_near_duplicates_across_batches():
+    index = NearDuplicateTitleIndex()
+    first = select_unique_references(
+        index,
+        [
+            {"title": "Attention Is All You Need"},
+            {
+                "title": "Returns to buying winners and selling losers: "
+                "Implications for stock market efficiency"
+            },
+        ],
+    )
+    second = select_unique_references(
+        index,
+        [
+            {"title": "Attention is All you Need."},
+            {
+                "title": "Returns to buying winners and selling losers: "
+                "Implications for stock market efficency"
+            },
+            {"title": "Momentum strategies"},
+        ],
+    )
+    assert _titles(first) == [
+        "Attention Is All You Need",
+        "Returns to buying winners and selling losers: "
+        "Implications for stock market efficiency",
+    ]
+    assert _titles(second) == ["Momentum strategies"]
+
+
+def test_select_unique_references_keeps_distinct_titles():
+    index = NearDuplicateTitleIndex()
+    references = [
+        {"title": "A five-factor asset pricing model"},
+        {"title": "A three-factor asset pricing model"},
+        {"title": "Momentum strategies in commodity futures"},
+    ]
+    assert select_unique_references(index, references) == references
+
+
+def test_select_unique_references_within_one_batch():
+    index = NearDuplicateTitleIndex()
+    references = [{"title": "Deep Learning"}, {"title": "deep learning"}]
+    assert _titles(select_unique_references(index, references)) == ["Deep Learning"]
+
+
+def test_split_reference_chunks_short_text_is_one_chunk():
+    from tradegraph.features.retrieve.extract_reference_titles_subgraph.nodes.extract_reference_titles import (
+        _split_reference_chunks,
+    )
+
+    assert _split_reference_chunks("Intro text", chunk_chars=100) == ["Intro text"]
+
+
+def test_split_reference_chunks_starts_at_last_reference_heading():
+    from tradegraph.features.retrieve.extract_reference_titles_subgraph.nodes.extract_reference_titles import (
+        _split_reference_chunks,
+    )
+
+    text = (
+        "Body mentioning references in passing.\n"
+        "References\n[1] An early draft\n"
+        "Appendix\n"
+        "REFERENCES\n[1] Attention Is All You Need"
+    )
+    assert _split_reference_chunks(text, chunk_chars=100) == [
+        "\nREFERENCES\n[1] Attention Is All You Need"
+    ]
+
+
+def test_split_reference_chunks_overlapping_windows_cover_the_text():
+    from tradegraph.features.retrieve.extract_reference_titles_subgraph.nodes.extract_reference_titles import (
+        _split_reference_chunks,
+    )
+
+    text = "".join(chr(ord("a") + i % 26) for i in range(250))
+    chunks = _split_reference_chunks(text, chunk_chars=100, overlap_chars=20)
+
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert chunks[0] == text[:100]
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert previous[-20:] == chunk[:20]
+    assert text.endswith(chunks[-1])
+    assert len(chunks) == 3
@@ -0,0 +1,46 @@
+import pytest
+
+pytest.importorskip("langgraph")
+pytest.importorskip("openai")
+
+from tradegraph.features.stock_research.analysis.nodes.generate_insights import (  # noqa: E402
+    parse_insights,
+)
+
+
+def test_parse_insights_bold_headings():
+    text = (
+        "1. **Key Findings** (5-7 most important discoveries):\n"
+        "   - Finding: Momentum persists for three days\n"
+        "2. **Success Factors**\n"
+        "   - Factor: Low turnover\n"
+        "5. **Improvement Opportunities**\n"
+        "   - Improvement: Add a volatility filter\n"
+    )
+    key_insights, improvements = parse_insights(text)
+    assert key_insights == ["- Finding: Momentum persists for three days"]
+    assert improvements == [
+        {"area": "Improvement", "suggestion": "Add a volatility filter", "priority": "medium"}
+    ]
+
+
+@pytest.mark.parametrize(
+    "findings_heading, improvements_heading",
+    [
+        ("### 1. **Key Findings**", "### 5. **Improvement Opportunities**"),
+        ("## Key Findings", "## Improvement Opportunities"),
+        ("## key findings:", "## IMPROVEMENT OPPORTUNITIES"),
+    ],
+)
+def test_parse_insights_markdown_headings(findings_heading, improvements_heading):
+    text = (
+        f"{findings_heading}\n"
+        "- Finding: Drawdowns cluster in March\n"
+        "## Risk Discoveries\n"
+        "- Risk: Gap risk on earnings\n"
+        f"{improvements_heading}\n"
+        "- Improvement: Skip earnings weeks\n"
+    )
+    key_insights, improvements = parse_insights(text)
+    assert key_insights == ["- Finding: Drawdowns cluster in March"]
+    assert [i["suggestion"] for i in improvements] == ["Skip earnings weeks"]
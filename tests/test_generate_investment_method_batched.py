@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+pytest.importorskip("langgraph")
+pytest.importorskip("openai")
+pytest.importorskip("pydantic")
+
+from tradegraph.features.stock_research.create.nodes.generate_investment_method_batched import (  # noqa: E402
+    _parse_batched_response,
+)
+
+VALID = {
+    "investment_idea": "Trade post-earnings drift in small caps",
+    "market_anomaly": {"name": "Post-earnings announcement drift"},
+    "trading_strategy": {"entry": "Buy after positive surprises"},
+    "investment_method": {"holding_period": "60 days"},
+}
+
+
+def test_valid_response_is_returned():
+    assert _parse_batched_response(json.dumps(VALID)) == VALID
+
+
+@pytest.mark.parametrize(
+    "response_text",
+    [
+        "not json",
+        "",
+        json.dumps(["a", "list"]),
+        json.dumps({**VALID, "investment_idea": "   "}),
+        json.dumps({**VALID, "investment_idea": {"idea": "not a string"}}),
+        json.dumps({k: v for k, v in VALID.items() if k != "investment_idea"}),
+        json.dumps({**VALID, "market_anomaly": {}}),
+        json.dumps({**VALID, "trading_strategy": "not a dict"}),
+        json.dumps({k: v for k, v in VALID.items() if k != "investment_method"}),
+    ],
+)
+def test_incomplete_response_is_rejected(response_text):
+    assert _parse_batched_response(response_text) is None
+
+
+def test_none_is_rejected():
+    assert _parse_batched_response(None) is None
@@ -0,0 +1,125 @@
+import io
+
+import pytest
+
+pytest.importorskip("pydantic")
+
+from tradegraph.utils import llm_cache as llm_cache_module  # noqa: E402
+from tradegraph.utils.llm_cache import (  # noqa: E402
+    LLMResponseCache,
+    cached_chat_complete,
+    llm_cache,
+    make_cache_key,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("TRADEGRAPH_LLM_CACHE_PATH", str(tmp_path / "llm_cache.sqlite"))
+    monkeypatch.delenv("TRADEGRAPH_LLM_CACHE", raising=False)
+    monkeypatch.setattr(llm_cache_module, "_default_cache", None)
+
+
+def test_cache_key_separates_parts():
+    assert make_cache_key("ab", "c") != make_cache_key("a", "bc")
+    assert make_cache_key("ab", "c") == make_cache_key("ab", "c")
+
+
+def test_max_age_expires_entries(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "api_cache.sqlite"))
+    cache.set("key", {"title": "Deep Momentum Networks"})
+    assert cache.get("key", max_age=60) == {"title": "Deep Momentum Networks"}
+    assert cache.get("key", max_age=0) is None
+
+
+def _counting_function(results):
+    calls = []
+
+    @llm_cache("prompt template")
+    def extract(text, llm_name, client=None, use_cache=True):
+        calls.append((text, llm_name, client))
+        return results.get(text)
+
+    return extract, calls
+
+
+def test_decorator_caches_and_ignores_client():
+    extract, calls = _counting_function({"paper": ["A title"]})
+    assert extract("paper", "gpt-4o", client=object()) == ["A title"]
+    assert extract("paper", "gpt-4o", client=object()) == ["A title"]
+    assert len(calls) == 1
+
+    assert extract("paper", "o3-mini") == ["A title"]
+    assert len(calls) == 2
+
+
+def test_decorator_does_not_cache_empty_results():
+    extract, calls = _counting_function({"paper": []})
+    assert extract("paper", "gpt-4o") == []
+    assert extract("paper", "gpt-4o") == []
+    assert len(calls) == 2
+
+
+def test_decorator_use_cache_false_bypasses_cache():
+    extract, calls = _counting_function({"paper": ["A title"]})
+    extract("paper", "gpt-4o", use_cache=False)
+    extract("paper", "gpt-4o", use_cache=False)
+    assert len(calls) == 2
+
+    # use_cache is not part of the key: an enabled call still finds nothing
+    # cached, then later enabled calls hit the entry it wrote.
+    extract("paper", "gpt-4o")
+    extract("paper", "gpt-4o", use_cache=True)
+    assert len(calls) == 3
+
+
+def test_decorator_disabled_by_environment(monkeypatch):
+    monkeypatch.setenv("TRADEGRAPH_LLM_CACHE", "0")
+    extract, calls = _counting_function({"paper": ["A title"]})
+    extract("paper", "gpt-4o")
+    extract("paper", "gpt-4o")
+    assert len(calls) == 2
+
+
+def _fake_complete(contents):
+    calls = []
+
+    def complete(client, out, **kwargs):
+        calls.append(kwargs)
+        content = contents[kwargs["messages"][0]["content"]]
+        if out is not None:
+            out.write(content)
+        return content
+
+    return complete, calls
+
+
+def test_cached_chat_complete_keys_on_request_kwargs():
+    complete, calls = _fake_complete({"hi": "hello", "bye": "goodbye"})
+    request = {"model": "gpt-4o", "messages": [{"role": "user", "content": "hi"}]}
+
+    assert cached_chat_complete(None, complete=complete, **request) == "hello"
+    out = io.StringIO()
+    assert cached_chat_complete(None, out=out, complete=complete, **request) == "hello"
+    assert out.getvalue() == "hello"
+    assert len(calls) == 1
+
+    other = {**request, "messages": [{"role": "user", "content": "bye"}]}
+    assert cached_chat_complete(None, complete=complete, **other) == "goodbye"
+    assert cached_chat_complete(
+        None, complete=complete, temperature=0.0, **request
+    ) == "hello"
+    assert len(calls) == 3
+
+
+def test_cached_chat_complete_skips_empty_content_and_opt_out():
+    complete, calls = _fake_complete({"hi": ""})
+    request = {"model": "gpt-4o", "messages": [{"role": "user", "content": "hi"}]}
+    cached_chat_complete(None, complete=complete, **request)
+    cached_chat_complete(None, complete=complete, **request)
+    assert len(calls) == 2
+
+    complete, calls = _fake_complete({"hi": "hello"})
+    cached_chat_complete(None, use_cache=False, complete=complete, **request)
+    cached_chat_complete(None, use_cache=False, complete=complete, **request)
+    assert len(calls) == 2